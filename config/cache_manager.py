@@ -0,0 +1,406 @@
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import threading
+import time
+from config.config_manager import ProjectConfig, ConfigurationError
+
+MISSING = object()
+
+SIZE_UNITS = {'': 1, 'b': 1, 'kb': 1024, 'mb': 1024 ** 2, 'gb': 1024 ** 3}
+
+def parse_size(value: Any) -> int:
+    """Parse a byte size such as 65536, '64MB' or '512 kb'"""
+    if isinstance(value, int):
+        return value
+    text = str(value).strip().lower().replace(' ', '')
+    number = text.rstrip('kmgb')
+    unit = text[len(number):]
+    if unit not in SIZE_UNITS or not number:
+        raise ConfigurationError(f"Invalid cache size: {value}")
+    return int(float(number) * SIZE_UNITS[unit])
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """Approximate memory held by a value, following containers"""
+    _seen = set() if _seen is None else _seen
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in value)
+    elif hasattr(value, '__dict__'):
+        size += estimate_size(vars(value), _seen)
+    return size
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+class MemoryCache:
+    """
+    In-process cache bounded by total estimated bytes and entry count.
+
+    With the 'lru' policy a hit refreshes the entry; with 'ttl' entries keep
+    insertion order, so the oldest (first to expire) is evicted first.
+    Either policy drops entries older than ttl seconds when ttl is set.
+    """
+
+    POLICIES = {'lru', 'ttl'}
+
+    def __init__(self, max_bytes: int = 64 * 1024 ** 2, max_entries: int = 10_000,
+                 policy: str = 'lru', ttl: Optional[float] = None):
+        if policy not in self.POLICIES:
+            raise ConfigurationError(f"Invalid cache policy {policy!r}. Must be one of: {self.POLICIES}")
+        if policy == 'ttl' and not ttl:
+            raise ConfigurationError("The 'ttl' cache policy requires a ttl")
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.policy = policy
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl and time.monotonic() - entry[2] > self.ttl:
+                self._remove(key)
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return default
+            if self.policy == 'lru':
+                self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, size: Optional[int] = None) -> bool:
+        """
+        Store a value.
+
+        Returns:
+            False if the value alone exceeds max_bytes and was not stored
+        """
+        size = estimate_size(value) if size is None else size
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return False
+            self._entries[key] = (value, size, time.monotonic())
+            self.stats.bytes += size
+            self.stats.entries += 1
+            while self.stats.bytes > self.max_bytes or self.stats.entries > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+        return True
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats.entries = self.stats.bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.stats.bytes -= size
+        self.stats.entries -= 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class DiskCache:
+    """
+    Pickle-per-entry cache in a directory, bounded by total file bytes.
+
+    File names are hashes of the key, so keys must be strings that stay
+    stable across processes. Writes go through a temp file and os.replace;
+    eviction removes the least recently written files first.
+    """
+
+    SUFFIX = '.cache'
+
+    def __init__(self, directory: Path, max_bytes: int = 512 * 1024 ** 2, ttl: Optional[float] = None):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._sizes: 'OrderedDict[str, int]' = OrderedDict()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._scan()
+
+    def _scan(self) -> None:
+        """Index existing entries, oldest first"""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(self.SUFFIX) and entry.is_file():
+                    stat_result = entry.stat()
+                    entries.append((stat_result.st_mtime, entry.name, stat_result.st_size))
+        for _, name, size in sorted(entries):
+            self._sizes[name] = size
+        self.stats.entries = len(self._sizes)
+        self.stats.bytes = sum(self._sizes.values())
+
+    def _file_name(self, key: str) -> str:
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest() + self.SUFFIX
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        name = self._file_name(key)
+        path = self.directory / name
+        try:
+            if self.ttl and time.time() - path.stat().st_mtime > self.ttl:
+                with self._lock:
+                    self._unlink(name)
+                    self.stats.expirations += 1
+                    self.stats.misses += 1
+                return default
+            with path.open('rb') as f:
+                stored_key, value = pickle.load(f)
+        except FileNotFoundError:
+            stored_key, value = None, default
+        except (OSError, pickle.PickleError, EOFError, ValueError) as e:
+            self.logger.warning(f"Discarding unreadable cache entry {path}: {str(e)}")
+            with self._lock:
+                self._unlink(name)
+            stored_key, value = None, default
+        with self._lock:
+            if stored_key != key:
+                self.stats.misses += 1
+                return default
+            self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> bool:
+        try:
+            payload = pickle.dumps((key, value), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            self.logger.warning(f"Value for cache key {key!r} cannot be stored on disk: {str(e)}")
+            return False
+        if len(payload) > self.max_bytes:
+            return False
+        name = self._file_name(key)
+        temp_path = self.directory / f"{name}.{threading.get_ident()}.tmp"
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, self.directory / name)
+        with self._lock:
+            if name in self._sizes:
+                self.stats.bytes -= self._sizes.pop(name)
+                self.stats.entries -= 1
+            self._sizes[name] = len(payload)
+            self.stats.bytes += len(payload)
+            self.stats.entries += 1
+            while self.stats.bytes > self.max_bytes:
+                self._unlink(next(iter(self._sizes)))
+                self.stats.evictions += 1
+        return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._unlink(self._file_name(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in list(self._sizes):
+                self._unlink(name)
+
+    def _unlink(self, name: str) -> None:
+        size = self._sizes.pop(name, None)
+        if size is not None:
+            self.stats.bytes -= size
+            self.stats.entries -= 1
+        try:
+            (self.directory / name).unlink()
+        except FileNotFoundError:
+            pass
+
+class TieredCache:
+    """Memory tier in front of an optional disk tier; disk hits are promoted to memory"""
+
+    def __init__(self, name: str, memory: MemoryCache, disk: Optional[DiskCache] = None):
+        self.name = name
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self.memory.get(key)
+        if value is not MISSING:
+            return value
+        if self.disk is not None and isinstance(key, str):
+            value = self.disk.get(key)
+            if value is not MISSING:
+                self.memory.set(key, value)
+                return value
+        return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None and isinstance(key, str):
+            self.disk.set(key, value)
+
+    def delete(self, key: Hashable) -> None:
+        self.memory.delete(key)
+        if self.disk is not None and isinstance(key, str):
+            self.disk.delete(key)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, CacheStats]:
+        tiers = {'memory': self.memory.stats}
+        if self.disk is not None:
+            tiers['disk'] = self.disk.stats
+        return tiers
+
+class CacheManager:
+    """
+    Builds named caches from ProjectConfig.cache.
+
+    Expected configuration, every key optional:
+
+        cache:
+          enabled: true
+          memory: {max_bytes: 64MB, max_entries: 10000, policy: lru, ttl: null}
+          disk: {enabled: false, directory: .cache, max_bytes: 512MB, ttl: null}
+          namespaces:
+            file_analyzer: {memory: {max_bytes: 8MB}}
+
+    Namespace sections are merged over the top-level memory/disk settings,
+    so each environment's YAML can tune sizes per cache.
+    """
+
+    def __init__(self, settings: Optional[Dict[str, Any]] = None, base_dir: Optional[Path] = None):
+        self.settings = settings or {}
+        self.base_dir = Path(base_dir) if base_dir else Path.cwd()
+        self.enabled = str(self.settings.get('enabled', True)).lower() not in ('false', '0', 'no')
+        self.logger = logging.getLogger(__name__)
+        self._caches: Dict[str, TieredCache] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: ProjectConfig, base_dir: Optional[Path] = None) -> 'CacheManager':
+        return cls(config.cache, base_dir)
+
+    def cache(self, namespace: str) -> TieredCache:
+        """Get or create the cache for a namespace"""
+        with self._lock:
+            cache = self._caches.get(namespace)
+            if cache is None:
+                cache = self._caches[namespace] = self._build(namespace)
+            return cache
+
+    def _build(self, namespace: str) -> TieredCache:
+        overrides = self.settings.get('namespaces', {}).get(namespace, {})
+        memory = {**self.settings.get('memory', {}), **overrides.get('memory', {})}
+        disk = {**self.settings.get('disk', {}), **overrides.get('disk', {})}
+        ttl = memory.get('ttl')
+        try:
+            memory_tier = MemoryCache(
+                max_bytes=parse_size(memory.get('max_bytes', '64MB')),
+                max_entries=int(memory.get('max_entries', 10_000)),
+                policy=memory.get('policy', 'lru'),
+                ttl=float(ttl) if ttl else None
+            )
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid memory cache settings for {namespace}: {str(e)}")
+
+        disk_tier = None
+        if str(disk.get('enabled', False)).lower() in ('true', '1', 'yes'):
+            directory = Path(disk.get('directory', '.cache'))
+            disk_ttl = disk.get('ttl')
+            disk_tier = DiskCache(
+                (directory if directory.is_absolute() else self.base_dir / directory) / namespace,
+                max_bytes=parse_size(disk.get('max_bytes', '512MB')),
+                ttl=float(disk_ttl) if disk_ttl else None
+            )
+        return TieredCache(namespace, memory_tier, disk_tier)
+
+    def stats(self) -> Dict[str, Dict[str, CacheStats]]:
+        """Counters for every cache created so far"""
+        with self._lock:
+            return {name: cache.stats() for name, cache in self._caches.items()}
+
+    def log_stats(self) -> None:
+        for name, tiers in self.stats().items():
+            for tier, stats in tiers.items():
+                self.logger.info(
+                    f"Cache {name}/{tier}: {stats.hits} hits, {stats.misses} misses "
+                    f"({stats.hit_rate:.1%}), {stats.evictions} evictions, "
+                    f"{stats.entries} entries, {stats.bytes} bytes"
+                )
+
+_manager: Optional[CacheManager] = None
+
+def configure(config: ProjectConfig, base_dir: Optional[Path] = None) -> CacheManager:
+    """Install the process-wide cache manager used by @cached"""
+    global _manager
+    _manager = CacheManager.from_config(config, base_dir)
+    return _manager
+
+def get_cache_manager() -> CacheManager:
+    """The configured cache manager, or one with default settings"""
+    global _manager
+    if _manager is None:
+        _manager = CacheManager()
+    return _manager
+
+def cached(namespace: str, key: Optional[Callable[..., Optional[Hashable]]] = None):
+    """
+    Memoize a function in a named cache.
+
+    Args:
+        namespace: Cache name, used to look up per-namespace settings
+        key: Builds the cache key from the call arguments. Returning None
+            bypasses the cache for that call. Defaults to the repr of the
+            arguments, which suits plain values; pass a key function for
+            methods or for arguments whose content can change (e.g. files).
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            manager = get_cache_manager()
+            cache_key = key(*args, **kwargs) if key else \
+                f"{func.__module__}.{func.__qualname__}:{args!r}:{sorted(kwargs.items())!r}"
+            if not manager.enabled or cache_key is None:
+                return func(*args, **kwargs)
+            cache = manager.cache(namespace)
+            value = cache.get(cache_key, MISSING)
+            if value is MISSING:
+                value = func(*args, **kwargs)
+                cache.set(cache_key, value)
+            return value
+        return wrapper
+    return decorator
@@ -0,0 +1,347 @@
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+import importlib
+import logging
+import os
+import threading
+import time
+from config.config_manager import ProjectConfig, ConfigurationError
+
+def connection_factory(database: Dict[str, Any]) -> Tuple[Callable[[], Any], str]:
+    """
+    Build a DB-API connect function from ProjectConfig.database.
+
+    A 'driver' key selects the backend: 'sqlite' opens the file named by
+    'name' (handy as a local stand-in), anything else uses psycopg2.
+
+    Returns:
+        Tuple of (connect function, DB-API paramstyle)
+
+    Raises:
+        ConfigurationError: If the driver module is not installed
+    """
+    driver = database.get('driver', 'postgresql').lower()
+    module_name = 'sqlite3' if driver == 'sqlite' else 'psycopg2'
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        raise ConfigurationError(f"Database driver {module_name} is not available: {str(e)}")
+
+    if driver == 'sqlite':
+        # Pooled connections are handed from thread to thread, never shared concurrently
+        return (lambda: module.connect(database['name'], check_same_thread=False)), module.paramstyle
+    return (lambda: module.connect(
+        host=database['host'],
+        port=int(database['port']),
+        dbname=database['name'],
+        user=database['user'],
+        password=database.get('password') or os.getenv('DB_PASS', '')
+    )), module.paramstyle
+
+@dataclass
+class PoolStats:
+    size: int = 0
+    idle: int = 0
+    in_use: int = 0
+    peak_in_use: int = 0
+    acquisitions: int = 0
+    timeouts: int = 0
+    created: int = 0
+    closed: int = 0
+    failed_checks: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        return self.wait_time_total / self.acquisitions if self.acquisitions else 0.0
+
+class PooledConnection:
+    """
+    Proxy for a pooled DB-API connection.
+
+    Behaves like the wrapped connection, except close() returns it to the
+    pool, so code written against a plain connect() works unchanged: work
+    left uncommitted at close() is rolled back, and a with-block commits on
+    a clean exit and rolls back on an exception before the connection goes
+    back to the pool.
+    """
+
+    __slots__ = ('_pool', '_connection')
+
+    def __init__(self, pool: 'ConnectionPool', connection: Any):
+        self._pool = pool
+        self._connection = connection
+
+    def __getattr__(self, name: str) -> Any:
+        if self._connection is None:
+            raise PoolError("Connection has been returned to the pool")
+        return getattr(self._connection, name)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._pool.release(connection)
+
+    def __enter__(self) -> 'PooledConnection':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._connection is None:
+            return
+        try:
+            if exc_type is None:
+                self._connection.commit()
+            else:
+                self._connection.rollback()
+        finally:
+            self.close()
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections.
+
+    Idle connections are reused most-recently-used first, so the oldest
+    idle ones age out and are closed by reap() once above min_size. Every
+    checkout runs a health-check query; a failing connection is replaced.
+    Waiting for a free connection is bounded by timeout.
+    """
+
+    def __init__(self, connect: Callable[[], Any], min_size: int = 1, max_size: int = 10,
+                 timeout: float = 30.0, max_idle: float = 300.0, max_lifetime: Optional[float] = None,
+                 health_check: Optional[str] = 'SELECT 1', reap_interval: Optional[float] = 60.0):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+        self.connect_function = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.health_check = health_check
+        self.logger = logging.getLogger(__name__)
+        self.stats = PoolStats()
+        # (connection, created_at, last_used), most recently used on the right
+        self._idle: Deque[Tuple[Any, float, float]] = deque()
+        self._created_at: Dict[int, float] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._stop = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+
+        for _ in range(min_size):
+            connection = self._create()
+            self._idle.append((connection, self._created_at[id(connection)], time.monotonic()))
+        self._update_counts()
+        if reap_interval:
+            self._reaper = threading.Thread(
+                target=self._reap_periodically, args=(reap_interval,), name='connection-pool-reaper', daemon=True
+            )
+            self._reaper.start()
+
+    @classmethod
+    def from_config(cls, config: ProjectConfig, **overrides) -> 'ConnectionPool':
+        """
+        Create a pool from ProjectConfig.database.
+
+        Sizing and timeouts come from an optional 'pool' mapping inside the
+        database section (min_size, max_size, timeout, max_idle,
+        max_lifetime), so each environment can tune them in its YAML.
+        """
+        connect, _ = connection_factory(config.database)
+        settings = dict(config.database.get('pool') or {})
+        settings.update(overrides)
+        try:
+            for name in ('min_size', 'max_size'):
+                if name in settings:
+                    settings[name] = int(settings[name])
+            for name in ('timeout', 'max_idle', 'max_lifetime', 'reap_interval'):
+                if settings.get(name) is not None:
+                    settings[name] = float(settings[name])
+            return cls(connect, **settings)
+        except (TypeError, ValueError) as e:
+            raise ConfigurationError(f"Invalid database pool settings: {str(e)}")
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Check out a healthy raw connection; pair with release().
+
+        Raises:
+            PoolTimeoutError: If no connection frees up within the timeout
+            PoolError: If the pool is closed
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        while True:
+            connection = None
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise PoolError("Connection pool is closed")
+                    if self._idle:
+                        connection = self._idle.pop()[0]
+                        break
+                    if self.stats.size < self.max_size:
+                        # Reserve the slot now, connect outside the lock
+                        self.stats.size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.stats.timeouts += 1
+                        raise PoolTimeoutError(f"No database connection available within {timeout}s")
+                    self._condition.wait(remaining)
+                self.stats.in_use += 1
+
+            try:
+                if connection is None:
+                    connection = self._create(reserved=True)
+                elif not self._is_healthy(connection):
+                    self._discard(connection, counted=True)
+                    with self._condition:
+                        self.stats.in_use -= 1
+                    continue
+            except Exception:
+                with self._condition:
+                    self.stats.in_use -= 1
+                    self.stats.size -= 1
+                    self._condition.notify()
+                raise
+
+            waited = time.monotonic() - start
+            with self._condition:
+                self.stats.acquisitions += 1
+                self.stats.wait_time_total += waited
+                self.stats.wait_time_max = max(self.stats.wait_time_max, waited)
+                self.stats.peak_in_use = max(self.stats.peak_in_use, self.stats.in_use)
+                self._update_counts()
+            return connection
+
+    def release(self, connection: Any) -> None:
+        """Return a connection, rolling back anything left uncommitted"""
+        try:
+            connection.rollback()
+            healthy = True
+        except Exception as e:
+            self.logger.warning(f"Discarding connection that failed to roll back: {str(e)}")
+            healthy = False
+
+        expired = self.max_lifetime is not None and \
+            time.monotonic() - self._created_at.get(id(connection), 0.0) > self.max_lifetime
+        with self._condition:
+            self.stats.in_use -= 1
+            if healthy and not expired and not self._closed:
+                self._idle.append((connection, self._created_at[id(connection)], time.monotonic()))
+                self._update_counts()
+                self._condition.notify()
+                return
+        self._discard(connection, counted=True)
+
+    def connect(self) -> PooledConnection:
+        """Drop-in replacement for a DB-API connect(); close() returns the connection"""
+        return PooledConnection(self, self.acquire())
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """Check out a connection for the duration of a with-block"""
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def reap(self) -> int:
+        """
+        Close connections idle longer than max_idle, keeping min_size open.
+
+        Returns:
+            Number of connections closed
+        """
+        now = time.monotonic()
+        expired = []
+        with self._condition:
+            while self._idle and self.stats.size - len(expired) > self.min_size:
+                connection, created_at, last_used = self._idle[0]
+                too_old = self.max_lifetime is not None and now - created_at > self.max_lifetime
+                if now - last_used <= self.max_idle and not too_old:
+                    break
+                expired.append(self._idle.popleft()[0])
+        for connection in expired:
+            self._discard(connection, counted=True)
+        if expired:
+            self.logger.debug(f"Reaped {len(expired)} idle database connections")
+        return len(expired)
+
+    def close(self) -> None:
+        """Close idle connections now and in-use ones as they are released"""
+        self._stop.set()
+        with self._condition:
+            self._closed = True
+            idle = [entry[0] for entry in self._idle]
+            self._idle.clear()
+            self._condition.notify_all()
+        for connection in idle:
+            self._discard(connection, counted=True)
+
+    def _create(self, reserved: bool = False) -> Any:
+        connection = self.connect_function()
+        with self._condition:
+            if not reserved:
+                self.stats.size += 1
+            self.stats.created += 1
+            self._created_at[id(connection)] = time.monotonic()
+        return connection
+
+    def _discard(self, connection: Any, counted: bool) -> None:
+        try:
+            connection.close()
+        except Exception as e:
+            self.logger.debug(f"Error closing database connection: {str(e)}")
+        with self._condition:
+            self._created_at.pop(id(connection), None)
+            if counted:
+                self.stats.size -= 1
+            self.stats.closed += 1
+            self._update_counts()
+            self._condition.notify()
+
+    def _is_healthy(self, connection: Any) -> bool:
+        if not self.health_check:
+            return True
+        try:
+            cursor = connection.cursor()
+            cursor.execute(self.health_check)
+            cursor.fetchone()
+            cursor.close()
+            return True
+        except Exception as e:
+            with self._condition:
+                self.stats.failed_checks += 1
+            self.logger.warning(f"Database connection failed health check: {str(e)}")
+            return False
+
+    def _update_counts(self) -> None:
+        self.stats.idle = len(self._idle)
+
+    def _reap_periodically(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.reap()
+            except Exception as e:
+                self.logger.error(f"Connection reaper failed: {str(e)}")
+
+    def __enter__(self) -> 'ConnectionPool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class PoolError(Exception):
+    """Custom exception for connection pool errors"""
+    pass
+
+class PoolTimeoutError(PoolError):
+    """Raised when no connection becomes available in time"""
+    pass
@@ -0,0 +1,177 @@
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence
+from dataclasses import dataclass
+import datetime
+import gzip
+import json
+import logging
+import os
+import time
+from config.config_manager import ConfigManager, ProjectConfig
+from database.connection_pool import ConnectionPool, connection_factory
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """How long rows of one table are kept"""
+    table: str
+    timestamp_column: str
+    max_age_days: int
+    key_column: str = 'id'
+    archive: bool = True
+
+@dataclass
+class RetentionResult:
+    table: str
+    cutoff: datetime.datetime
+    rows_matched: int = 0
+    rows_archived: int = 0
+    rows_deleted: int = 0
+    batches: int = 0
+    archive_file: Optional[Path] = None
+
+class RetentionJob:
+    """
+    Deletes, and optionally archives, rows past their retention age.
+
+    Rows are walked in primary-key order with keyset pagination
+    (WHERE id > last_id ... ORDER BY id LIMIT n), so every batch is a short
+    index range scan and a short transaction instead of one large DELETE
+    holding locks on the whole table. Each batch is appended to the archive
+    as its own gzip member and synced to disk before the matching DELETE is
+    committed, so an interrupted run never loses rows.
+    """
+
+    DEFAULT_POLICIES = (
+        RetentionPolicy('audit_log', 'created_at', max_age_days=365),
+        RetentionPolicy('login_attempts', 'attempt_time', max_age_days=90),
+    )
+
+    def __init__(self, connect: Callable[[], Any], paramstyle: str = 'format', schema: str = 'game_data',
+                 policies: Sequence[RetentionPolicy] = DEFAULT_POLICIES, batch_size: int = 1000,
+                 pause: float = 0.5, archive_dir: Optional[Path] = None, dry_run: bool = False):
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.connect = connect
+        self.placeholder = '?' if paramstyle == 'qmark' else '%s'
+        self.schema = schema
+        self.policies = tuple(policies)
+        self.batch_size = batch_size
+        self.pause = pause
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self.dry_run = dry_run
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_config(cls, config: ProjectConfig, pool: Optional[ConnectionPool] = None, **kwargs) -> 'RetentionJob':
+        """Create a job connecting with the settings in ProjectConfig.database, through a pool if given"""
+        connect, paramstyle = connection_factory(config.database)
+        if pool is not None:
+            connect = pool.connect
+        schema = config.database.get('schema', '' if config.database.get('driver') == 'sqlite' else 'game_data')
+        return cls(connect, paramstyle, schema=schema, **kwargs)
+
+    def run(self, now: Optional[datetime.datetime] = None) -> List[RetentionResult]:
+        """Apply every policy in turn"""
+        now = now or datetime.datetime.now()
+        return [self.apply(policy, now) for policy in self.policies]
+
+    def apply(self, policy: RetentionPolicy, now: Optional[datetime.datetime] = None) -> RetentionResult:
+        """
+        Remove rows of one table older than the policy allows.
+
+        Args:
+            policy: Table and age to enforce
+            now: Reference time, defaults to the current time
+
+        Returns:
+            Counts of archived and deleted rows
+        """
+        cutoff = (now or datetime.datetime.now()) - datetime.timedelta(days=policy.max_age_days)
+        result = RetentionResult(policy.table, cutoff)
+        if policy.archive and self.archive_dir and not self.dry_run:
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            result.archive_file = self.archive_dir / f"{policy.table}-{cutoff:%Y%m%d}.jsonl.gz"
+
+        table = f"{self.schema}.{policy.table}" if self.schema else policy.table
+        p = self.placeholder
+        select_sql = (
+            f"SELECT * FROM {table} WHERE {policy.key_column} > {p} AND {policy.timestamp_column} < {p} "
+            f"ORDER BY {policy.key_column} LIMIT {self.batch_size}"
+        )
+        connection = self.connect()
+        try:
+            last_key = self._start_key(connection, table, policy)
+            while True:
+                cursor = connection.cursor()
+                cursor.execute(select_sql, (last_key, self._parameter(cutoff)))
+                columns = [description[0] for description in cursor.description]
+                rows = cursor.fetchall()
+                if not rows:
+                    connection.rollback()
+                    break
+                key_index = columns.index(policy.key_column)
+                keys = [row[key_index] for row in rows]
+                last_key = keys[-1]
+                result.rows_matched += len(rows)
+
+                if result.archive_file:
+                    self._archive(result.archive_file, columns, rows)
+                    result.rows_archived += len(rows)
+                if self.dry_run:
+                    connection.rollback()
+                else:
+                    cursor.execute(
+                        f"DELETE FROM {table} WHERE {policy.key_column} IN ({', '.join([p] * len(keys))})", keys
+                    )
+                    connection.commit()
+                    result.rows_deleted += len(keys)
+                result.batches += 1
+                cursor.close()
+                if len(rows) < self.batch_size:
+                    break
+                time.sleep(self.pause)
+        except Exception as e:
+            connection.rollback()
+            self.logger.error(f"Retention for {table} stopped after {result.batches} batches: {str(e)}")
+            raise
+        finally:
+            connection.close()
+
+        self.logger.info(
+            f"Retention for {table}: {result.rows_deleted} rows deleted, {result.rows_archived} archived "
+            f"in {result.batches} batches (cutoff {cutoff.isoformat()})"
+        )
+        return result
+
+    def _start_key(self, connection, table: str, policy: RetentionPolicy) -> Any:
+        """Lowest key minus one, so the first batch needs no special case"""
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT MIN({policy.key_column}) FROM {table}")
+        minimum = cursor.fetchone()[0]
+        cursor.close()
+        return (minimum or 0) - 1
+
+    def _parameter(self, value: datetime.datetime) -> Any:
+        # sqlite3 has no native timestamp type; its rows store ISO strings
+        return value.isoformat(sep=' ') if self.placeholder == '?' else value
+
+    @staticmethod
+    def _archive(archive_file: Path, columns: List[str], rows: List[Sequence[Any]]) -> None:
+        """Append rows as one gzip member of JSON lines and sync it to disk"""
+        payload = ''.join(
+            json.dumps(dict(zip(columns, row)), default=str, separators=(',', ':')) + '\n' for row in rows
+        ).encode('utf-8')
+        with open(archive_file, 'ab') as f:
+            f.write(gzip.compress(payload))
+            f.flush()
+            os.fsync(f.fileno())
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    project_root = Path(__file__).resolve().parents[1]
+    job = RetentionJob.from_config(
+        ConfigManager(project_root / 'config').config,
+        archive_dir=project_root / 'database' / 'archive'
+    )
+    for outcome in job.run():
+        print(f"{outcome.table}: {outcome.rows_deleted} deleted, {outcome.rows_archived} archived")
@@ -2,15 +2,13 @@
 import os
 import datetime
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
 from dataclasses import dataclass
-import re  # For safe file name validation
 
 # Third-party imports
 from bs4 import BeautifulSoup
 from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4, letter
 from reportlab.lib.styles import (
     getSampleStyleSheet,
     ParagraphStyle
@@ -21,17 +19,16 @@ from reportlab.lib.enums import (
     TA_CENTER,
     TA_RIGHT
 )
-from reportlab.platypus import (
-    SimpleDocTemplate, 
-    Paragraph,         
-    Spacer,           
-    PageTemplate,     
-    Frame,            
-    PageBreak,        
-    Image            
+
+# Local imports
+from generators.schema_analyzer import SchemaCatalog, IndexAdvisor
+from generators.document_model import (
+    Document, Block, Heading, Text, BulletList, CodeBlock, ImageBlock, Tree, Spacer as SpacerBlock
 )
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from generators.renderers import create_styles, render_all
+from generators.hashing import HashingService
+from generators.snapshots import SnapshotStore
+from version_manager import VersionManager
 
 # Type aliases
 StyleConfig = Tuple[str, ParagraphStyle, Dict[str, any]]
@@ -98,6 +95,11 @@ class StyleGenerator(BaseGenerator):
 class DocumentationGenerator:
     """Generates comprehensive documentation for the Warcraft3 website project."""
     
+    OUTPUT_NAME = 'technical_documentation'
+    # Limits that keep the structure listing bounded on large trees
+    STRUCTURE_MAX_DEPTH = 4
+    STRUCTURE_MAX_ENTRIES = 200
+    
     def __init__(self, project_root: str, config: Optional[DocumentConfig] = None):
         """Initialize the documentation generator."""
         # Sanitize project root path
@@ -117,8 +119,7 @@ class DocumentationGenerator:
             self.logger.setLevel(logging.INFO)
 
         # Initialize styles
-        self.styles = getSampleStyleSheet()
-        self._create_custom_styles()
+        self.styles = create_styles()
 
     def setup_output_directory(self) -> None:
         """Create output directory if it doesn't exist."""
@@ -127,70 +128,11 @@ class DocumentationGenerator:
     def setup_styles(self) -> None:
         """Initialize document styles."""
         try:
-            self._create_custom_styles()
+            self.styles = create_styles()
         except Exception as e:
             self.logger.error(f"Failed to create custom styles: {e}")
             raise
 
-    def _create_custom_styles(self) -> None:
-        """Create all custom styles for the document"""
-        style_configs = [
-            ('CoverTitle', self.styles['Heading1'], {
-                'fontSize': 32,
-                'spaceAfter': 30,
-                'alignment': TA_CENTER,
-                'textColor': colors.HexColor('#2F89FC')
-            }),
-            ('CoverInfo', self.styles['Normal'], {
-                'fontSize': 12,
-                'spaceAfter': 20,
-                'alignment': TA_CENTER
-            }),
-            ('FileContent', self.styles['Normal'], {
-                'fontSize': 10,
-                'leftIndent': 20
-            }),
-            ('CodeBlock', self.styles['Normal'], {
-                'fontSize': 9,
-                'fontName': 'Courier',
-                'leftIndent': 20,
-                'rightIndent': 20,
-                'spaceAfter': 15,
-                'spaceBefore': 15,
-                'backColor': colors.lightgrey
-            }),
-            ('CustomHeading1', self.styles['Heading1'], {
-                'fontSize': 24,
-                'spaceAfter': 20,
-                'textColor': colors.HexColor('#2F89FC')
-            }),
-            ('CustomHeading2', self.styles['Heading2'], {
-                'fontSize': 18,
-                'spaceAfter': 15,
-                'textColor': colors.HexColor('#2F89FC')
-            }),
-            ('CustomHeading3', self.styles['Heading3'], {
-                'fontSize': 14,
-                'spaceAfter': 10,
-                'textColor': colors.HexColor('#2F89FC')
-            })
-        ]
-        
-        for name, parent, properties in style_configs:
-            try:
-                self.styles.add(ParagraphStyle(name=name, parent=parent, **properties))
-            except KeyError:
-                # If style already exists, update it instead
-                self.styles[name].fontSize = properties.get('fontSize', self.styles[name].fontSize)
-                self.styles[name].spaceAfter = properties.get('spaceAfter', self.styles[name].spaceAfter)
-                self.styles[name].alignment = properties.get('alignment', self.styles[name].alignment)
-                self.styles[name].textColor = properties.get('textColor', self.styles[name].textColor)
-                self.styles[name].leftIndent = properties.get('leftIndent', self.styles[name].leftIndent)
-                self.styles[name].rightIndent = properties.get('rightIndent', self.styles[name].rightIndent)
-                self.styles[name].spaceBefore = properties.get('spaceBefore', self.styles[name].spaceBefore)
-                self.styles[name].backColor = properties.get('backColor', self.styles[name].backColor)
-                self.styles[name].fontName = properties.get('fontName', self.styles[name].fontName)
-
     def analyze_html_file(self, file_path: str) -> dict:
         """
         Analyze HTML file and extract key information.
@@ -242,31 +184,55 @@ class DocumentationGenerator:
         except Exception as e:
             raise ValueError(f"Failed to parse HTML content: {str(e)}")
 
-    def generate_file_structure(self):
-        """Generate a well-organized project file structure"""
+    def generate_file_structure(self, max_depth: Optional[int] = None,
+                                max_entries: Optional[int] = None) -> List[str]:
+        """
+        Generate a well-organized project file structure
+        
+        Args:
+            max_depth: Directory levels listed below each top-level group;
+                deeper directories collapse to a one-line summary
+            max_entries: Entries listed per directory before the rest are
+                summarized; both default to the class limits
+            
+        Returns:
+            Lines of the structure listing
+        """
+        max_depth = self.STRUCTURE_MAX_DEPTH if max_depth is None else max_depth
+        max_entries = self.STRUCTURE_MAX_ENTRIES if max_entries is None else max_entries
         structure = ["Project Structure\n==================\n"]
         
-        def format_directory(path, prefix=""):
-            items = os.listdir(path)
-            dirs = sorted([d for d in items if os.path.isdir(os.path.join(path, d)) and not d.startswith('.')])
-            files = sorted([f for f in items if os.path.isfile(os.path.join(path, f)) and not f.startswith('.')])
+        def format_directory(path: Path, prefix: str, depth: int) -> List[str]:
+            try:
+                with os.scandir(path) as it:
+                    entries = [entry for entry in it if not entry.name.startswith('.')]
+            except OSError as e:
+                self.logger.error(f"Error accessing directory {path}: {str(e)}")
+                return []
+            dirs = sorted(e.name for e in entries if e.is_dir() and e.name not in ('.git', '__pycache__'))
+            files = sorted(e.name for e in entries if e.is_file() and e.name != 'generate_docs.py')
             
             tree = []
-            
-            # Add directories
+            listed = 0
             for d in dirs:
-                if d not in ['.git', '__pycache__']:  # Exclude specific directories
+                if listed == max_entries:
+                    break
+                if depth >= max_depth:
+                    tree.append(f"{prefix}📁 {d}/ ({self._count_files(path / d)} files)")
+                else:
                     tree.append(f"{prefix}📁 {d}/")
-                    subtree = format_directory(os.path.join(path, d), prefix + "    ")
-                    tree.extend(subtree)
-            
-            # Add files
-            for f in files:
-                if f != 'generate_docs.py':  # Exclude the documentation generator itself
-                    tree.append(f"{prefix}📄 {f}")
-            
+                    tree.extend(format_directory(path / d, prefix + "    ", depth + 1))
+                listed += 1
+            for f in files[:max_entries - listed]:
+                tree.append(f"{prefix}📄 {f}")
+            hidden = len(dirs) + len(files) - max_entries
+            if hidden > 0:
+                tree.append(f"{prefix}… {hidden} more entries")
             return tree
 
+        def root_files(suffix: str) -> List[str]:
+            return sorted(f for f in os.listdir(self.project_root) if f.endswith(suffix))
+
         # Main project structure
         structure.extend([
             "Root Directory\n",
@@ -276,251 +242,205 @@ class DocumentationGenerator:
         
         # HTML Files
         structure.append("\n📁 HTML Pages:")
-        html_files = [f for f in os.listdir(self.project_root) if f.endswith('.html')]
-        for html in sorted(html_files):
-            structure.append(f"    📄 {html}")
+        structure.extend(f"    📄 {html}" for html in root_files('.html'))
 
         # Assets Structure
         structure.append("\n📁 Assets:")
         
         # Images
-        if os.path.exists(os.path.join(self.project_root, 'images')):
+        if (self.project_root / 'images').is_dir():
             structure.append("    📁 images/")
-            image_dirs = os.listdir(os.path.join(self.project_root, 'images'))
-            for dir in sorted(image_dirs):
-                if os.path.isdir(os.path.join(self.project_root, 'images', dir)):
-                    structure.append(f"        📁 {dir}/")
-                    images = os.listdir(os.path.join(self.project_root, 'images', dir))
-                    for img in sorted(images):
-                        if os.path.isfile(os.path.join(self.project_root, 'images', dir, img)):
-                            structure.append(f"            📄 {img}")
-                elif os.path.isfile(os.path.join(self.project_root, 'images', dir)):
-                    structure.append(f"        �� {dir}")
+            structure.extend(format_directory(self.project_root / 'images', "        ", 1))
 
         # Styles
         structure.append("\n📁 Styles:")
-        css_files = [f for f in os.listdir(self.project_root) if f.endswith('.css')]
-        for css in sorted(css_files):
-            structure.append(f"    ��� {css}")
+        structure.extend(f"    📄 {css}" for css in root_files('.css'))
 
         # Scripts
         structure.append("\n📁 JavaScript:")
-        if os.path.exists(os.path.join(self.project_root, 'js')):
-            js_files = os.listdir(os.path.join(self.project_root, 'js'))
-            for js in sorted(js_files):
-                structure.append(f"    ��� {js}")
+        if (self.project_root / 'js').is_dir():
+            structure.extend(format_directory(self.project_root / 'js', "    ", 1))
 
         # Sounds
-        if os.path.exists(os.path.join(self.project_root, 'sounds')):
+        if (self.project_root / 'sounds').is_dir():
             structure.append("\n📁 Sound Assets:")
-            sound_files = os.listdir(os.path.join(self.project_root, 'sounds'))
-            for sound in sorted(sound_files):
-                structure.append(f"    ��� {sound}")
+            structure.extend(format_directory(self.project_root / 'sounds', "    ", 1))
 
         # Documentation
         structure.append("\n📁 Documentation:")
-        if os.path.exists(os.path.join(self.project_root, 'documentation')):
-            doc_files = [f for f in os.listdir(os.path.join(self.project_root, 'documentation')) 
-                        if f != 'generate_docs.py']
-            for doc in sorted(doc_files):
-                structure.append(f"    ��� {doc}")
+        if (self.project_root / 'documentation').is_dir():
+            structure.extend(format_directory(self.project_root / 'documentation', "    ", 1))
 
         return structure
 
-    def header_footer(self, canvas, doc):
-        """Add header and footer to each page"""
-        canvas.saveState()
-        
-        # Header
-        canvas.setFont('Helvetica', 9)
-        canvas.drawString(72, 800, "Warcraft III Website - Technical Documentation")
-        canvas.drawRightString(540, 800, f"Version {self.config.version}")
-        canvas.line(72, 797, 540, 797)
-        
-        # Footer
-        canvas.drawString(72, 30, f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d')}")
-        canvas.drawRightString(540, 30, f"Page {doc.page}")
-        canvas.line(72, 45, 540, 45)
-        
-        canvas.restoreState()
-
-    def create_cover_page(self):
-        """Create the cover page elements"""
-        elements = []
+    @staticmethod
+    def _count_files(path: Path) -> int:
+        """Count files below a directory without building a listing"""
+        count = 0
+        for _, dirs, files in os.walk(path):
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
+            count += sum(1 for f in files if not f.startswith('.'))
+        return count
+
+    def create_cover_page(self) -> List[Block]:
+        """Create the cover page blocks"""
+        blocks: List[Block] = []
         
         # Logo
-        elements.append(Image(
-            os.path.join(self.project_root, 'images', 'icons', 'footer-logo.png'),
+        blocks.append(ImageBlock(
+            self.project_root / 'images' / 'icons' / 'footer-logo.png',
             width=200,
             height=100
         ))
-        elements.append(Spacer(1, inch))
+        blocks.append(SpacerBlock(inch))
         
         # Title
-        elements.append(Paragraph(
-            "Technical Documentation",
-            self.styles['CoverTitle']
-        ))
-        elements.append(Paragraph(
-            "Warcraft III Website Project",
-            self.styles['CoverTitle']
-        ))
-        elements.append(Spacer(1, inch))
+        blocks.append(Heading("Technical Documentation", level=0))
+        blocks.append(Heading("Warcraft III Website Project", level=0))
+        blocks.append(SpacerBlock(inch))
         
         # Version information
-        version_info = f"""
-        Version: {self.config.version}
-        Initial Release Date: {self.config.release_date}
-        Document Generated: {datetime.datetime.now().strftime('%Y-%m-%d')}
-        """
-        elements.append(Paragraph(version_info, self.styles['CoverInfo']))
-        elements.append(Spacer(1, inch))
+        blocks.append(Text(
+            f"Version: {self.config.version}\n"
+            f"Initial Release Date: {self.config.release_date}\n"
+            f"Document Generated: {datetime.datetime.now().strftime('%Y-%m-%d')}",
+            role='cover'
+        ))
+        blocks.append(SpacerBlock(inch))
         
         # Contributors
-        contributors = """
-        Contributors:
-        - Andrei Kornev (Lead Developer)
-        - [Other team members...]
-        """
-        elements.append(Paragraph(contributors, self.styles['CoverInfo']))
+        blocks.append(Text(
+            "Contributors:\n"
+            "- Andrei Kornev (Lead Developer)\n"
+            "- [Other team members...]",
+            role='cover'
+        ))
         
         # Change Log
-        changelog = """
-        Change Log:
-        
-        Version 1.0.0 (2024-01-15)
-        - Initial release
-        - Implemented core website structure
-        - Added responsive design
-        - Integrated voice recognition feature
-        - Completed WarcraftPedia section
-        
-        Version 0.9.0 (2023-12-20)
-        - Beta release
-        - Added character profiles
-        - Implemented story navigation
-        - Enhanced UI/UX design
-        
-        Version 0.5.0 (2023-11-15)
-        - Alpha release
-        - Basic website structure
-        - Initial content implementation
+        blocks.append(Heading("Change Log", level=3))
+        blocks.append(BulletList([
+            "Initial release",
+            "Implemented core website structure",
+            "Added responsive design",
+            "Integrated voice recognition feature",
+            "Completed WarcraftPedia section"
+        ], intro="Version 1.0.0 (2024-01-15)"))
+        blocks.append(BulletList([
+            "Beta release",
+            "Added character profiles",
+            "Implemented story navigation",
+            "Enhanced UI/UX design"
+        ], intro="Version 0.9.0 (2023-12-20)"))
+        blocks.append(BulletList([
+            "Alpha release",
+            "Basic website structure",
+            "Initial content implementation"
+        ], intro="Version 0.5.0 (2023-11-15)"))
+        
+        return blocks
+
+    def build_document(self) -> Document:
+        """Run the analysis once and collect the content of every section"""
+        document = Document(
+            title=self.config.project_name,
+            version=self.config.version,
+            generated=datetime.datetime.now().strftime('%Y-%m-%d'),
+            cover=self.create_cover_page()
+        )
+        sections = [
+            ('Project Overview', self.create_project_overview),
+            ('System Architecture', self.create_system_architecture),
+            ('User Interface Design', self.create_ui_design),
+            ('Technical Implementation', self.create_technical_implementation),
+            ('Security Considerations', self.create_security_section),
+            ('Testing and Quality Assurance', self.create_testing_section),
+            ('Deployment Guide', self.create_deployment_guide),
+            ('Maintenance Procedures', self.create_maintenance_procedures),
+            ('Database Schema', self.create_database_schema)
+        ]
+        for title, create in sections:
+            document.section(title).add(*create())
+        return document
+
+    def publish(self, formats: Sequence[str] = ('pdf', 'html', 'md')) -> Dict[str, Path]:
         """
-        elements.append(Paragraph(changelog, self.styles['Normal']))
+        Build the document once and render it to several formats concurrently
         
-        return elements
+        Args:
+            formats: Output formats, any of 'pdf', 'html' and 'md'
+            
+        Returns:
+            Mapping of format to generated file
+        """
+        try:
+            self.setup_output_directory()
+            outputs = render_all(self.build_document(), self.config.output_path, self.OUTPUT_NAME, formats)
+            for path in outputs.values():
+                self.logger.info(f"Documentation generated successfully at: {path}")
+        except Exception as e:
+            self.logger.error(f"Error publishing documentation: {str(e)}")
+            raise
+        self.record_snapshot()
+        return outputs
 
-    def create_pdf(self):
-        """Generate the PDF documentation"""
+    def record_snapshot(self) -> Optional[Path]:
+        """
+        Keep a snapshot of the documented tree for release-to-release diffs.
+
+        Without a release history in documentation/versions.yaml the snapshot
+        is named after the configured version plus a timestamp, so repeated
+        runs of the same version do not overwrite each other. A failure is
+        logged and does not fail the publish.
+
+        Returns:
+            The snapshot file, or None if it could not be recorded
+        """
         try:
-            # Ensure proper PDF filename with extension
-            filename = 'technical_documentation.pdf'
-            if not filename.endswith('.pdf'):
-                filename += '.pdf'
-            
-            # Create full path
-            doc_path = self.config.output_path / filename
-            
-            # Validate output directory
-            if not self.config.output_path.exists():
-                self.config.output_path.mkdir(parents=True, exist_ok=True)
-            
-            # Remove existing file if it exists
-            if doc_path.exists():
-                doc_path.unlink()
-            
-            # Create document with templates
-            doc = SimpleDocTemplate(
-                str(doc_path),
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
+            versions = self._version_manager()
+            if versions:
+                version = versions.current_version.version
+            else:
+                version = f"{self.config.version}+{datetime.datetime.now():%Y%m%d%H%M%S}"
+            store = SnapshotStore(
+                self.project_root, hashing=HashingService(self.project_root / '.hash-cache.json'), versions=versions
             )
-            
-            # Create page templates
-            frame = Frame(
-                doc.leftMargin,
-                doc.bottomMargin,
-                doc.width,
-                doc.height,
-                id='normal'
-            )
-            
-            template = PageTemplate(
-                id='standard',
-                frames=frame,
-                onPage=self.header_footer
-            )
-            
-            doc.addPageTemplates([template])
-            
-            # Start building the document
-            story = []
-            
-            # Add cover page
-            story.extend(self.create_cover_page())
-            story.append(PageBreak())
-            
-            # Add table of contents
-            story.append(Paragraph('Table of Contents', self.styles['CustomHeading1']))
-            toc = [
-                '1. Project Overview',
-                '2. System Architecture',
-                '3. User Interface Design',
-                '4. Technical Implementation',
-                '5. Security Considerations',
-                '6. Testing and Quality Assurance',
-                '7. Deployment Guide',
-                '8. Maintenance Procedures'
-            ]
-            for item in toc:
-                story.append(Paragraph(item, self.styles['Normal']))
-            story.append(Spacer(1, 0.5*inch))
-
-            # Add main content sections with proper formatting
-            sections = {
-                '1. Project Overview': self.create_project_overview(),
-                '2. System Architecture': self.create_system_architecture(),
-                '3. User Interface Design': self.create_ui_design(),
-                '4. Technical Implementation': self.create_technical_implementation(),
-                '5. Security Considerations': self.create_security_section(),
-                '6. Testing and Quality Assurance': self.create_testing_section(),
-                '7. Deployment Guide': self.create_deployment_guide(),
-                '8. Maintenance Procedures': self.create_maintenance_procedures()
-            }
-            
-            for title, content in sections.items():
-                story.append(Paragraph(title, self.styles['CustomHeading1']))
-                story.extend(content)
-                story.append(PageBreak())
-            
-            # Build the PDF
-            doc.build(story)
-            self.logger.info(f"Documentation generated successfully at: {doc_path}")
-            
+            return store.record(version)
         except Exception as e:
-            self.logger.error(f"Error creating PDF: {str(e)}")
-            raise
+            self.logger.warning(f"Could not record documentation snapshot: {str(e)}")
+            return None
+
+    def _version_manager(self) -> Optional[VersionManager]:
+        """Release history from documentation/versions.yaml, if it records any versions"""
+        version_file = self.project_root / 'documentation' / 'versions.yaml'
+        if not version_file.exists():
+            return None
+        versions = VersionManager(version_file)
+        try:
+            versions.current_version
+        except ValueError:
+            return None
+        return versions
 
-    def create_project_overview(self):
+    def create_pdf(self):
+        """Generate the PDF documentation"""
+        return self.publish(('pdf',))['pdf']
+
+    def create_project_overview(self) -> List[Block]:
         """Create project overview section"""
-        elements = []
+        blocks: List[Block] = []
         
         # Project Description
-        elements.append(Paragraph("Project Description", self.styles['CustomHeading2']))
-        overview_text = """
+        blocks.append(Heading("Project Description"))
+        blocks.append(Text("""
         The Warcraft III Website is a comprehensive fan-made platform dedicated to the iconic game 
         Warcraft III. This project serves as an interactive resource for both new players and veterans, 
         offering detailed information about the game's story, characters, factions, and gameplay mechanics.
-        """
-        elements.append(Paragraph(overview_text, self.styles['Normal']))
-        elements.append(Spacer(1, 0.2*inch))
+        """))
+        blocks.append(SpacerBlock(0.2*inch))
 
         # Key Features
-        elements.append(Paragraph("Key Features", self.styles['CustomHeading2']))
-        features = [
+        blocks.append(Heading("Key Features"))
+        blocks.append(BulletList([
             "Responsive design supporting multiple device types and screen sizes",
             "Interactive story navigation system",
             "Comprehensive WarcraftPedia with detailed game information",
@@ -528,56 +448,48 @@ class DocumentationGenerator:
             "Modern UI/UX with Bootstrap 5 integration",
             "Custom CSS styling for enhanced visual appeal",
             "Voice recognition features for accessibility"
-        ]
-        for feature in features:
-            elements.append(Paragraph(f"• {feature}", self.styles['Normal']))
-        elements.append(Spacer(1, 0.2*inch))
+        ]))
+        blocks.append(SpacerBlock(0.2*inch))
 
-        return elements
+        return blocks
 
-    def create_system_architecture(self):
+    def create_system_architecture(self) -> List[Block]:
         """Create system architecture section"""
-        elements = []
+        blocks: List[Block] = []
         
         # Frontend Architecture
-        elements.append(Paragraph("Frontend Architecture", self.styles['CustomHeading2']))
-        frontend_text = """
-        The website utilizes a modern frontend stack:
-        • HTML5 for structure and semantics
-        • CSS3 with custom styling and Bootstrap 5 framework
-        • JavaScript for interactive features and dynamic content
-        • Responsive design principles for multi-device support
-        """
-        elements.append(Paragraph(frontend_text, self.styles['Normal']))
-        elements.append(Spacer(1, 0.2*inch))
+        blocks.append(Heading("Frontend Architecture"))
+        blocks.append(BulletList([
+            "HTML5 for structure and semantics",
+            "CSS3 with custom styling and Bootstrap 5 framework",
+            "JavaScript for interactive features and dynamic content",
+            "Responsive design principles for multi-device support"
+        ], intro="The website utilizes a modern frontend stack:"))
+        blocks.append(SpacerBlock(0.2*inch))
 
         # File Structure
-        elements.append(Paragraph("Project Structure", self.styles['CustomHeading2']))
-        structure = self.generate_file_structure()
-        for line in structure:
-            elements.append(Paragraph(line, self.styles['FileContent']))
+        blocks.append(Heading("Project Structure"))
+        blocks.append(Tree(self.generate_file_structure()))
         
-        return elements
+        return blocks
 
-    def create_ui_design(self):
+    def create_ui_design(self) -> List[Block]:
         """Create user interface design section with visual examples"""
-        elements = []
+        blocks: List[Block] = []
         
         # Design Philosophy
-        elements.append(Paragraph("Design Philosophy", self.styles['CustomHeading2']))
-        design_text = """
-        The user interface follows a game-themed design language while maintaining modern web standards:
-        • Dark theme with accent colors matching Warcraft III's aesthetic
-        • Responsive grid layout using Bootstrap's container system
-        • Interactive elements with hover effects and animations
-        • Consistent typography using Google Fonts
-        """
-        elements.append(Paragraph(design_text, self.styles['Normal']))
-        elements.append(Spacer(1, 0.2*inch))
+        blocks.append(Heading("Design Philosophy"))
+        blocks.append(BulletList([
+            "Dark theme with accent colors matching Warcraft III's aesthetic",
+            "Responsive grid layout using Bootstrap's container system",
+            "Interactive elements with hover effects and animations",
+            "Consistent typography using Google Fonts"
+        ], intro="The user interface follows a game-themed design language while maintaining modern web standards:"))
+        blocks.append(SpacerBlock(0.2*inch))
 
         # Add Color Palette
-        elements.append(Paragraph("Color Palette", self.styles['CustomHeading3']))
-        color_vars = """
+        blocks.append(Heading("Color Palette", level=3))
+        blocks.append(CodeBlock("""
         :root {
             --wc-primary: #2f89fc;
             --wc-dark: #121212;
@@ -585,61 +497,56 @@ class DocumentationGenerator:
             --wc-gray: #f8f9fa;
             --wc-border: rgba(255, 255, 255, 0.1);
         }
-        """
-        elements.append(Paragraph(color_vars, self.styles['CodeBlock']))
+        """, language='css'))
         
         # Add UI Components Screenshot
-        ui_components_path = os.path.join(self.project_root, 'documentation', 'screenshots', 'ui_components.png')
-        if os.path.exists(ui_components_path):
-            elements.append(Paragraph("UI Components Overview:", self.styles['CustomHeading3']))
-            elements.append(Image(ui_components_path, width=400, height=300))
+        ui_components_path = self.project_root / 'documentation' / 'screenshots' / 'ui_components.png'
+        if ui_components_path.exists():
+            blocks.append(Heading("UI Components Overview:", level=3))
+            blocks.append(ImageBlock(ui_components_path, width=400, height=300))
         
-        return elements
+        return blocks
 
-    def create_technical_implementation(self):
+    def create_technical_implementation(self) -> List[Block]:
         """Create technical implementation section with code examples and screenshots"""
-        elements = []
+        blocks: List[Block] = []
         
         # Technologies Used
-        elements.append(Paragraph("Technologies Used", self.styles['CustomHeading2']))
-        tech_stack = """
-        The website is built using the following technologies:
-        • HTML5 for structure
-        • CSS3 and Bootstrap 5 for styling
-        • JavaScript for interactivity
-        • Font Awesome for icons
-        • Google Fonts for typography
-        • Custom CSS variables for theming
-        """
-        elements.append(Paragraph(tech_stack, self.styles['Normal']))
-        elements.append(Spacer(1, 0.2*inch))
+        blocks.append(Heading("Technologies Used"))
+        blocks.append(BulletList([
+            "HTML5 for structure",
+            "CSS3 and Bootstrap 5 for styling",
+            "JavaScript for interactivity",
+            "Font Awesome for icons",
+            "Google Fonts for typography",
+            "Custom CSS variables for theming"
+        ], intro="The website is built using the following technologies:"))
+        blocks.append(SpacerBlock(0.2*inch))
 
         # Add Navigation Code Example
-        elements.append(Paragraph("Navigation Implementation", self.styles['CustomHeading3']))
-        # Use escaped HTML or preformatted text
-        nav_code = """
-        &lt;!-- Navigation implementation --&gt;
-        &lt;nav class="navbar navbar-expand-lg navbar-dark fixed-top" id="mainNav"&gt;
-            &lt;div class="container"&gt;
-                &lt;a class="navbar-brand" href="index.html"&gt;
-                    &lt;img src="images/logo.png" alt="Warcraft III Logo" height="40"&gt;
+        blocks.append(Heading("Navigation Implementation", level=3))
+        blocks.append(CodeBlock("""
+        <!-- Navigation implementation -->
+        <nav class="navbar navbar-expand-lg navbar-dark fixed-top" id="mainNav">
+            <div class="container">
+                <a class="navbar-brand" href="index.html">
+                    <img src="images/logo.png" alt="Warcraft III Logo" height="40">
                     Warcraft III
-                &lt;/a&gt;
-                &lt;!-- Navigation items --&gt;
-            &lt;/div&gt;
-        &lt;/nav&gt;
-        """
-        elements.append(Paragraph(nav_code, self.styles['CodeBlock']))
+                </a>
+                <!-- Navigation items -->
+            </div>
+        </nav>
+        """, language='html'))
         
         # Add screenshot of the navigation
-        nav_image_path = os.path.join(self.project_root, 'documentation', 'screenshots', 'navigation.png')
-        if os.path.exists(nav_image_path):
-            elements.append(Image(nav_image_path, width=400, height=100))
-        elements.append(Spacer(1, 0.2*inch))
+        nav_image_path = self.project_root / 'documentation' / 'screenshots' / 'navigation.png'
+        if nav_image_path.exists():
+            blocks.append(ImageBlock(nav_image_path, width=400, height=100))
+        blocks.append(SpacerBlock(0.2*inch))
 
         # Add Responsive Design Example
-        elements.append(Paragraph("Responsive Design Implementation", self.styles['CustomHeading3']))
-        responsive_code = """
+        blocks.append(Heading("Responsive Design Implementation", level=3))
+        blocks.append(CodeBlock("""
         /* Responsive design CSS */
         @media (max-width: 768px) {
             .hero-section {
@@ -649,90 +556,105 @@ class DocumentationGenerator:
                 grid-template-columns: 1fr;
             }
         }
-        """
-        elements.append(Paragraph(responsive_code, self.styles['CodeBlock']))
+        """, language='css'))
         
         # Add responsive design screenshots
-        responsive_desktop = os.path.join(self.project_root, 'documentation', 'screenshots', 'desktop_view.png')
-        responsive_mobile = os.path.join(self.project_root, 'documentation', 'screenshots', 'mobile_view.png')
-        if os.path.exists(responsive_desktop) and os.path.exists(responsive_mobile):
-            elements.append(Paragraph("Desktop vs Mobile View:", self.styles['CustomHeading4']))
-            elements.append(Image(responsive_desktop, width=300, height=200))
-            elements.append(Image(responsive_mobile, width=150, height=200))
+        responsive_desktop = self.project_root / 'documentation' / 'screenshots' / 'desktop_view.png'
+        responsive_mobile = self.project_root / 'documentation' / 'screenshots' / 'mobile_view.png'
+        if responsive_desktop.exists() and responsive_mobile.exists():
+            blocks.append(Heading("Desktop vs Mobile View:", level=4))
+            blocks.append(ImageBlock(responsive_desktop, width=300, height=200))
+            blocks.append(ImageBlock(responsive_mobile, width=150, height=200))
         
-        return elements
+        return blocks
 
-    def create_security_section(self):
+    def create_security_section(self) -> List[Block]:
         """Create security considerations section"""
-        elements = []
-        
-        # Security Measures
-        elements.append(Paragraph("Security Measures", self.styles['CustomHeading2']))
-        security_text = """
-        The website implements several security best practices:
-        • Content Security Policy (CSP) headers
-        • HTTPS-only content delivery
-        • Sanitized user inputs
-        • Protected API endpoints
-        • Regular security updates for dependencies
-        """
-        elements.append(Paragraph(security_text, self.styles['Normal']))
-        
-        return elements
+        return [
+            Heading("Security Measures"),
+            BulletList([
+                "Content Security Policy (CSP) headers",
+                "HTTPS-only content delivery",
+                "Sanitized user inputs",
+                "Protected API endpoints",
+                "Regular security updates for dependencies"
+            ], intro="The website implements several security best practices:")
+        ]
 
-    def create_testing_section(self):
+    def create_testing_section(self) -> List[Block]:
         """Create testing and quality assurance section"""
-        elements = []
-        
-        # Testing Strategy
-        elements.append(Paragraph("Testing Strategy", self.styles['CustomHeading2']))
-        testing_text = """
-        Quality assurance is maintained through:
-        • Cross-browser testing (Chrome, Firefox, Safari, Edge)
-        • Mobile responsiveness testing
-        • Performance optimization
-        • Accessibility compliance checks
-        • User experience testing
-        """
-        elements.append(Paragraph(testing_text, self.styles['Normal']))
-        
-        return elements
+        return [
+            Heading("Testing Strategy"),
+            BulletList([
+                "Cross-browser testing (Chrome, Firefox, Safari, Edge)",
+                "Mobile responsiveness testing",
+                "Performance optimization",
+                "Accessibility compliance checks",
+                "User experience testing"
+            ], intro="Quality assurance is maintained through:")
+        ]
 
-    def create_deployment_guide(self):
+    def create_deployment_guide(self) -> List[Block]:
         """Create deployment guide section"""
-        elements = []
-        
-        # Deployment Process
-        elements.append(Paragraph("Deployment Process", self.styles['CustomHeading2']))
-        deployment_text = """
-        The website deployment process includes:
-        • Version control with Git
-        • Automated builds and testing
-        • Asset optimization (image compression, CSS/JS minification)
-        • CDN integration for static assets
-        • Regular backups and monitoring
-        """
-        elements.append(Paragraph(deployment_text, self.styles['Normal']))
-        
-        return elements
+        return [
+            Heading("Deployment Process"),
+            BulletList([
+                "Version control with Git",
+                "Automated builds and testing",
+                "Asset optimization (image compression, CSS/JS minification)",
+                "CDN integration for static assets",
+                "Regular backups and monitoring"
+            ], intro="The website deployment process includes:")
+        ]
 
-    def create_maintenance_procedures(self):
+    def create_maintenance_procedures(self) -> List[Block]:
         """Create maintenance procedures section"""
-        elements = []
-        
-        # Maintenance Guidelines
-        elements.append(Paragraph("Maintenance Guidelines", self.styles['CustomHeading2']))
-        maintenance_text = """
-        Regular maintenance procedures include:
-        • Weekly content updates
-        • Monthly security patches
-        • Performance monitoring and optimization
-        • User feedback collection and implementation
-        • Regular backups and system health checks
-        """
-        elements.append(Paragraph(maintenance_text, self.styles['Normal']))
-        
-        return elements
+        return [
+            Heading("Maintenance Guidelines"),
+            BulletList([
+                "Weekly content updates",
+                "Monthly security patches",
+                "Performance monitoring and optimization",
+                "User feedback collection and implementation",
+                "Regular backups and system health checks"
+            ], intro="Regular maintenance procedures include:")
+        ]
+
+    def create_database_schema(self) -> List[Block]:
+        """Create database schema section with index recommendations"""
+        blocks: List[Block] = []
+        schema_file = self.project_root / 'database' / 'warcraft3_db.sql'
+        if not schema_file.exists():
+            blocks.append(Text("No database schema found."))
+            return blocks
+
+        catalog = SchemaCatalog.from_file(schema_file)
+        findings = IndexAdvisor(catalog).analyze()
+
+        # Tables
+        blocks.append(Heading("Tables"))
+        for table in catalog.tables.values():
+            blocks.append(Heading(table.name, level=3))
+            details = [f"Columns: {', '.join(table.columns)}"]
+            details.extend(
+                f"Foreign key ({', '.join(fk.columns)}) references {fk.references}" for fk in table.foreign_keys
+            )
+            details.extend(
+                f"{'Constraint' if index.constraint else 'Index'} {index.name} ({', '.join(index.columns)})"
+                for index in table.indexes
+            )
+            blocks.append(BulletList(details))
+
+        # Index Advisor
+        blocks.append(Heading("Index Recommendations"))
+        if not findings:
+            blocks.append(Text("No index issues found."))
+        for finding in findings:
+            blocks.append(BulletList([f"[{finding.rule}] {finding.message}"]))
+            if finding.suggestion:
+                blocks.append(CodeBlock(finding.suggestion, language='sql'))
+
+        return blocks
 
     def setup_screenshots_folder(self):
         """Create screenshots folder and ensure it exists"""
@@ -754,4 +676,4 @@ if __name__ == '__main__':
     
     # Generate documentation
     generator = DocumentationGenerator(project_root)
-    generator.create_pdf()
+    generator.publish()
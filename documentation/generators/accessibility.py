@@ -0,0 +1,241 @@
+from typing import Dict, List, Set, Tuple, Type
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from bs4 import BeautifulSoup, Tag
+import re
+
+@dataclass
+class Finding:
+    """A single accessibility problem found in a document"""
+    rule: str
+    message: str
+    element: str = ''
+
+@dataclass
+class AccessibilityReport:
+    """Score and per-rule findings for one document"""
+    score: int
+    checks: Dict[str, int] = field(default_factory=dict)
+    findings: Dict[str, List[Finding]] = field(default_factory=dict)
+
+def describe(tag: Tag) -> str:
+    """Short, sanitized description of an element for findings"""
+    attrs = ' '.join(f'{k}={v}' for k, v in tag.attrs.items() if k in ('id', 'src', 'href', 'name', 'type'))
+    text = f"{tag.name} {attrs}".strip()
+    return re.sub(r'[<>&"\']', '', text)[:120]
+
+class Rule(ABC):
+    """
+    Base class for accessibility rules.
+
+    A rule lists the tags it wants to see; the engine calls visit() for each
+    matching element during its single document walk and finish() once at the
+    end. Rules count every evaluated check and record a Finding per failure.
+    """
+    rule_id = ''
+    tags: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self.checks = 0
+        self.findings: List[Finding] = []
+
+    @abstractmethod
+    def visit(self, tag: Tag) -> None:
+        """Evaluate one element with a name listed in tags"""
+
+    def finish(self) -> None:
+        pass
+
+    def fail(self, message: str, tag: Tag = None) -> None:
+        self.findings.append(Finding(self.rule_id, message, describe(tag) if tag is not None else ''))
+
+class ImageAltRule(Rule):
+    """Images need an alt attribute (empty alt marks them decorative)"""
+    rule_id = 'img-alt'
+    tags = ('img',)
+
+    def visit(self, tag: Tag) -> None:
+        self.checks += 1
+        if tag.get('alt') is None and tag.get('role') != 'presentation':
+            self.fail("Image is missing alt text", tag)
+
+class HeadingOrderRule(Rule):
+    """Heading levels should not skip, e.g. h2 followed by h4"""
+    rule_id = 'heading-order'
+    tags = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+    def __init__(self):
+        super().__init__()
+        self.previous = 0
+
+    def visit(self, tag: Tag) -> None:
+        level = int(tag.name[1])
+        self.checks += 1
+        if self.previous and level > self.previous + 1:
+            self.fail(f"Heading level jumps from h{self.previous} to h{level}", tag)
+        self.previous = level
+
+class LandmarkRule(Rule):
+    """Documents need a main landmark and a navigation landmark"""
+    rule_id = 'landmarks'
+    tags = ('main', 'nav', 'header', 'footer', 'aside', 'section', 'div')
+    REQUIRED = ('main', 'navigation')
+    IMPLICIT_ROLES = {'main': 'main', 'nav': 'navigation', 'header': 'banner', 'footer': 'contentinfo'}
+
+    def __init__(self):
+        super().__init__()
+        self.seen: Set[str] = set()
+
+    def visit(self, tag: Tag) -> None:
+        role = tag.get('role') or self.IMPLICIT_ROLES.get(tag.name)
+        if role:
+            self.seen.add(role)
+
+    def finish(self) -> None:
+        for role in self.REQUIRED:
+            self.checks += 1
+            if role not in self.seen:
+                self.fail(f"Document has no '{role}' landmark")
+
+class LinkTextRule(Rule):
+    """Links need discernible, descriptive text"""
+    rule_id = 'link-text'
+    tags = ('a',)
+    GENERIC_TEXT = {'click here', 'here', 'read more', 'more', 'link', 'this'}
+
+    def visit(self, tag: Tag) -> None:
+        if not tag.get('href'):
+            return
+        self.checks += 1
+        text = ' '.join(tag.get_text(' ', strip=True).split()).lower()
+        label = tag.get('aria-label') or tag.get('title') or tag.get('aria-labelledby')
+        if not text and not label and not any(img.get('alt') for img in tag.find_all('img')):
+            self.fail("Link has no discernible text", tag)
+        elif text in self.GENERIC_TEXT and not label:
+            self.fail(f"Link text '{text}' is not descriptive", tag)
+
+class FormLabelRule(Rule):
+    """Form controls need an associated label"""
+    rule_id = 'form-label'
+    tags = ('input', 'select', 'textarea', 'label')
+    UNLABELLED_TYPES = {'hidden', 'submit', 'button', 'reset', 'image'}
+
+    def __init__(self):
+        super().__init__()
+        self.label_targets: Set[str] = set()
+        self.pending: List[Tag] = []
+
+    def visit(self, tag: Tag) -> None:
+        if tag.name == 'label':
+            if tag.get('for'):
+                self.label_targets.add(tag['for'])
+            return
+        if tag.name == 'input' and tag.get('type', 'text').lower() in self.UNLABELLED_TYPES:
+            return
+        self.checks += 1
+        if tag.get('aria-label') or tag.get('aria-labelledby') or tag.get('title'):
+            return
+        if tag.find_parent('label') is not None:
+            return
+        # A matching <label for> may appear later in the document
+        self.pending.append(tag)
+
+    def finish(self) -> None:
+        for tag in self.pending:
+            if tag.get('id') not in self.label_targets:
+                self.fail("Form control has no label", tag)
+
+class LangAttributeRule(Rule):
+    """The root element must declare the document language"""
+    rule_id = 'html-lang'
+    tags = ('html',)
+
+    def __init__(self):
+        super().__init__()
+        self.seen = False
+
+    def visit(self, tag: Tag) -> None:
+        self.seen = True
+        self.checks += 1
+        if not (tag.get('lang') or '').strip():
+            self.fail("<html> element has no lang attribute", tag)
+
+    def finish(self) -> None:
+        if not self.seen:
+            self.checks += 1
+            self.fail("Document has no <html> element")
+
+class AccessibilityEngine:
+    """Evaluates registered rules in a single walk over the document"""
+
+    DEFAULT_RULES = (ImageAltRule, HeadingOrderRule, LandmarkRule, LinkTextRule, FormLabelRule, LangAttributeRule)
+
+    def __init__(self):
+        self._rules: List[Type[Rule]] = []
+        self._dispatch: Dict[str, List[int]] = {}
+
+    @classmethod
+    def default(cls) -> 'AccessibilityEngine':
+        engine = cls()
+        for rule in cls.DEFAULT_RULES:
+            engine.register(rule)
+        return engine
+
+    def register(self, rule: Type[Rule]) -> Type[Rule]:
+        """
+        Add a rule to the tag dispatch table of this engine.
+
+        Returns the rule unchanged, so an engine's bound method can decorate
+        a rule class (``@engine.register``); AccessibilityEngine.register
+        itself is not a decorator. Rules added this way are not part of
+        DEFAULT_RULES or engines created by default().
+        """
+        position = len(self._rules)
+        self._rules.append(rule)
+        for name in rule.tags:
+            self._dispatch.setdefault(name, []).append(position)
+        return rule
+
+    def evaluate(self, soup: BeautifulSoup) -> AccessibilityReport:
+        """
+        Run every rule over the document.
+
+        Args:
+            soup: Parsed document
+
+        Returns:
+            AccessibilityReport with a 0-100 score (share of passed checks)
+        """
+        session = self.session()
+        for tag in soup.find_all(True):
+            session.visit(tag)
+        return session.report()
+
+    def session(self) -> 'AccessibilitySession':
+        """Start evaluating a document whose elements are supplied one at a time"""
+        return AccessibilitySession([rule() for rule in self._rules], self._dispatch)
+
+class AccessibilitySession:
+    """Rule state for one document, fed by a tree walk or a streaming parser"""
+
+    def __init__(self, rules: List[Rule], dispatch: Dict[str, List[int]]):
+        self.rules = rules
+        self.dispatch = dispatch
+
+    def visit(self, tag: Tag) -> None:
+        for position in self.dispatch.get(tag.name, ()):
+            self.rules[position].visit(tag)
+
+    def report(self) -> AccessibilityReport:
+        """Finish every rule and compute the score"""
+        report = AccessibilityReport(score=100)
+        failed = total = 0
+        for rule in self.rules:
+            rule.finish()
+            report.checks[rule.rule_id] = rule.checks
+            report.findings[rule.rule_id] = rule.findings
+            total += rule.checks
+            failed += len(rule.findings)
+        if total:
+            report.score = max(0, round(100 * (total - failed) / total))
+        return report
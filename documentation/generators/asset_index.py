@@ -0,0 +1,153 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from bs4 import BeautifulSoup
+import logging
+import re
+from ..generators.site_index import PathIndex
+
+ASSET_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico',
+    '.mp3', '.ogg', '.wav', '.mp4', '.webm',
+    '.woff', '.woff2', '.ttf', '.otf'
+)
+
+CSS_URL_PATTERN = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)|@import\s+(['"])([^'"]+)\3""", re.IGNORECASE)
+JS_ASSET_PATTERN = re.compile(
+    r"""["'`]([^"'`\s]+?(?:%s))(?:[?#][^"'`\s]*)?["'`]""" % '|'.join(re.escape(e) for e in ASSET_EXTENSIONS),
+    re.IGNORECASE
+)
+HTML_URL_ATTRIBUTES = ('src', 'href', 'poster', 'data')
+
+@dataclass
+class AssetReport:
+    """Reverse asset index and the assets nothing references"""
+    usage: Dict[str, Set[str]] = field(default_factory=dict)
+    unused: List[str] = field(default_factory=list)
+    missing: Dict[str, Set[str]] = field(default_factory=dict)
+    unused_bytes: int = 0
+
+    def format(self, sizes: PathIndex) -> List[str]:
+        """Render the report as Markdown lines"""
+        lines = [
+            "## Asset Usage\n",
+            f"- Referenced assets: {sum(1 for refs in self.usage.values() if refs)}",
+            f"- Unused assets: {len(self.unused)} ({self.unused_bytes} bytes)\n",
+            "### Unused Assets\n",
+        ]
+        lines.extend(f"- {asset} ({sizes.size_of(asset)} bytes)" for asset in self.unused)
+        if self.missing:
+            lines.append("\n### Missing Assets\n")
+            lines.extend(f"- {asset}: {', '.join(sorted(refs))}" for asset, refs in sorted(self.missing.items()))
+        return lines
+
+class AssetIndexer:
+    """Builds a reverse index from assets to the pages, stylesheets and scripts that use them"""
+
+    ASSET_DIRS = ('images', 'sounds')
+
+    def __init__(self, project_root: Path, index: Optional[PathIndex] = None,
+                 asset_dirs: Tuple[str, ...] = ASSET_DIRS):
+        self.project_root = Path(project_root).resolve()
+        self.index = index or PathIndex.build(self.project_root)
+        self.asset_dirs = tuple(d.rstrip('/') + '/' for d in asset_dirs)
+        self.logger = logging.getLogger(__name__)
+
+    def discover_sources(self) -> List[str]:
+        """Get root HTML pages plus every site stylesheet and script"""
+        pages = [p for p in self.index.with_suffix('.html') if '/' not in p]
+        code = [p for p in self.index.with_suffix('.css', '.js') if not p.startswith('documentation/')]
+        return sorted(pages + code)
+
+    def discover_assets(self) -> List[str]:
+        """Get all indexed files in the asset directories"""
+        return sorted(
+            p for p in self.index
+            if p.startswith(self.asset_dirs) and p.lower().endswith(ASSET_EXTENSIONS)
+        )
+
+    def build(self, sources: Optional[Iterable[str]] = None) -> AssetReport:
+        """
+        Extract asset references from every source and invert them.
+
+        Args:
+            sources: Relative paths to scan, defaults to discover_sources()
+
+        Returns:
+            AssetReport with usage index, unused assets and missing targets
+        """
+        report = AssetReport()
+        for asset in self.discover_assets():
+            report.usage[asset] = set()
+
+        for source in (sources if sources is not None else self.discover_sources()):
+            for target in self.extract_references(source):
+                if target in self.index:
+                    report.usage.setdefault(target, set()).add(source)
+                elif target.lower().endswith(ASSET_EXTENSIONS):
+                    report.missing.setdefault(target, set()).add(source)
+
+        report.unused = sorted(asset for asset, refs in report.usage.items() if not refs)
+        report.unused_bytes = sum(self.index.size_of(asset) for asset in report.unused)
+        self.logger.info(f"Found {len(report.unused)} unused assets ({report.unused_bytes} bytes)")
+        return report
+
+    def extract_references(self, source: str) -> Set[str]:
+        """Get the resolved relative paths a single source file refers to"""
+        try:
+            content = (self.project_root / source).read_text(encoding='utf-8', errors='replace')
+        except OSError as e:
+            self.logger.error(f"Failed to read {source}: {str(e)}")
+            return set()
+
+        suffix = Path(source).suffix.lower()
+        if suffix == '.css':
+            raw = [(source, ref) for ref in self._css_references(content)]
+        elif suffix == '.js':
+            # Script literals are resolved by the page that runs them, i.e. the site root
+            raw = [('index.html', ref) for ref in self._js_references(content)]
+        else:
+            raw = [(source, ref) for ref in self._html_references(content)]
+
+        targets = set()
+        for base, reference in raw:
+            target = PathIndex.resolve(base, reference)
+            if target:
+                targets.add(target)
+        return targets
+
+    @staticmethod
+    def _css_references(content: str) -> List[str]:
+        """Get url(...) and @import targets from CSS text"""
+        return [m.group(2) or m.group(4) for m in CSS_URL_PATTERN.finditer(content)]
+
+    @staticmethod
+    def _js_references(content: str) -> List[str]:
+        """Get string literals in JS text that look like asset paths"""
+        return [m.group(1) for m in JS_ASSET_PATTERN.finditer(content)]
+
+    def _html_references(self, content: str) -> List[str]:
+        """Get asset references from HTML attributes, inline styles and inline scripts"""
+        soup = BeautifulSoup(content, 'html.parser')
+        references = []
+        for tag in soup.find_all(True):
+            for attr in HTML_URL_ATTRIBUTES:
+                value = tag.get(attr)
+                if value:
+                    references.append(value)
+            srcset = tag.get('srcset')
+            if srcset:
+                references.extend(part.split()[0] for part in srcset.split(',') if part.strip())
+            style = tag.get('style')
+            if style:
+                references.extend(self._css_references(style))
+        for style in soup.find_all('style'):
+            references.extend(self._css_references(style.get_text()))
+        for script in soup.find_all('script', src=False):
+            references.extend(self._js_references(script.get_text()))
+        return references
+
+if __name__ == '__main__':
+    project_root = Path(__file__).resolve().parents[2]
+    indexer = AssetIndexer(project_root)
+    print('\n'.join(indexer.build().format(indexer.index)))
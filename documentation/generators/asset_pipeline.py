@@ -0,0 +1,456 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import re
+import shutil
+from ..generators.site_index import PathIndex
+
+SCRIPT_TAG_PATTERN = re.compile(r'<script\b([^>]*)>\s*</script>', re.IGNORECASE)
+LINK_TAG_PATTERN = re.compile(r'<link\b([^>]*?)/?>', re.IGNORECASE)
+ATTRIBUTE_PATTERN = re.compile(r'([^\s=/>]+)(?:\s*=\s*("[^"]*"|\'[^\']*\'|[^\s>]+))?')
+CSS_URL_PATTERN = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""", re.IGNORECASE)
+
+# Characters after which a '/' starts a regular expression literal rather than a division,
+# except after a postfix ++ or -- which ends an operand
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw', 'yield', 'await'}
+
+def content_hash(data: bytes) -> str:
+    """Short, filename-safe content digest"""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+def _skip_quoted(text: str, i: int) -> int:
+    """Return the index just past the string or template literal starting at i"""
+    quote = text[i]
+    i += 1
+    while i < len(text):
+        char = text[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == quote:
+            return i + 1
+        if quote == '`' and text.startswith('${', i):
+            i = _skip_template_expression(text, i + 2)
+            continue
+        i += 1
+    return i
+
+def _skip_template_expression(text: str, i: int) -> int:
+    """Return the index just past the '}' closing a template ${...} expression"""
+    depth = 1
+    while i < len(text) and depth:
+        char = text[i]
+        if char in '"\'`':
+            i = _skip_quoted(text, i)
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        i += 1
+    return i
+
+def minify_css(text: str) -> str:
+    """
+    Conservatively minify CSS.
+
+    Removes comments (except /*! ... */) and redundant whitespace while leaving
+    strings untouched. Spaces before ':' and around '+'/'-' are kept since they
+    are significant in selectors and calc().
+    """
+    segments: List[Tuple[bool, str]] = []
+    plain: List[str] = []
+    i = 0
+    while i < len(text):
+        if text.startswith('/*', i):
+            close = text.find('*/', i + 2)
+            close = len(text) if close == -1 else close + 2
+            if text.startswith('/*!', i):
+                segments.append((False, ''.join(plain)))
+                segments.append((True, text[i:close]))
+                plain = []
+            else:
+                plain.append(' ')
+            i = close
+            continue
+        char = text[i]
+        if char in '"\'':
+            end = _skip_quoted(text, i)
+            segments.append((False, ''.join(plain)))
+            segments.append((True, text[i:end]))
+            plain = []
+            i = end
+            continue
+        plain.append(char)
+        i += 1
+    segments.append((False, ''.join(plain)))
+
+    out = []
+    for literal, segment in segments:
+        if not literal:
+            segment = re.sub(r'\s+', ' ', segment)
+            segment = re.sub(r' ?([{};,>]) ?', r'\1', segment)
+            segment = segment.replace(': ', ':').replace(';}', '}')
+        out.append(segment)
+    return ''.join(out).strip()
+
+def minify_js(text: str) -> str:
+    """
+    Conservatively minify JavaScript.
+
+    Removes comments, indentation and blank lines while copying string,
+    template and regular expression literals verbatim. Line breaks are kept
+    so automatic semicolon insertion behaves exactly as in the source.
+    """
+    out: List[str] = []
+    i = 0
+    # The last one or two significant characters, two only when adjacent in the source
+    last_significant = ''
+    while i < len(text):
+        char = text[i]
+        if text.startswith('//', i):
+            newline = text.find('\n', i)
+            i = len(text) if newline == -1 else newline
+            continue
+        if text.startswith('/*', i):
+            close = text.find('*/', i + 2)
+            close = len(text) if close == -1 else close + 2
+            if '\n' in text[i:close]:
+                out.append('\n')
+            else:
+                out.append(' ')
+            i = close
+            continue
+        if char in '"\'`':
+            end = _skip_quoted(text, i)
+            out.append(text[i:end])
+            last_significant = text[end - 1]
+            i = end
+            continue
+        if char == '/' and _is_regex_start(out, last_significant):
+            end = _skip_regex(text, i)
+            out.append(text[i:end])
+            last_significant = 'a'
+            i = end
+            continue
+        if not char.isspace():
+            adjacent = i > 0 and last_significant and text[i - 1] == last_significant[-1]
+            last_significant = last_significant[-1] + char if adjacent else char
+        out.append(char)
+        i += 1
+
+    lines = []
+    for line in ''.join(out).split('\n'):
+        line = line.strip()
+        if line:
+            lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+def _is_regex_start(out: List[str], last_significant: str) -> bool:
+    """Decide whether a '/' at the current position begins a regex literal"""
+    if last_significant in ('++', '--'):
+        return False
+    if not last_significant or last_significant[-1] in REGEX_PRECEDERS:
+        return True
+    tail = ''.join(out[-12:]).rstrip()
+    match = re.search(r'([A-Za-z_$][\w$]*)$', tail)
+    return bool(match) and match.group(1) in REGEX_KEYWORDS
+
+def _skip_regex(text: str, i: int) -> int:
+    """Return the index just past the regex literal (including flags) starting at i"""
+    i += 1
+    in_class = False
+    while i < len(text) and text[i] != '\n':
+        char = text[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class:
+            i += 1
+            while i < len(text) and (text[i].isalnum() or text[i] == '_'):
+                i += 1
+            return i
+        i += 1
+    return i
+
+def parse_attributes(attrs: str) -> Dict[str, str]:
+    """Parse a raw attribute string into a name -> value mapping"""
+    parsed = {}
+    for name, value in ATTRIBUTE_PATTERN.findall(attrs):
+        parsed[name.lower()] = value[1:-1] if value[:1] in ('"', "'") else value
+    return parsed
+
+@dataclass
+class AssetGroup:
+    """Consecutive local script or stylesheet tags that load as one bundle"""
+    kind: str
+    sources: List[str]
+    start: int
+    end: int
+    tag_template: str
+
+@dataclass
+class PipelineResult:
+    """Outcome of a build run"""
+    bundles: Dict[str, List[str]] = field(default_factory=dict)
+    minified: List[str] = field(default_factory=list)
+    reused: List[str] = field(default_factory=list)
+    pages: List[str] = field(default_factory=list)
+    # Unbundled site files linked or copied into the output directory
+    static: List[str] = field(default_factory=list)
+    # Stale bundles, cache entries and static files deleted from the output directory
+    removed: List[str] = field(default_factory=list)
+
+class AssetPipeline:
+    """
+    Minifies and bundles page scripts/stylesheets under content-hash filenames.
+
+    The output directory is a complete, deployable copy of the site: pages
+    and bundles are written there, and the images, sounds, fonts and other
+    files the pages load are hard-linked in (copied where linking fails).
+    A build over all pages deletes bundles and cached minified inputs that
+    it no longer produced, so old content-hashed files do not accumulate.
+    """
+
+    MANIFEST_FILE = 'asset-manifest.json'
+    ASSET_DIR = 'assets'
+    CACHE_DIR = '.cache'
+    STATIC_EXTENSIONS = {
+        '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.avif', '.ico',
+        '.mp3', '.ogg', '.wav', '.woff', '.woff2', '.ttf', '.otf', '.js', '.css'
+    }
+    # Fetched at runtime by scripts.js
+    STATIC_FILES = {'search-index.json'}
+    # Tooling trees that are not part of the site
+    EXCLUDE_DIRS = ('documentation/', 'database/', 'config/', 'auth/', 'dist/', 'templates/', 'tests/')
+
+    def __init__(self, project_root: Path, output_dir: Optional[Path] = None):
+        self.project_root = Path(project_root).resolve()
+        self.output_dir = Path(output_dir) if output_dir else self.project_root / 'dist'
+        self.logger = logging.getLogger(__name__)
+        self._manifest = self._load_manifest()
+        self._minified: Dict[str, str] = {}
+
+    def build(self, pages: Optional[List[str]] = None) -> PipelineResult:
+        """
+        Rewrite every page to reference minified, content-hashed bundles.
+
+        Args:
+            pages: Relative page paths, defaults to all root HTML pages
+
+        Returns:
+            PipelineResult describing which inputs were reprocessed
+        """
+        full_build = pages is None
+        pages = pages if pages is not None else sorted(p.name for p in self.project_root.glob('*.html'))
+        result = PipelineResult()
+        (self.output_dir / self.ASSET_DIR).mkdir(parents=True, exist_ok=True)
+        inputs = self._manifest.setdefault('inputs', {})
+
+        for page in pages:
+            html = (self.project_root / page).read_text(encoding='utf-8')
+            pieces, cursor = [], 0
+            for group in self._find_groups(page, html):
+                bundle = self._build_bundle(group, inputs, result)
+                pieces.append(html[cursor:group.start])
+                pieces.append(group.tag_template.format(url=bundle))
+                cursor = group.end
+            pieces.append(html[cursor:])
+            if self._write_if_changed(self.output_dir / page, ''.join(pieces).encode('utf-8')):
+                result.pages.append(page)
+
+        if full_build:
+            self._prune(result, inputs)
+            self._manifest['bundles'] = result.bundles
+        else:
+            # Pages not rebuilt still reference the bundles of earlier runs
+            self._manifest['bundles'] = {**self._manifest.get('bundles', {}), **result.bundles}
+        self._link_static(result)
+        self._save_manifest()
+        self.logger.info(
+            f"Asset pipeline: {len(result.minified)} inputs minified, {len(result.reused)} reused, "
+            f"{len(result.bundles)} bundles, {len(result.pages)} pages written, "
+            f"{len(result.static)} static files linked, {len(result.removed)} stale files removed"
+        )
+        return result
+
+    def _prune(self, result: PipelineResult, inputs: Dict[str, Dict[str, str]]) -> None:
+        """Delete bundles and cached minified inputs this build did not use"""
+        for source in set(inputs) - set(self._minified):
+            del inputs[source]
+        keep_cache = {f"{entry['hash']}.{posixpath.splitext(source)[1][1:]}" for source, entry in inputs.items()}
+        for directory, keep in ((self.ASSET_DIR, set(result.bundles)),
+                                (self.CACHE_DIR, {f"{self.CACHE_DIR}/{name}" for name in keep_cache})):
+            try:
+                entries = list(os.scandir(self.output_dir / directory))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                relative = f"{directory}/{entry.name}"
+                if entry.is_file() and relative not in keep:
+                    os.unlink(entry.path)
+                    result.removed.append(relative)
+
+    def _link_static(self, result: PipelineResult) -> None:
+        """Mirror the unbundled files the pages load into the output directory"""
+        excluded = self.EXCLUDE_DIRS
+        if self.output_dir.resolve().is_relative_to(self.project_root):
+            excluded += (f"{self.output_dir.resolve().relative_to(self.project_root).as_posix()}/",)
+        static = sorted(
+            path for path in PathIndex.build(self.project_root)
+            if (posixpath.splitext(path)[1].lower() in self.STATIC_EXTENSIONS or path in self.STATIC_FILES)
+            and not path.startswith(excluded) and not any(part.startswith('.') for part in path.split('/'))
+        )
+        for path in static:
+            if self._link(self.project_root / path, self.output_dir / path):
+                result.static.append(path)
+        for path in sorted(set(self._manifest.get('static', [])) - set(static)):
+            try:
+                (self.output_dir / path).unlink()
+                result.removed.append(path)
+            except FileNotFoundError:
+                pass
+        self._manifest['static'] = static
+
+    @staticmethod
+    def _link(source: Path, target: Path) -> bool:
+        """Hard-link source to target, copying across filesystems; False if already current"""
+        try:
+            target_stat = target.stat()
+            source_stat = source.stat()
+            if os.path.samestat(source_stat, target_stat) or (
+                    target_stat.st_size == source_stat.st_size and target_stat.st_mtime_ns == source_stat.st_mtime_ns):
+                return False
+            target.unlink()
+        except FileNotFoundError:
+            target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+        return True
+
+    def _find_groups(self, page: str, html: str) -> List[AssetGroup]:
+        """Locate runs of local script/stylesheet tags sharing the same attributes"""
+        tags: List[Tuple[int, int, str, str, Dict[str, str]]] = []
+        for match in SCRIPT_TAG_PATTERN.finditer(html):
+            attrs = parse_attributes(match.group(1))
+            target = PathIndex.resolve(page, attrs.get('src', '')) if attrs.get('src') else None
+            if target and target.endswith('.js') and attrs.get('type', 'text/javascript') in ('text/javascript', ''):
+                tags.append((match.start(), match.end(), 'js', target, attrs))
+        for match in LINK_TAG_PATTERN.finditer(html):
+            attrs = parse_attributes(match.group(1))
+            if 'stylesheet' not in attrs.get('rel', '').lower().split() or not attrs.get('href'):
+                continue
+            target = PathIndex.resolve(page, attrs['href'])
+            if target and target.endswith('.css'):
+                tags.append((match.start(), match.end(), 'css', target, attrs))
+        tags.sort()
+
+        groups: List[AssetGroup] = []
+        for start, end, kind, target, attrs in tags:
+            signature = {k: v for k, v in attrs.items() if k not in ('src', 'href')}
+            previous = groups[-1] if groups else None
+            if (previous and previous.kind == kind and not html[previous.end:start].strip()
+                    and previous.tag_template == self._tag_template(kind, signature)):
+                previous.sources.append(target)
+                previous.end = end
+            else:
+                groups.append(AssetGroup(kind, [target], start, end, self._tag_template(kind, signature)))
+        return groups
+
+    @staticmethod
+    def _tag_template(kind: str, attrs: Dict[str, str]) -> str:
+        """Build a replacement tag with a {url} placeholder and the original extra attributes"""
+        extra = ''.join(
+            f' {name}' if value == '' else f' {name}="{value}"'
+            for name, value in attrs.items()
+        ).replace('{', '{{').replace('}', '}}')
+        if kind == 'js':
+            return f'<script src="{{url}}"{extra}></script>'
+        return f'<link{extra} href="{{url}}">'
+
+    def _build_bundle(self, group: AssetGroup, inputs: Dict[str, Dict[str, str]], result: PipelineResult) -> str:
+        """Concatenate minified members and write them under their content hash"""
+        parts = [self._minify_input(source, group.kind, inputs, result) for source in group.sources]
+        separator = '\n;\n' if group.kind == 'js' else '\n'
+        data = separator.join(parts).encode('utf-8')
+        stem = posixpath.splitext(posixpath.basename(group.sources[0]))[0]
+        name = f"{self.ASSET_DIR}/{stem}.{content_hash(data)}.{group.kind}"
+        self._write_if_changed(self.output_dir / name, data)
+        result.bundles[name] = list(group.sources)
+        return name
+
+    def _minify_input(self, source: str, kind: str, inputs: Dict[str, Dict[str, str]],
+                      result: PipelineResult) -> str:
+        """Minify one input, reusing the cached output when its hash is unchanged"""
+        if source in self._minified:
+            return self._minified[source]
+        raw = (self.project_root / source).read_bytes()
+        digest = content_hash(raw)
+        entry = inputs.get(source)
+        cache_file = self.output_dir / self.CACHE_DIR / f"{digest}.{kind}"
+        if entry and entry.get('hash') == digest and cache_file.exists():
+            minified = cache_file.read_text(encoding='utf-8')
+            result.reused.append(source)
+        else:
+            text = raw.decode('utf-8')
+            if kind == 'css':
+                minified = minify_css(self._rebase_css_urls(source, text))
+            else:
+                minified = minify_js(text)
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(minified, encoding='utf-8')
+            inputs[source] = {'hash': digest}
+            result.minified.append(source)
+        self._minified[source] = minified
+        return minified
+
+    def _rebase_css_urls(self, source: str, text: str) -> str:
+        """Rewrite relative url() references so they resolve from the assets directory"""
+        def rebase(match: re.Match) -> str:
+            reference = match.group(2).strip()
+            target = PathIndex.resolve(source, reference)
+            if not target or reference.startswith(('/', '#')):
+                return match.group(0)
+            suffix = reference[len(reference.split('#')[0].split('?')[0]):]
+            return f"url('{posixpath.relpath(target, self.ASSET_DIR)}{suffix}')"
+        return CSS_URL_PATTERN.sub(rebase, text)
+
+    @staticmethod
+    def _write_if_changed(path: Path, data: bytes) -> bool:
+        """Write data unless the file already holds exactly these bytes"""
+        if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return True
+
+    def _load_manifest(self) -> Dict:
+        """Load the previous run's manifest, if any"""
+        manifest_path = self.output_dir / self.MANIFEST_FILE
+        try:
+            with manifest_path.open('r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        """Persist input hashes for the next incremental run"""
+        manifest_path = self.output_dir / self.MANIFEST_FILE
+        with manifest_path.open('w', encoding='utf-8') as f:
+            json.dump(self._manifest, f, indent=2, sort_keys=True)
+
+if __name__ == '__main__':
+    project_root = Path(__file__).resolve().parents[2]
+    AssetPipeline(project_root).build()
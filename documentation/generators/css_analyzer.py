@@ -0,0 +1,352 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from bs4 import BeautifulSoup
+import logging
+import re
+
+TOKEN_PATTERN = re.compile(r'[A-Za-z_][\w-]*')
+CLASS_PATTERN = re.compile(r'\.(-?[A-Za-z_][\w-]*)')
+ID_PATTERN = re.compile(r'#(-?[A-Za-z_][\w-]*)')
+TAG_PATTERN = re.compile(r'(?:^|(?<=[\s>+~]))([A-Za-z][\w-]*)')
+COMBINATOR_PATTERN = re.compile(r'\s*[>+~]\s*|\s+')
+COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+# At-rules whose bodies contain ordinary style rules
+GROUPING_AT_RULES = {'media', 'supports', 'document', 'layer', 'container'}
+
+@dataclass
+class CssRule:
+    """A style rule located by character offsets in the stylesheet"""
+    selectors: List[str]
+    start: int
+    end: int
+    media: str = ''
+    used_selectors: List[str] = field(default_factory=list)
+
+    @property
+    def is_used(self) -> bool:
+        return bool(self.used_selectors)
+
+@dataclass
+class CssGroup:
+    """A grouping at-rule block such as @media and the rules inside it"""
+    prelude: str
+    start: int
+    end: int
+    rules: List[CssRule] = field(default_factory=list)
+    has_other_content: bool = False
+
+@dataclass
+class PageIndex:
+    """Tag, class and id sets for one parsed page"""
+    soup: BeautifulSoup
+    tags: Set[str]
+    classes: Set[str]
+    ids: Set[str]
+
+    @classmethod
+    def from_html(cls, content: str) -> 'PageIndex':
+        soup = BeautifulSoup(content, 'html.parser')
+        tags, classes, ids = set(), set(), set()
+        for tag in soup.find_all(True):
+            tags.add(tag.name)
+            classes.update(tag.get('class', ()))
+            if tag.get('id'):
+                ids.add(tag['id'])
+        return cls(soup, tags, classes, ids)
+
+class StylesheetParser:
+    """Splits CSS text into style rules and grouping at-rule blocks"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.rules: List[CssRule] = []
+        self.groups: List[CssGroup] = []
+
+    def parse(self) -> 'StylesheetParser':
+        self._parse_block(0, len(self.text), None)
+        return self
+
+    def _parse_block(self, start: int, end: int, group: Optional[CssGroup]) -> None:
+        text = self.text
+        i = prelude_start = start
+        while i < end:
+            if text.startswith('/*', i):
+                close = text.find('*/', i + 2)
+                i = end if close == -1 else close + 2
+                continue
+            char = text[i]
+            if char in '"\'':
+                i = self._skip_string(i)
+            elif char == ';':
+                if group is not None and text[prelude_start:i].strip():
+                    group.has_other_content = True
+                i += 1
+                prelude_start = i
+            elif char == '{':
+                close = self._find_block_end(i)
+                prelude = COMMENT_PATTERN.sub('', text[prelude_start:i]).strip()
+                rule_start = prelude_start + (len(text[prelude_start:i]) - len(text[prelude_start:i].lstrip()))
+                if prelude.startswith('@'):
+                    name = TOKEN_PATTERN.match(prelude, 1)
+                    if name and name.group(0).lower() in GROUPING_AT_RULES:
+                        child = CssGroup(prelude, rule_start, close + 1)
+                        self.groups.append(child)
+                        self._parse_block(i + 1, close, child)
+                    elif group is not None:
+                        group.has_other_content = True
+                else:
+                    rule = CssRule(
+                        selectors=split_selectors(prelude),
+                        start=rule_start,
+                        end=close + 1,
+                        media=group.prelude if group else ''
+                    )
+                    self.rules.append(rule)
+                    if group is not None:
+                        group.rules.append(rule)
+                i = close + 1
+                prelude_start = i
+            else:
+                i += 1
+
+    def _skip_string(self, i: int) -> int:
+        quote, text = self.text[i], self.text
+        i += 1
+        while i < len(text) and text[i] != quote:
+            i += 2 if text[i] == '\\' else 1
+        return i + 1
+
+    def _find_block_end(self, open_index: int) -> int:
+        """Find the index of the brace closing the block opened at open_index"""
+        text, depth, i = self.text, 0, open_index
+        while i < len(text):
+            if text.startswith('/*', i):
+                close = text.find('*/', i + 2)
+                i = len(text) if close == -1 else close + 2
+                continue
+            char = text[i]
+            if char in '"\'':
+                i = self._skip_string(i)
+                continue
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    return i
+            i += 1
+        return len(text) - 1
+
+def split_selectors(prelude: str) -> List[str]:
+    """Split a selector list on top-level commas"""
+    selectors, depth, current = [], 0, []
+    for char in prelude:
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            selectors.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    selectors.append(''.join(current).strip())
+    return [s for s in selectors if s]
+
+def strip_pseudo(selector: str) -> str:
+    """
+    Remove pseudo-classes and pseudo-elements from a selector.
+
+    Dropping them only broadens what the selector matches, so a selector that
+    matches nothing after stripping can never match at runtime either.
+    """
+    out, i, depth_bracket = [], 0, 0
+    while i < len(selector):
+        char = selector[i]
+        if char == '[':
+            depth_bracket += 1
+        elif char == ']':
+            depth_bracket -= 1
+        if char == ':' and depth_bracket == 0:
+            i += 1
+            if i < len(selector) and selector[i] == ':':
+                i += 1
+            while i < len(selector) and (selector[i].isalnum() or selector[i] in '-_'):
+                i += 1
+            if i < len(selector) and selector[i] == '(':
+                depth = 0
+                while i < len(selector):
+                    if selector[i] == '(':
+                        depth += 1
+                    elif selector[i] == ')':
+                        depth -= 1
+                        if depth == 0:
+                            i += 1
+                            break
+                    i += 1
+            continue
+        out.append(char)
+        i += 1
+    stripped = ''.join(out).strip()
+    # Compounds emptied by stripping (e.g. "ul > :first-child") match any element
+    stripped = re.sub(r'(^|[>+~]\s*)(?=[>+~]|$)', r'\1*', stripped)
+    return stripped or '*'
+
+@dataclass
+class CssReport:
+    """Unused rules found in a stylesheet"""
+    stylesheet: str
+    total_bytes: int
+    rules: List[CssRule]
+    groups: List[CssGroup]
+    text: str
+
+    @property
+    def unused_rules(self) -> List[CssRule]:
+        return [rule for rule in self.rules if not rule.is_used]
+
+    @property
+    def unused_bytes(self) -> int:
+        return sum(len(self.text[r.start:r.end].encode('utf-8')) for r in self.unused_rules)
+
+    def format(self) -> List[str]:
+        """Render the report as Markdown lines"""
+        lines = [
+            f"## Unused CSS: {self.stylesheet}\n",
+            f"- Rules: {len(self.rules)}",
+            f"- Unused rules: {len(self.unused_rules)}",
+            f"- Unused bytes: {self.unused_bytes} of {self.total_bytes}\n",
+        ]
+        for rule in self.unused_rules:
+            size = len(self.text[rule.start:rule.end].encode('utf-8'))
+            media = f" [{rule.media}]" if rule.media else ''
+            lines.append(f"- {', '.join(rule.selectors)}{media} ({size} bytes)")
+        return lines
+
+    def pruned(self) -> str:
+        """Get the stylesheet with unused rules and selectors removed"""
+        edits: List[Tuple[int, int, str]] = []
+        removed_groups = []
+        for group in self.groups:
+            if group.rules and not group.has_other_content and not any(r.is_used for r in group.rules):
+                edits.append((group.start, group.end, ''))
+                removed_groups.append(group)
+
+        for rule in self.rules:
+            if any(g.start <= rule.start and rule.end <= g.end for g in removed_groups):
+                continue
+            if not rule.is_used:
+                edits.append((rule.start, rule.end, ''))
+            elif len(rule.used_selectors) < len(rule.selectors):
+                brace = self.text.index('{', rule.start)
+                edits.append((rule.start, brace, ',\n'.join(rule.used_selectors) + ' '))
+
+        result, cursor = [], 0
+        for start, end, replacement in sorted(edits):
+            if start < cursor:
+                continue
+            result.append(self.text[cursor:start])
+            result.append(replacement)
+            cursor = end
+        result.append(self.text[cursor:])
+        return ''.join(result)
+
+class UnusedCssAnalyzer:
+    """Matches stylesheet selectors against the DOMs of every page"""
+
+    # Classes toggled by third-party scripts (Bootstrap) rather than by site code
+    SAFELIST = {'show', 'showing', 'hiding', 'collapsing', 'active', 'disabled', 'fade', 'modal-open', 'was-validated'}
+
+    def __init__(self, project_root: Path, safelist: Optional[Iterable[str]] = None):
+        self.project_root = Path(project_root).resolve()
+        self.safelist = set(self.SAFELIST if safelist is None else safelist)
+        self.logger = logging.getLogger(__name__)
+        self.pages: Dict[str, PageIndex] = {}
+        self.tags: Set[str] = set()
+        self.classes: Set[str] = set()
+        self.ids: Set[str] = set()
+        self.dynamic: Set[str] = set()
+
+    def load_pages(self, pages: Optional[Iterable[Path]] = None, scripts: Optional[Iterable[Path]] = None) -> None:
+        """
+        Parse every page once and build the tag/class/id indexes.
+
+        Identifiers appearing anywhere in site scripts are treated as
+        dynamically applied, since scripts build markup and toggle classes.
+        """
+        pages = list(pages) if pages is not None else sorted(self.project_root.glob('*.html'))
+        scripts = list(scripts) if scripts is not None else (
+            sorted(self.project_root.glob('*.js')) + sorted(self.project_root.glob('js/*.js'))
+        )
+        for page in pages:
+            index = PageIndex.from_html(Path(page).read_text(encoding='utf-8', errors='replace'))
+            self.pages[Path(page).name] = index
+            self.tags |= index.tags
+            self.classes |= index.classes
+            self.ids |= index.ids
+        for script in scripts:
+            self.dynamic.update(TOKEN_PATTERN.findall(Path(script).read_text(encoding='utf-8', errors='replace')))
+        self.dynamic |= self.safelist
+
+    def analyze(self, stylesheet: Path) -> CssReport:
+        """
+        Find the rules in a stylesheet that match no element on any page.
+
+        Args:
+            stylesheet: Path to the CSS file
+
+        Returns:
+            CssReport with per-rule usage, able to emit a pruned stylesheet
+        """
+        if not self.pages:
+            self.load_pages()
+        text = Path(stylesheet).read_text(encoding='utf-8')
+        parser = StylesheetParser(text).parse()
+        for rule in parser.rules:
+            rule.used_selectors = [s for s in rule.selectors if self.is_selector_used(s)]
+
+        report = CssReport(
+            stylesheet=Path(stylesheet).name,
+            total_bytes=len(text.encode('utf-8')),
+            rules=parser.rules,
+            groups=parser.groups,
+            text=text
+        )
+        self.logger.info(
+            f"{report.stylesheet}: {len(report.unused_rules)} of {len(report.rules)} rules unused "
+            f"({report.unused_bytes} bytes)"
+        )
+        return report
+
+    def is_selector_used(self, selector: str) -> bool:
+        """Check a selector against the indexes, querying the DOM only when needed"""
+        cleaned = strip_pseudo(selector)
+        unbracketed = re.sub(r'\[[^\]]*\]', '', cleaned)
+        classes = set(CLASS_PATTERN.findall(unbracketed))
+        ids = set(ID_PATTERN.findall(unbracketed))
+        tags = {t.lower() for t in TAG_PATTERN.findall(re.sub(r'[.#][\w-]+', '', unbracketed))}
+
+        missing = (classes - self.classes) | (ids - self.ids) | (tags - self.tags)
+        if missing:
+            # Unknown to every DOM: used only if a script may add it at runtime
+            return missing <= self.dynamic
+
+        simple = len(classes) + len(ids) + len(tags) <= 1 and '[' not in cleaned
+        if simple and not COMBINATOR_PATTERN.search(cleaned):
+            return True
+
+        for index in self.pages.values():
+            if classes <= index.classes and ids <= index.ids and tags <= index.tags:
+                try:
+                    if index.soup.select_one(cleaned) is not None:
+                        return True
+                except Exception as e:
+                    self.logger.debug(f"Cannot evaluate selector {selector!r}: {str(e)}")
+                    return True
+        return False
+
+if __name__ == '__main__':
+    project_root = Path(__file__).resolve().parents[2]
+    print('\n'.join(UnusedCssAnalyzer(project_root).analyze(project_root / 'style.css').format()))
@@ -0,0 +1,88 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from dataclasses import dataclass, field
+
+@dataclass
+class Heading:
+    text: str
+    level: int = 2
+
+@dataclass
+class Text:
+    """
+    A paragraph of plain text; role picks a presentation ('body', 'cover').
+
+    Body text is reflowed. Cover text keeps its line breaks.
+    """
+    text: str
+    role: str = 'body'
+
+    @property
+    def lines(self) -> List[str]:
+        if self.role == 'body':
+            return [' '.join(self.text.split())]
+        return [' '.join(line.split()) for line in self.text.strip().splitlines() if line.strip()]
+
+@dataclass
+class BulletList:
+    items: List[str]
+    intro: Optional[str] = None
+
+@dataclass
+class CodeBlock:
+    code: str
+    language: str = ''
+
+@dataclass
+class ImageBlock:
+    path: Path
+    width: int
+    height: int
+    caption: Optional[str] = None
+
+@dataclass
+class Tree:
+    """Pre-rendered directory tree, one line per entry"""
+    lines: List[str]
+
+@dataclass
+class Spacer:
+    """Vertical gap in points; only meaningful to paginated renderers"""
+    height: float
+
+Block = Union[Heading, Text, BulletList, CodeBlock, ImageBlock, Tree, Spacer]
+
+@dataclass
+class Section:
+    title: str
+    blocks: List[Block] = field(default_factory=list)
+
+    def add(self, *blocks: Block) -> 'Section':
+        self.blocks.extend(blocks)
+        return self
+
+@dataclass
+class Document:
+    """
+    Format-neutral documentation content.
+
+    Built once from the analysis results, then handed to any number of
+    renderers. Everything is plain data, so a document can be pickled to
+    renderer processes.
+    """
+    title: str
+    version: str
+    generated: str
+    cover: List[Block] = field(default_factory=list)
+    sections: List[Section] = field(default_factory=list)
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+    def section(self, title: str) -> Section:
+        """Append a new numbered section"""
+        section = Section(title)
+        self.sections.append(section)
+        return section
+
+    @property
+    def numbered_titles(self) -> List[str]:
+        return [f"{number}. {section.title}" for number, section in enumerate(self.sections, 1)]
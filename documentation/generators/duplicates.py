@@ -0,0 +1,140 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import logging
+import os
+import threading
+from ..generators.hashing import HashingService
+from ..generators.site_index import PathIndex
+
+@dataclass
+class DuplicateGroup:
+    """Files with identical content"""
+    size: int
+    paths: List[str]
+
+    @property
+    def reclaimable_bytes(self) -> int:
+        return self.size * (len(self.paths) - 1)
+
+class DuplicateDetector:
+    """
+    Finds duplicate assets in three narrowing stages.
+
+    1. Bucket by size; files with a unique size cannot have a duplicate.
+    2. Hash the first and last SAMPLE_SIZE bytes of the remaining files.
+    3. Fully hash only files whose samples still collide. Files no larger
+       than two samples were read completely in stage 2 and skip this stage.
+    """
+
+    SAMPLE_SIZE = 64 * 1024
+    ASSET_DIRS = ('images', 'sounds')
+
+    def __init__(self, project_root: Path, asset_dirs: Tuple[str, ...] = ASSET_DIRS,
+                 index: Optional[PathIndex] = None, hashing: Optional[HashingService] = None,
+                 workers: Optional[int] = None):
+        self.project_root = Path(project_root).resolve()
+        self.asset_dirs = tuple(d.rstrip('/') + '/' for d in asset_dirs)
+        self.index = index or PathIndex.build(self.project_root)
+        self.hashing = hashing or HashingService()
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 2)
+        self.logger = logging.getLogger(__name__)
+        self.bytes_read = 0
+        self._lock = threading.Lock()
+
+    def find(self, paths: Optional[Iterable[str]] = None) -> List[DuplicateGroup]:
+        """
+        Find groups of identical files.
+
+        Args:
+            paths: Relative paths to consider, defaults to files in asset_dirs
+
+        Returns:
+            Duplicate groups, largest reclaimable size first
+        """
+        if paths is None:
+            paths = [p for p in self.index if p.startswith(self.asset_dirs)]
+
+        by_size: Dict[int, List[str]] = {}
+        for path in paths:
+            size = self.index.size_of(path)
+            if size > 0:
+                by_size.setdefault(size, []).append(path)
+        candidates = [group for group in by_size.values() if len(group) > 1]
+
+        by_sample = self._regroup(candidates, self._sample_hash)
+        needs_full = [g for g in by_sample if self.index.size_of(g[0]) > 2 * self.SAMPLE_SIZE]
+        complete = [g for g in by_sample if self.index.size_of(g[0]) <= 2 * self.SAMPLE_SIZE]
+        complete.extend(self._regroup(needs_full, self._full_hash))
+
+        groups = [DuplicateGroup(self.index.size_of(g[0]), sorted(g)) for g in complete]
+        groups.sort(key=lambda g: (-g.reclaimable_bytes, g.paths))
+        self.logger.info(
+            f"Found {len(groups)} duplicate groups, {sum(g.reclaimable_bytes for g in groups)} bytes reclaimable "
+            f"({self.bytes_read} bytes read)"
+        )
+        return groups
+
+    def _regroup(self, groups: List[List[str]], key_function) -> List[List[str]]:
+        """Split each group by a content key, keeping sub-groups with more than one file"""
+        members = [path for group in groups for path in group]
+        if not members:
+            return []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            keys = dict(zip(members, executor.map(key_function, members)))
+        result = []
+        for group in groups:
+            buckets: Dict[str, List[str]] = {}
+            for path in group:
+                buckets.setdefault(keys[path], []).append(path)
+            result.extend(bucket for bucket in buckets.values() if len(bucket) > 1)
+        return result
+
+    def _sample_hash(self, path: str) -> str:
+        """Hash the head and tail of a file"""
+        hasher = hashlib.blake2b(digest_size=16)
+        size = self.index.size_of(path)
+        with open(self.project_root / path, 'rb') as f:
+            if size <= 2 * self.SAMPLE_SIZE:
+                data = f.read()
+                hasher.update(data)
+                read = len(data)
+            else:
+                head = f.read(self.SAMPLE_SIZE)
+                f.seek(-self.SAMPLE_SIZE, os.SEEK_END)
+                tail = f.read(self.SAMPLE_SIZE)
+                hasher.update(head)
+                hasher.update(tail)
+                read = len(head) + len(tail)
+        self._count_read(read)
+        return hasher.hexdigest()
+
+    def _full_hash(self, path: str) -> str:
+        digest = self.hashing.cached_digest(self.project_root / path)
+        if digest is None:
+            # Only count bytes actually read, not cache hits
+            digest = self.hashing.hash_file(self.project_root / path)
+            self._count_read(self.index.size_of(path))
+        return digest
+
+    def _count_read(self, size: int) -> None:
+        with self._lock:
+            self.bytes_read += size
+
+    @staticmethod
+    def format(groups: List[DuplicateGroup]) -> List[str]:
+        """Render duplicate groups as Markdown lines"""
+        lines = [
+            "## Duplicate Assets\n",
+            f"- Groups: {len(groups)}",
+            f"- Reclaimable: {sum(g.reclaimable_bytes for g in groups)} bytes\n",
+        ]
+        for group in groups:
+            lines.append(f"- {group.size} bytes x {len(group.paths)}: {', '.join(group.paths)}")
+        return lines
+
+if __name__ == '__main__':
+    project_root = Path(__file__).resolve().parents[2]
+    print('\n'.join(DuplicateDetector.format(DuplicateDetector(project_root).find())))
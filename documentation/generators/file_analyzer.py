@@ -1,12 +1,16 @@
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set
 from bs4 import BeautifulSoup
 import logging
 from urllib.parse import urlparse, ParseResult
 import re
-from functools import lru_cache
+import codecs
 import os
-from ..generators.models import FileMetadata
+from ..generators.models import FileContext, FileMetadata
+from ..generators.accessibility import AccessibilityEngine, AccessibilityReport
+from ..generators.streaming import StreamingHtmlParser
+
+MISSING = object()
 
 class FileAnalyzer:
     """Handles file analysis and structure generation with improved security"""
@@ -15,25 +19,36 @@ class FileAnalyzer:
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
     BINARY_EXTENSIONS = {'.jpg', '.png', '.gif', '.ico', '.pdf', '.ttf', '.woff'}
     LOG_FILE = 'file_analysis.log'
+    LANDMARK_TAGS = ['header', 'nav', 'main', 'section', 'footer']
+    STREAM_CHUNK_SIZE = 64 * 1024
     
-    def __init__(self):
+    def __init__(self, cache: Optional[Any] = None, log_file: Optional[Path] = None):
+        """
+        Args:
+            cache: Optional store for analysis results with get(key, default)
+                and set(key, value), such as the 'file_analyzer' cache of
+                config.cache_manager
+            log_file: Also log to this file, e.g. LOG_FILE; by default logging
+                is left to the caller and nothing is written to disk
+        """
         self.logger = logging.getLogger(__name__)
-        self._setup_logging()
+        if log_file is not None:
+            self._setup_logging(Path(log_file))
         self._analyzed_files: Set[Path] = set()
+        self._accessibility = AccessibilityEngine.default()
+        self._cache = cache
     
-    def _get_file_metadata(self, file_path: Path) -> FileMetadata:
-        """Create FileMetadata instance for the given file"""
-        return FileMetadata(
-            path=file_path,
-            size=file_path.stat().st_size,
-            extension=file_path.suffix.lower(),
-            is_binary=file_path.suffix.lower() in self.BINARY_EXTENSIONS
+    def _get_file_metadata(self, context: FileContext) -> FileMetadata:
+        """Create FileMetadata instance from an open file context"""
+        return FileMetadata.from_context(
+            context,
+            is_binary=context.path.suffix.lower() in self.BINARY_EXTENSIONS
         )
     
-    def _setup_logging(self) -> None:
+    def _setup_logging(self, log_file: Path) -> None:
         """Configure logging with proper format and error handling"""
         try:
-            log_dir = os.path.dirname(self.LOG_FILE)
+            log_dir = os.path.dirname(log_file)
             if log_dir and not os.path.exists(log_dir):
                 os.makedirs(log_dir, exist_ok=True)
                 
@@ -42,7 +57,7 @@ class FileAnalyzer:
                 format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
                 handlers=[
                     logging.StreamHandler(),
-                    logging.FileHandler(self.LOG_FILE)
+                    logging.FileHandler(log_file)
                 ]
             )
         except (OSError, IOError) as e:
@@ -54,7 +69,6 @@ class FileAnalyzer:
             )
             self.logger.error(f"Failed to setup file logging: {str(e)}")
     
-    @lru_cache(maxsize=100)
     def analyze_html_file(self, file_path: Path) -> Dict[str, Any]:
         """
         Analyze HTML file with security measures
@@ -70,81 +84,165 @@ class FileAnalyzer:
             ValueError: If file is invalid
         """
         try:
-            safe_path = self._validate_file_path(file_path)
-            self._check_file_size(safe_path)
-            
-            # Create and validate file metadata
-            metadata = self._get_file_metadata(safe_path)
-            if not metadata.is_valid:
-                raise ValueError(f"Invalid file: {safe_path}")
-            
-            content = self._read_file_safely(safe_path)
-            soup = BeautifulSoup(content, 'html.parser', parser='html5lib')
+            with self._open_file(file_path) as context:
+                cache_key = self._cache_key(context)
+                if self._cache is not None:
+                    result = self._cache.get(cache_key, MISSING)
+                    if result is not MISSING:
+                        return result
+                
+                safe_path = self._validate_file_path(context)
+                self._check_file_size(context)
+                
+                # Create and validate file metadata
+                metadata = self._get_file_metadata(context)
+                if not metadata.is_valid:
+                    raise ValueError(f"Invalid file: {safe_path}")
+                
+                content = self._read_file_safely(context)
+            soup = BeautifulSoup(content, 'html.parser')
+            accessibility = self._analyze_accessibility(soup)
             
-            return {
+            result = {
                 'metadata': metadata,
                 'title': self._get_safe_title(soup),
                 'meta_description': self._get_safe_meta_description(soup),
-                'scripts': self._get_safe_scripts(soup),
-                'stylesheets': self._get_safe_stylesheets(soup),
+                'scripts': self.get_safe_scripts(soup),
+                'stylesheets': self.get_safe_stylesheets(soup),
                 'sections': self._get_safe_sections(soup),
                 'navigation': self._get_safe_navigation(soup),
-                'accessibility_score': self._analyze_accessibility(soup)
+                'accessibility_score': accessibility.score,
+                'accessibility_findings': accessibility.findings
             }
+            if self._cache is not None:
+                self._cache.set(cache_key, result)
+            return result
         except Exception as e:
             self.logger.error(f"Failed to analyze {file_path}: {str(e)}")
             raise
     
-    def _validate_file_path(self, file_path: Path) -> Path:
+    @staticmethod
+    def _cache_key(context: FileContext) -> str:
+        """Key results on the requested path and the identity and version from fstat"""
+        stat_result = context.stat_result
+        return (f"{context.requested_path}:{stat_result.st_dev}:{stat_result.st_ino}:"
+                f"{stat_result.st_size}:{stat_result.st_mtime_ns}")
+    
+    def analyze_html_stream(self, file_path: Path, chunk_size: int = STREAM_CHUNK_SIZE) -> Dict[str, Any]:
         """
-        Validate file path for security.
+        Analyze HTML file incrementally without building a DOM
+        
+        Produces the same keys as analyze_html_file. Peak memory is bounded
+        by chunk_size plus the extracted results, and the size limit is
+        enforced on bytes as they are read.
         
         Args:
-            file_path: Path to validate
+            file_path: Path to the HTML file
+            chunk_size: Number of bytes fed to the parser at a time
             
         Returns:
-            Validated and resolved path
+            Dict containing analyzed file information
+            
+        Raises:
+            SecurityError: If file violates security constraints
+            ValueError: If file is invalid
+        """
+        try:
+            with self._open_file(file_path) as context:
+                safe_path = self._validate_file_path(context)
+                self._check_file_size(context)
+                
+                metadata = self._get_file_metadata(context)
+                if not metadata.is_valid:
+                    raise ValueError(f"Invalid file: {safe_path}")
+                
+                parser = StreamingHtmlParser(self._accessibility.session())
+                self._stream_file_safely(context, parser, chunk_size)
+            
+            accessibility = parser.accessibility.report()
+            return {
+                'metadata': metadata,
+                'title': self._sanitize_text(parser.title if parser.title is not None else 'No title'),
+                'meta_description': self._sanitize_text(parser.meta_description or 'No description'),
+                'scripts': [src for src in parser.scripts if self.is_safe_url(src)],
+                'stylesheets': [href for href in parser.stylesheets if self.is_safe_url(href)],
+                'sections': parser.sections,
+                'navigation': self._sanitize_navigation(parser.navigation),
+                'accessibility_score': accessibility.score,
+                'accessibility_findings': accessibility.findings
+            }
+        except Exception as e:
+            self.logger.error(f"Failed to analyze {file_path}: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _open_file(file_path: Path) -> FileContext:
+        """
+        Open a file once for the whole analysis pipeline.
+        
+        Args:
+            file_path: Path to open
+            
+        Returns:
+            FileContext carrying the descriptor and its fstat result
             
         Raises:
             FileNotFoundError: If file doesn't exist
-            SecurityError: If file type is not allowed
-            OSError: If path resolution fails
+            OSError: If the file cannot be opened
         """
         try:
-            safe_path = Path(file_path).resolve(strict=True)
-            if not safe_path.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
+            return FileContext(file_path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {file_path}") from e
+        except OSError as e:
+            raise OSError(f"Failed to open {file_path}: {str(e)}") from e
+    
+    def _validate_file_path(self, context: FileContext) -> Path:
+        """
+        Validate file path for security.
+        
+        Args:
+            context: Open file to validate
             
-            if safe_path.suffix.lower() not in self.ALLOWED_EXTENSIONS:
-                raise SecurityError(f"Unsupported file type: {safe_path.suffix}")
+        Returns:
+            Validated and resolved path
             
-            return safe_path
+        Raises:
+            SecurityError: If file type is not allowed or it is not a regular file
+            OSError: If path resolution fails
+        """
+        try:
+            safe_path = context.path
         except OSError as e:
-            raise OSError(f"Failed to resolve path {file_path}: {str(e)}") from e
+            raise OSError(f"Failed to resolve path {context.requested_path}: {str(e)}") from e
+        
+        if not context.is_regular:
+            raise SecurityError(f"Not a regular file: {safe_path}")
+        
+        if safe_path.suffix.lower() not in self.ALLOWED_EXTENSIONS:
+            raise SecurityError(f"Unsupported file type: {safe_path.suffix}")
+        
+        return safe_path
     
-    def _check_file_size(self, file_path: Path) -> None:
+    def _check_file_size(self, context: FileContext) -> None:
         """
         Check file size against limits.
         
         Args:
-            file_path: Path to the file to check
+            context: Open file to check
             
         Raises:
             SecurityError: If file size exceeds MAX_FILE_SIZE
-            OSError: If file stat fails
         """
-        try:
-            if file_path.stat().st_size > self.MAX_FILE_SIZE:
-                raise SecurityError(f"File exceeds size limit: {file_path}")
-        except OSError as e:
-            raise OSError(f"Failed to check file size for {file_path}: {str(e)}") from e
+        if context.size > self.MAX_FILE_SIZE:
+            raise SecurityError(f"File exceeds size limit: {context.path}")
     
-    def _read_file_safely(self, file_path: Path) -> str:
+    def _read_file_safely(self, context: FileContext) -> str:
         """
         Read file content with security checks.
         
         Args:
-            file_path: Path to the file to read
+            context: Open file to read
             
         Returns:
             File content as string
@@ -155,37 +253,109 @@ class FileAnalyzer:
             IOError: If file reading fails
         """
         try:
-            with file_path.open('r', encoding='utf-8') as f:
-                content = f.read(self.MAX_FILE_SIZE + 1)
-                if len(content) > self.MAX_FILE_SIZE:
+            data = context.read(self.MAX_FILE_SIZE + 1)
+            if len(data) > self.MAX_FILE_SIZE:
+                raise SecurityError("File content exceeds size limit")
+            return data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise ValueError(f"File is not valid UTF-8: {context.path}") from e
+        except OSError as e:
+            raise IOError(f"Failed to read file {context.path}: {str(e)}") from e
+    
+    def _stream_file_safely(self, context: FileContext, parser: StreamingHtmlParser, chunk_size: int) -> None:
+        """
+        Feed file content to an incremental parser chunk by chunk.
+        
+        Args:
+            context: Open file to read
+            parser: Parser receiving decoded text
+            chunk_size: Number of bytes read per chunk
+            
+        Raises:
+            SecurityError: As soon as more than MAX_FILE_SIZE bytes are read
+            ValueError: If file is not valid UTF-8
+            IOError: If file reading fails
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        total = 0
+        try:
+            for chunk in context.iter_chunks(chunk_size):
+                total += len(chunk)
+                if total > self.MAX_FILE_SIZE:
                     raise SecurityError("File content exceeds size limit")
-                return content
+                parser.feed(decoder.decode(chunk))
+            parser.feed(decoder.decode(b'', final=True))
+            parser.close()
         except UnicodeDecodeError as e:
-            raise ValueError(f"File is not valid UTF-8: {file_path}") from e
-        except IOError as e:
-            raise IOError(f"Failed to read file {file_path}: {str(e)}") from e
+            raise ValueError(f"File is not valid UTF-8: {context.path}") from e
+        except OSError as e:
+            raise IOError(f"Failed to read file {context.path}: {str(e)}") from e
     
     def _get_safe_title(self, soup: BeautifulSoup) -> str:
         """Get sanitized page title"""
         title = soup.title.string if soup.title else 'No title'
         return self._sanitize_text(title)
     
+    def _get_safe_meta_description(self, soup: BeautifulSoup) -> str:
+        """Get sanitized meta description"""
+        meta = soup.find('meta', attrs={'name': 'description'})
+        description = meta.get('content') if meta else None
+        return self._sanitize_text(description or 'No description')
+    
+    def _get_safe_sections(self, soup: BeautifulSoup) -> List[str]:
+        """Get landmark section names in document order"""
+        return [section.name for section in soup.find_all(self.LANDMARK_TAGS)]
+    
+    def _get_safe_navigation(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+        """Get sanitized navigation link texts and targets"""
+        links = [
+            {'text': link.get_text(' ', strip=True), 'href': link.get('href', '')}
+            for nav in soup.find_all('nav')
+            for link in nav.find_all('a', href=True)
+        ]
+        return self._sanitize_navigation(links)
+    
+    def _sanitize_navigation(self, links: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Drop script/data links and sanitize navigation entries"""
+        safe_links = []
+        for link in links:
+            if urlparse(link['href']).scheme.lower() in {'javascript', 'data', 'vbscript'}:
+                continue
+            safe_links.append({
+                'text': self._sanitize_text(link['text']),
+                'href': self._sanitize_text(link['href'])
+            })
+        return safe_links
+    
+    def _analyze_accessibility(self, soup: BeautifulSoup) -> AccessibilityReport:
+        """Evaluate all accessibility rules in a single pass over the document"""
+        return self._accessibility.evaluate(soup)
+    
     @staticmethod
     def _sanitize_text(text: str) -> str:
         """Sanitize text content"""
         return re.sub(r'[<>&"\']', '', str(text))
     
-    def _get_safe_scripts(self, soup: BeautifulSoup) -> List[str]:
+    def get_safe_scripts(self, soup: BeautifulSoup) -> List[str]:
         """Get sanitized script sources"""
         scripts = []
         for script in soup.find_all('script', src=True):
             src = script.get('src', '')
-            if self._is_safe_url(src):
+            if self.is_safe_url(src):
                 scripts.append(src)
         return scripts
     
+    def get_safe_stylesheets(self, soup: BeautifulSoup) -> List[str]:
+        """Get sanitized stylesheet sources"""
+        stylesheets = []
+        for link in soup.find_all('link', rel='stylesheet', href=True):
+            href = link.get('href', '')
+            if self.is_safe_url(href):
+                stylesheets.append(href)
+        return stylesheets
+    
     @staticmethod
-    def _is_safe_url(url: str) -> bool:
+    def is_safe_url(url: str) -> bool:
         """
         Validate URL for security.
         
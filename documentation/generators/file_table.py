@@ -0,0 +1,229 @@
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+from array import array
+from collections import Counter
+from itertools import accumulate, islice
+import fnmatch
+import logging
+import os
+import posixpath
+import re
+
+class FileRow:
+    """Lightweight view of one FileTable row"""
+
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table: 'FileTable', index: int):
+        self.table = table
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return self.table.name_at(self.index)
+
+    @property
+    def directory(self) -> str:
+        return self.table.directories[self.table.directory_ids[self.index]]
+
+    @property
+    def relative_path(self) -> str:
+        directory = self.directory
+        return f"{directory}/{self.name}" if directory else self.name
+
+    @property
+    def size(self) -> int:
+        return self.table.sizes[self.index]
+
+    @property
+    def mtime_ns(self) -> int:
+        return self.table.mtimes[self.index]
+
+    @property
+    def extension(self) -> str:
+        return self.table.extensions[self.table.extension_ids[self.index]]
+
+    def __repr__(self) -> str:
+        return f"FileRow({self.relative_path!r}, size={self.size})"
+
+class FileTable:
+    """
+    Columnar, array-backed table of scanned files.
+
+    Sizes, mtimes, extension ids and directory ids live in typed arrays;
+    directory paths and extensions are interned once; file names are packed
+    into a single UTF-8 buffer. A row costs a few dozen bytes instead of a
+    dataclass instance with its own __dict__ and Path object.
+    """
+
+    IGNORE_DIRS = {'.git', '__pycache__', '.vscode', 'node_modules', '.pytest_cache', '.mypy_cache'}
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.sizes = array('q')
+        self.mtimes = array('q')
+        self.extension_ids = array('I')
+        self.directory_ids = array('I')
+        self.name_offsets = array('Q', [0])
+        self.names = bytearray()
+        self.extensions: List[str] = []
+        self.directories: List[str] = []
+        # Rows are appended one directory at a time, so each directory owns a contiguous run
+        self.directory_runs: Dict[int, range] = {}
+        self._extension_index: Dict[str, int] = {}
+        self._directory_index: Dict[str, int] = {}
+
+    @classmethod
+    def scan(cls, root: Path, ignore: Optional[Set[str]] = None,
+             ignore_files: Iterable[str] = ()) -> 'FileTable':
+        """
+        Walk a tree with os.scandir and fill the table.
+
+        Args:
+            root: Directory to scan
+            ignore: Directory names to skip, defaults to IGNORE_DIRS
+            ignore_files: File name patterns to skip, such as '*.pyc' or
+                'Thumbs.db' (fnmatch syntax)
+
+        Returns:
+            Populated FileTable
+        """
+        table = cls(Path(root).resolve())
+        ignore = cls.IGNORE_DIRS if ignore is None else ignore
+        # One combined regex, so each file name is matched once however many patterns there are
+        patterns = [fnmatch.translate(pattern) for pattern in ignore_files]
+        ignored_file = re.compile('|'.join(patterns)).match if patterns else None
+        stack = ['']
+        while stack:
+            relative = stack.pop()
+            directory = os.path.join(str(table.root), relative) if relative else str(table.root)
+            try:
+                with os.scandir(directory) as entries:
+                    files = []
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in ignore:
+                                stack.append(f"{relative}/{entry.name}" if relative else entry.name)
+                        elif entry.is_file() and not (ignored_file and ignored_file(entry.name)):
+                            files.append((entry.name, entry.stat()))
+            except OSError as e:
+                logging.getLogger(__name__).error(f"Error accessing directory {directory}: {str(e)}")
+                continue
+            table.extend(
+                relative,
+                [name for name, _ in files],
+                [stat_result.st_size for _, stat_result in files],
+                [stat_result.st_mtime_ns for _, stat_result in files]
+            )
+        return table
+
+    def append(self, directory: str, name: str, size: int, mtime_ns: int) -> None:
+        """Add a single row"""
+        self.extend(directory, [name], [size], [mtime_ns])
+
+    def extend(self, directory: str, names: List[str], sizes: List[int], mtimes: List[int]) -> None:
+        """
+        Add the rows of one directory in bulk.
+
+        Raises:
+            ValueError: If rows for this directory were added before but are
+                no longer at the end of the table
+        """
+        directory_id = self._intern_directory(directory)
+        row = len(self.sizes)
+        run = self.directory_runs.get(directory_id)
+        if run is not None and run.stop != row:
+            raise ValueError(f"Rows for directory {directory!r} must be contiguous")
+        self.directory_runs[directory_id] = range(run.start if run else row, row + len(names))
+
+        intern = self._intern_extension
+        encoded = [name.encode('utf-8', 'surrogateescape') for name in names]
+        self.sizes.extend(sizes)
+        self.mtimes.extend(mtimes)
+        self.extension_ids.extend([intern(posixpath.splitext(name)[1].lower()) for name in names])
+        self.directory_ids.extend([directory_id] * len(names))
+        # accumulate() starts with the current end offset, which is already stored
+        self.name_offsets.extend(islice(accumulate(map(len, encoded), initial=len(self.names)), 1, None))
+        self.names += b''.join(encoded)
+
+    def _intern_directory(self, directory: str) -> int:
+        directory_id = self._directory_index.get(directory)
+        if directory_id is None:
+            directory_id = self._directory_index[directory] = len(self.directories)
+            self.directories.append(directory)
+        return directory_id
+
+    def _intern_extension(self, extension: str) -> int:
+        extension_id = self._extension_index.get(extension)
+        if extension_id is None:
+            extension_id = self._extension_index[extension] = len(self.extensions)
+            self.extensions.append(extension)
+        return extension_id
+
+    def name_at(self, index: int) -> str:
+        start, end = self.name_offsets[index], self.name_offsets[index + 1]
+        return self.names[start:end].decode('utf-8', 'surrogateescape')
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def __getitem__(self, index: int) -> FileRow:
+        if not -len(self) <= index < len(self):
+            raise IndexError("FileTable index out of range")
+        return FileRow(self, index % len(self))
+
+    def __iter__(self) -> Iterator[FileRow]:
+        return (FileRow(self, index) for index in range(len(self)))
+
+    @property
+    def total_size(self) -> int:
+        return sum(self.sizes)
+
+    @property
+    def total_dirs(self) -> int:
+        """Number of scanned directories, excluding the root"""
+        return len(self.directories) - (1 if '' in self._directory_index else 0)
+
+    def extension_histogram(self) -> Dict[str, int]:
+        """Count files per extension, most common first"""
+        return {self.extensions[ext_id]: count for ext_id, count in Counter(self.extension_ids).most_common()}
+
+    def extension_sizes(self) -> Dict[str, int]:
+        """Sum file sizes per extension"""
+        totals = [0] * len(self.extensions)
+        for ext_id, size in zip(self.extension_ids, self.sizes):
+            totals[ext_id] += size
+        return {ext: totals[ext_id] for ext_id, ext in enumerate(self.extensions)}
+
+    def size_percentiles(self, percentiles: Iterable[float] = (50, 90, 99)) -> Dict[float, int]:
+        """Nearest-rank size percentiles over all files"""
+        ordered = sorted(self.sizes)
+        if not ordered:
+            return {p: 0 for p in percentiles}
+        last = len(ordered) - 1
+        return {p: ordered[min(last, max(0, round(p / 100 * last)))] for p in percentiles}
+
+    def directory_sizes(self, recursive: bool = False) -> Dict[str, int]:
+        """
+        Sum file sizes per directory.
+
+        Each directory's rows form one contiguous slice of the size column, so
+        every sum runs over an array slice rather than row by row.
+        """
+        totals = {
+            self.directories[dir_id]: sum(self.sizes[run.start:run.stop])
+            for dir_id, run in self.directory_runs.items()
+        }
+        for directory in self.directories:
+            totals.setdefault(directory, 0)
+        if recursive:
+            for directory in sorted(self.directories, key=lambda d: d.count('/'), reverse=True):
+                if directory:
+                    parent = posixpath.dirname(directory)
+                    totals[parent] = totals.get(parent, 0) + totals[directory]
+        return totals
+
+    def memory_footprint(self) -> int:
+        """Approximate bytes held by the columns and name buffer"""
+        columns = (self.sizes, self.mtimes, self.extension_ids, self.directory_ids, self.name_offsets)
+        return sum(column.itemsize * len(column) for column in columns) + len(self.names)
@@ -0,0 +1,165 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import logging
+import mmap
+import os
+import threading
+import time
+from .models import FileMetadata
+
+StatKey = Tuple[int, int, int, int]
+
+def stat_key(stat_result: os.stat_result) -> StatKey:
+    """Identity of a file version: (device, inode, size, mtime_ns)"""
+    return (stat_result.st_dev, stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+
+class HashingService:
+    """Content hashing with mmap, a thread pool and a persistent stat-keyed cache"""
+
+    CHUNK_SIZE = 1024 * 1024
+    DIGEST_SIZE = 16
+    # Files modified this recently may change again within the same mtime tick,
+    # so their digests are returned but not cached
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, cache_file: Optional[Path] = None, workers: Optional[int] = None):
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 2)
+        self.logger = logging.getLogger(__name__)
+        self._cache: Dict[StatKey, str] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._seen: Set[StatKey] = set()
+        self.hits = 0
+        self.misses = 0
+        self._load_cache()
+
+    def hash_file(self, path: Path) -> str:
+        """Get the content hash of a file, reading it only on a cache miss"""
+        digest = self._lookup(stat_key(os.stat(path)))
+        if digest is not None:
+            return digest
+        return self._hash_and_store(Path(path))
+
+    def cached_digest(self, path: Path) -> Optional[str]:
+        """Get a file's content hash if the cache already holds it, without reading the file"""
+        return self._lookup(stat_key(os.stat(path)))
+
+    def hash_many(self, paths: Iterable[Path]) -> Dict[Path, str]:
+        """
+        Hash many files, in parallel for the ones not already cached.
+
+        Args:
+            paths: Files to hash
+
+        Returns:
+            Mapping of path to hex digest
+        """
+        results: Dict[Path, str] = {}
+        pending: List[Path] = []
+        for path in paths:
+            path = Path(path)
+            digest = self._lookup(stat_key(os.stat(path)))
+            if digest is None:
+                pending.append(path)
+            else:
+                results[path] = digest
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for path, digest in zip(pending, executor.map(self._hash_and_store, pending)):
+                    results[path] = digest
+        return results
+
+    def annotate(self, metadata: Iterable[FileMetadata]) -> List[FileMetadata]:
+        """Fill in content_hash on FileMetadata entries"""
+        entries = list(metadata)
+        digests = self.hash_many(entry.path for entry in entries)
+        for entry in entries:
+            entry.content_hash = digests[entry.path]
+        return entries
+
+    @classmethod
+    def digest(cls, path: Path) -> str:
+        """Hash a file's content with BLAKE2b over an mmap, chunk by chunk"""
+        with open(path, 'rb') as f:
+            return cls._digest_open_file(f.fileno(), os.fstat(f.fileno()).st_size)
+
+    @classmethod
+    def _digest_open_file(cls, fd: int, size: int) -> str:
+        hasher = hashlib.blake2b(digest_size=cls.DIGEST_SIZE)
+        if size == 0:
+            return hasher.hexdigest()
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for offset in range(0, len(mapped), cls.CHUNK_SIZE):
+                    hasher.update(view[offset:offset + cls.CHUNK_SIZE])
+            finally:
+                view.release()
+        return hasher.hexdigest()
+
+    def _lookup(self, key: StatKey) -> Optional[str]:
+        with self._lock:
+            self._seen.add(key)
+            digest = self._cache.get(key)
+            if digest is not None:
+                self.hits += 1
+            return digest
+
+    def _hash_and_store(self, path: Path) -> str:
+        # The digest is stored under the stat of the descriptor it was read from,
+        # so a file replaced after the caller's stat is never cached under the old key
+        with open(path, 'rb') as f:
+            stat_result = os.fstat(f.fileno())
+            digest = self._digest_open_file(f.fileno(), stat_result.st_size)
+        key = stat_key(stat_result)
+        with self._lock:
+            self.misses += 1
+            self._seen.add(key)
+            if time.time_ns() - key[3] > self.RACY_WINDOW_NS:
+                self._cache[key] = digest
+                self._dirty = True
+        return digest
+
+    def save(self, prune: bool = False) -> None:
+        """
+        Persist the cache atomically.
+
+        Args:
+            prune: Drop entries for file versions not seen by this instance,
+                e.g. after a full-tree scan
+        """
+        if not self.cache_file or not (self._dirty or prune):
+            return
+        with self._lock:
+            if prune:
+                self._cache = {key: digest for key, digest in self._cache.items() if key in self._seen}
+            entries = [[*key, digest] for key, digest in self._cache.items()]
+            self._dirty = False
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.cache_file.with_suffix(self.cache_file.suffix + '.tmp')
+        with temp_file.open('w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'entries': entries}, f, separators=(',', ':'))
+        os.replace(temp_file, self.cache_file)
+
+    def _load_cache(self) -> None:
+        if not self.cache_file or not self.cache_file.exists():
+            return
+        try:
+            with self.cache_file.open('r', encoding='utf-8') as f:
+                data = json.load(f)
+            for dev, ino, size, mtime_ns, digest in data.get('entries', []):
+                self._cache[(dev, ino, size, mtime_ns)] = digest
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable hash cache {self.cache_file}: {str(e)}")
+            self._cache.clear()
+
+    def __enter__(self) -> 'HashingService':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.save()
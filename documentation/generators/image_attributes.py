@@ -0,0 +1,241 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from urllib.parse import unquote, urlsplit
+import json
+import logging
+import os
+import re
+
+from PIL import Image, UnidentifiedImageError
+
+from .hashing import HashingService
+
+# An <img> start tag; quoted attribute values may contain '>'
+IMG_TAG = re.compile(r'<img\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>', re.IGNORECASE)
+ATTRIBUTE = re.compile(r'([^\s"\'<>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'=<>`]+)))?')
+# Regions that are always above the fold, where lazy loading only delays paint
+EAGER_REGION = re.compile(r'<(nav|header)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+MAIN_REGION = re.compile(r'<main\b.*?</main\s*>', re.IGNORECASE | re.DOTALL)
+
+@dataclass
+class RewriteResult:
+    files: List[str] = field(default_factory=list)
+    rewritten: List[str] = field(default_factory=list)
+    images: int = 0
+    updated_tags: int = 0
+    # src values that could not be measured (missing, remote, SVG, unreadable)
+    unresolved: Dict[str, List[str]] = field(default_factory=dict)
+
+class ImageAttributeRewriter:
+    """
+    Adds intrinsic width/height, loading="lazy" and decoding="async" to <img> tags.
+
+    Only the tag text is changed, by inserting attributes before its closing
+    bracket; everything else in the file stays byte-identical, and
+    attributes already present are never overwritten. A tag with only one
+    dimension gets the other scaled to the image's aspect ratio. Dimensions
+    come from Image.open, which parses just the file header, and are cached
+    by content hash; the hashes are cached by file stat in HASH_CACHE_NAME,
+    so a rerun over unchanged images reads no image data.
+
+    Images likely to be above the fold are not lazy-loaded: those inside
+    <nav> and <header>, and the first eager_images images inside <main>.
+    """
+
+    CACHE_NAME = '.image-dimensions.json'
+    HASH_CACHE_NAME = '.hash-cache.json'
+    EAGER_IMAGES = 4
+
+    def __init__(self, project_root: Path, cache_file: Optional[Path] = None,
+                 hashing: Optional[HashingService] = None, eager_images: int = EAGER_IMAGES):
+        self.project_root = Path(project_root).resolve()
+        self.cache_file = Path(cache_file) if cache_file else self.project_root / self.CACHE_NAME
+        self.hashing = hashing or HashingService(self.project_root / self.HASH_CACHE_NAME)
+        self.eager_images = eager_images
+        self.logger = logging.getLogger(__name__)
+        self._dimensions: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._cache_dirty = False
+        self._load_cache()
+
+    def dimensions(self, image_path: Path) -> Optional[Tuple[int, int]]:
+        """Pixel size of an image, or None if it cannot be read"""
+        try:
+            digest = self.hashing.hash_file(image_path)
+        except OSError:
+            return None
+        if digest in self._dimensions:
+            return self._dimensions[digest]
+        try:
+            with Image.open(image_path) as image:
+                size = image.size
+        except (OSError, UnidentifiedImageError):
+            size = None
+        self._dimensions[digest] = size
+        self._cache_dirty = True
+        return size
+
+    def rewrite(self, html: str, base_dir: Path, eager_images: Optional[int] = None) -> Tuple[str, int, List[str], int]:
+        """
+        Rewrite every <img> tag in a document.
+
+        Args:
+            html: Document text
+            base_dir: Directory that relative src values resolve against
+            eager_images: Leading images in <main> left without
+                loading="lazy", defaults to the rewriter's eager_images
+
+        Returns:
+            New text, number of tags changed, unresolved src values and the
+            number of <img> tags seen
+        """
+        eager = [match.span() for match in EAGER_REGION.finditer(html)]
+        main = [match.span() for match in MAIN_REGION.finditer(html)]
+        eager_budget = self.eager_images if eager_images is None else eager_images
+        parts = []
+        position = 0
+        updated = 0
+        unresolved = []
+        tags = 0
+        for match in IMG_TAG.finditer(html):
+            tags += 1
+            tag = match.group(0)
+            in_eager_region = any(start <= match.start() < end for start, end in eager)
+            if not in_eager_region and eager_budget > 0 and \
+                    any(start <= match.start() < end for start, end in main):
+                eager_budget -= 1
+                in_eager_region = True
+            new_tag, missing = self._rewrite_tag(tag, base_dir, in_eager_region)
+            if missing:
+                unresolved.append(missing)
+            if new_tag != tag:
+                parts.append(html[position:match.start()])
+                parts.append(new_tag)
+                position = match.end()
+                updated += 1
+        parts.append(html[position:])
+        return ''.join(parts), updated, unresolved, tags
+
+    def _rewrite_tag(self, tag: str, base_dir: Path, eager: bool) -> Tuple[str, Optional[str]]:
+        body = tag[4:-1]
+        self_closing = body.rstrip().endswith('/')
+        attributes = {}
+        for name, double, single, bare in ATTRIBUTE.findall(body.rstrip().rstrip('/')):
+            attributes.setdefault(name.lower(), double or single or bare)
+
+        additions = []
+        unresolved = None
+        if 'width' not in attributes or 'height' not in attributes:
+            src = attributes.get('src', '')
+            size = self._measure(src, base_dir)
+            if size is None:
+                unresolved = src
+            else:
+                width, height = size
+                if 'width' in attributes and attributes['width'].isdigit():
+                    additions.append(f'height="{round(int(attributes["width"]) * height / width)}"')
+                elif 'height' in attributes and attributes['height'].isdigit():
+                    additions.insert(0, f'width="{round(int(attributes["height"]) * width / height)}"')
+                elif 'width' not in attributes and 'height' not in attributes:
+                    additions.extend([f'width="{width}"', f'height="{height}"'])
+        if 'loading' not in attributes and not eager:
+            additions.append('loading="lazy"')
+        if 'decoding' not in attributes:
+            additions.append('decoding="async"')
+        if not additions:
+            return tag, unresolved
+
+        head = tag[:-2] if self_closing and tag.endswith('/>') else tag[:-1]
+        stripped = head.rstrip()
+        closing = tag[len(stripped):]
+        return f"{stripped} {' '.join(additions)}{closing}", unresolved
+
+    def _measure(self, src: str, base_dir: Path) -> Optional[Tuple[int, int]]:
+        parts = urlsplit(src)
+        if not src or parts.scheme or parts.netloc or src.startswith('data:'):
+            return None
+        relative = unquote(parts.path)
+        path = (self.project_root / relative.lstrip('/')) if relative.startswith('/') else base_dir / relative
+        path = path.resolve()
+        if not path.is_relative_to(self.project_root) or not path.is_file():
+            return None
+        size = self.dimensions(path)
+        # Zero-sized images would make the aspect-ratio arithmetic divide by zero
+        return size if size and size[0] and size[1] else None
+
+    def rewrite_files(self, files: List[Tuple[Path, Path]]) -> RewriteResult:
+        """
+        Rewrite HTML files in place, writing only those that change.
+
+        Args:
+            files: (HTML file, directory its relative src values resolve against)
+        """
+        result = RewriteResult()
+        for path, base_dir in files:
+            relative = path.relative_to(self.project_root).as_posix()
+            result.files.append(relative)
+            data = path.read_bytes()
+            # surrogateescape round-trips any bytes that are not valid UTF-8
+            html = data.decode('utf-8', 'surrogateescape')
+            new_html, updated, unresolved, tags = self.rewrite(html, base_dir)
+            result.images += tags
+            result.updated_tags += updated
+            if unresolved:
+                result.unresolved[relative] = unresolved
+            if updated:
+                temp_file = path.with_suffix(path.suffix + '.tmp')
+                temp_file.write_bytes(new_html.encode('utf-8', 'surrogateescape'))
+                os.replace(temp_file, path)
+                result.rewritten.append(relative)
+        self._save_cache()
+        self.hashing.save()
+        self.logger.info(
+            f"Image attributes: {result.updated_tags} of {result.images} <img> tags updated "
+            f"in {len(result.rewritten)} of {len(result.files)} files"
+        )
+        return result
+
+    def site_files(self) -> List[Tuple[Path, Path]]:
+        """
+        Root pages plus the template sources they are built from.
+
+        Template sources are rewritten too, so the next site build produces
+        the same markup. Their src values resolve against the site root,
+        where the built pages live.
+        """
+        files = [(path, self.project_root) for path in sorted(self.project_root.glob('*.html'))]
+        templates = self.project_root / 'templates'
+        files.extend((path, self.project_root) for path in sorted(templates.rglob('*.html')))
+        return files
+
+    def _load_cache(self) -> None:
+        if not self.cache_file.exists():
+            return
+        try:
+            with self.cache_file.open('r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._dimensions = {digest: tuple(size) if size else None for digest, size in data.get('images', {}).items()}
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable dimension cache {self.cache_file}: {str(e)}")
+            self._dimensions = {}
+
+    def _save_cache(self) -> None:
+        if not self._cache_dirty:
+            return
+        temp_file = self.cache_file.with_suffix('.json.tmp')
+        with temp_file.open('w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'images': {d: list(s) if s else None for d, s in self._dimensions.items()}}, f)
+        os.replace(temp_file, self.cache_file)
+        self._cache_dirty = False
+
+if __name__ == '__main__':
+    import time
+
+    logging.basicConfig(level=logging.INFO)
+    project_root = Path(__file__).resolve().parents[2]
+    started = time.perf_counter()
+    rewriter = ImageAttributeRewriter(project_root)
+    result = rewriter.rewrite_files(rewriter.site_files())
+    for page, sources in sorted(result.unresolved.items()):
+        rewriter.logger.warning(f"{page}: no dimensions for {', '.join(sorted(set(sources)))}")
+    rewriter.logger.info(f"Finished in {time.perf_counter() - started:.3f}s")
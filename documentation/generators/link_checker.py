@@ -0,0 +1,132 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
+import logging
+import os
+from ..generators.site_index import PathIndex
+
+LINK_TAGS = ['a', 'link', 'script', 'img', 'source', 'audio', 'video', 'iframe', 'embed', 'track']
+LINK_ATTRIBUTES = ('href', 'src')
+
+def extract_page_links(page_path: str) -> List[str]:
+    """
+    Extract raw href/src values from a single HTML page.
+
+    Kept at module level so it can be shipped to worker processes.
+    """
+    with open(page_path, 'r', encoding='utf-8', errors='replace') as f:
+        soup = BeautifulSoup(f.read(), 'html.parser', parse_only=SoupStrainer(LINK_TAGS))
+    links = []
+    for tag in soup.find_all(LINK_TAGS):
+        for attr in LINK_ATTRIBUTES:
+            value = tag.get(attr)
+            if value:
+                links.append(value)
+    return links
+
+@dataclass
+class BrokenLink:
+    """A reference whose target is not present in the path index"""
+    source: str
+    reference: str
+    target: str
+
+@dataclass
+class LinkReport:
+    """Site-wide link graph and the problems found in it"""
+    pages: List[str]
+    edges: Dict[str, Set[str]] = field(default_factory=dict)
+    broken: List[BrokenLink] = field(default_factory=list)
+    external: Dict[str, Set[str]] = field(default_factory=dict)
+
+    @property
+    def out_degree(self) -> Dict[str, int]:
+        """Number of distinct pages each page links to"""
+        return {page: len(self.edges.get(page, ())) for page in self.pages}
+
+    @property
+    def in_degree(self) -> Dict[str, int]:
+        """Number of distinct pages linking to each page"""
+        degree = dict.fromkeys(self.pages, 0)
+        for targets in self.edges.values():
+            for target in targets:
+                if target in degree:
+                    degree[target] += 1
+        return degree
+
+    def orphans(self, entry_points: Tuple[str, ...] = ('index.html',)) -> List[str]:
+        """Pages no other page links to, excluding the site entry points"""
+        in_degree = self.in_degree
+        return sorted(p for p in self.pages if in_degree[p] == 0 and p not in entry_points)
+
+    def format(self) -> List[str]:
+        """Render the report as Markdown lines"""
+        in_degree, out_degree = self.in_degree, self.out_degree
+        lines = ["## Link Report\n", "### Pages\n"]
+        lines.extend(f"- {page}: in {in_degree[page]}, out {out_degree[page]}" for page in self.pages)
+        lines.append("\n### Broken Links\n")
+        lines.extend(f"- {b.source}: {b.reference}" for b in self.broken)
+        if not self.broken:
+            lines.append("- None")
+        lines.append("\n### Orphan Pages\n")
+        lines.extend(f"- {page}" for page in self.orphans() or ['None'])
+        return lines
+
+class LinkChecker:
+    """Builds a link graph for all HTML pages and reports dead links"""
+
+    def __init__(self, project_root: Path, index: Optional[PathIndex] = None, workers: Optional[int] = None):
+        self.project_root = Path(project_root).resolve()
+        self.index = index or PathIndex.build(self.project_root)
+        self.workers = workers or os.cpu_count() or 1
+        self.logger = logging.getLogger(__name__)
+
+    def discover_pages(self) -> List[str]:
+        """Get the HTML pages in the site root, as relative paths"""
+        return sorted(p for p in self.index.with_suffix('.html') if '/' not in p)
+
+    def check(self, pages: Optional[List[str]] = None) -> LinkReport:
+        """
+        Parse every page once and build the link report.
+
+        Args:
+            pages: Relative page paths to check, defaults to all root pages
+
+        Returns:
+            LinkReport with graph, broken links and external references
+        """
+        pages = sorted(pages) if pages is not None else self.discover_pages()
+        report = LinkReport(pages=pages)
+        page_set = set(pages)
+
+        for page, links in zip(pages, self._extract_all(pages)):
+            targets = report.edges.setdefault(page, set())
+            for reference in links:
+                target = PathIndex.resolve(page, reference)
+                if target is None:
+                    report.external.setdefault(page, set()).add(reference)
+                elif target not in self.index:
+                    report.broken.append(BrokenLink(page, reference, target))
+                elif target in page_set and target != page:
+                    targets.add(target)
+
+        self.logger.info(
+            f"Checked {len(pages)} pages: {len(report.broken)} broken links, "
+            f"{len(report.orphans())} orphan pages"
+        )
+        return report
+
+    def _extract_all(self, pages: List[str]) -> List[List[str]]:
+        """Extract links from all pages, in parallel when worthwhile"""
+        paths = [str(self.project_root / page) for page in pages]
+        if self.workers <= 1 or len(paths) < 2 * self.workers:
+            return [extract_page_links(path) for path in paths]
+        chunksize = max(1, len(paths) // (self.workers * 4))
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(extract_page_links, paths, chunksize=chunksize))
+
+if __name__ == '__main__':
+    project_root = Path(__file__).resolve().parents[2]
+    print('\n'.join(LinkChecker(project_root).check().format()))
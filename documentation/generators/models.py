@@ -1,5 +1,8 @@
 from pathlib import Path
 from dataclasses import dataclass
+from typing import Iterator, Optional
+import os
+import stat
 
 @dataclass
 class FileMetadata:
@@ -8,6 +11,9 @@ class FileMetadata:
     size: int
     extension: str
     is_binary: bool
+    mtime_ns: Optional[int] = None
+    is_regular: Optional[bool] = None
+    content_hash: Optional[str] = None
     
     def __post_init__(self):
         if self.size < 0:
@@ -21,12 +27,27 @@ class FileMetadata:
         if not isinstance(self.is_binary, bool):
             raise TypeError("is_binary must be a boolean")
 
+    @classmethod
+    def from_context(cls, context: 'FileContext', is_binary: bool) -> 'FileMetadata':
+        """Create metadata from an open file context without touching the filesystem"""
+        return cls(
+            path=context.path,
+            size=context.size,
+            extension=context.path.suffix.lower(),
+            is_binary=is_binary,
+            mtime_ns=context.mtime_ns,
+            is_regular=context.is_regular
+        )
+
     @property
     def is_valid(self) -> bool:
         """Check if file metadata represents a valid file"""
+        if self.is_regular is None:
+            is_file = self.path.exists() and self.path.is_file()
+        else:
+            is_file = self.is_regular
         return (
-            self.path.exists() and 
-            self.path.is_file() and
+            is_file and
             self.size > 0 and 
             len(self.extension) > 1
         )
@@ -42,8 +63,90 @@ class FileMetadata:
     @property
     def formatted_size(self) -> str:
         """Get human-readable file size"""
+        size = self.size
         for unit in ['B', 'KB', 'MB', 'GB']:
-            if self.size < 1024:
-                return f"{self.size:.1f}{unit}"
-            self.size /= 1024
-        return f"{self.size:.1f}TB"
+            if size < 1024:
+                return f"{size:.1f}{unit}"
+            size /= 1024
+        return f"{size:.1f}TB"
+
+
+class FileContext:
+    """
+    An open file and the fstat() taken from its descriptor.
+
+    Opening first and stat-ing the descriptor replaces the separate resolve,
+    exists, is_file and stat calls of a path-based pipeline, and guarantees
+    every check sees the same file that is eventually read.
+    """
+
+    OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_NONBLOCK', 0) | getattr(os, 'O_BINARY', 0)
+
+    def __init__(self, path: Path):
+        self.requested_path = Path(path)
+        self.fd = os.open(self.requested_path, self.OPEN_FLAGS)
+        try:
+            self.stat_result = os.fstat(self.fd)
+        except OSError:
+            os.close(self.fd)
+            raise
+        self._path: Optional[Path] = None
+
+    @property
+    def path(self) -> Path:
+        """Canonical path of the open file, resolved from the descriptor where possible"""
+        if self._path is None:
+            try:
+                self._path = Path(os.readlink(f'/proc/self/fd/{self.fd}'))
+            except OSError:
+                self._path = self.requested_path.resolve(strict=True)
+        return self._path
+
+    @property
+    def size(self) -> int:
+        return self.stat_result.st_size
+
+    @property
+    def mtime_ns(self) -> int:
+        return self.stat_result.st_mtime_ns
+
+    @property
+    def is_regular(self) -> bool:
+        return stat.S_ISREG(self.stat_result.st_mode)
+
+    def read(self, limit: int) -> bytes:
+        """
+        Read up to limit bytes from the descriptor.
+
+        The first read is sized from fstat, so a file that has not grown since
+        it was opened is read with a single call.
+        """
+        request = min(limit, self.size + 1)
+        chunks, remaining = [], limit
+        while remaining > 0:
+            chunk = os.read(self.fd, min(request, remaining))
+            chunks.append(chunk)
+            remaining -= len(chunk)
+            if len(chunk) < request:
+                break
+            request = 1024 * 1024
+        return b''.join(chunks)
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        """Yield the remaining file content in chunks of at most chunk_size bytes"""
+        while True:
+            chunk = os.read(self.fd, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self) -> 'FileContext':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
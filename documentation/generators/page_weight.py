@@ -0,0 +1,229 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+from dataclasses import dataclass, field
+from bs4 import BeautifulSoup
+import logging
+import sys
+from ..generators.asset_index import CSS_URL_PATTERN
+from ..generators.file_analyzer import FileAnalyzer
+from ..generators.site_index import PathIndex
+
+# Tag -> attributes whose values are fetched when the page loads
+RESOURCE_ATTRIBUTES = {
+    'img': ('src',),
+    'script': ('src',),
+    'audio': ('src',),
+    'video': ('src', 'poster'),
+    'source': ('src',),
+    'track': ('src',),
+    'embed': ('src',),
+    'iframe': ('src',),
+}
+LINK_RELS = {'stylesheet', 'icon', 'shortcut', 'preload', 'apple-touch-icon', 'manifest'}
+
+@dataclass
+class PageBudget:
+    """Weight thresholds applied to every page, with optional per-page overrides"""
+    max_bytes: int = 1_500_000
+    max_third_party: Optional[int] = None
+    overrides: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PageBudget':
+        """Create a budget from a config mapping such as a YAML section"""
+        return cls(
+            max_bytes=int(data.get('max_bytes', cls.max_bytes)),
+            max_third_party=data.get('max_third_party'),
+            overrides={page: int(limit) for page, limit in data.get('overrides', {}).items()}
+        )
+
+    def limit_for(self, page: str) -> int:
+        return self.overrides.get(page, self.max_bytes)
+
+@dataclass
+class PageWeight:
+    """Transferred bytes for one page, split by origin and resource type"""
+    page: str
+    html_bytes: int
+    first_party: Dict[str, int] = field(default_factory=dict)
+    third_party: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    by_type: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_bytes(self) -> int:
+        return self.html_bytes + sum(self.first_party.values())
+
+class PageWeightReport:
+    """Computes per-page weight from a single size index and checks it against a budget"""
+
+    TYPE_BY_EXTENSION = {
+        '.js': 'scripts', '.css': 'stylesheets',
+        '.mp3': 'sounds', '.ogg': 'sounds', '.wav': 'sounds',
+        '.woff': 'fonts', '.woff2': 'fonts', '.ttf': 'fonts', '.otf': 'fonts',
+    }
+
+    def __init__(self, project_root: Path, budget: Optional[PageBudget] = None,
+                 index: Optional[PathIndex] = None, analyzer: Optional[FileAnalyzer] = None):
+        self.project_root = Path(project_root).resolve()
+        self.budget = budget or PageBudget()
+        self.index = index or PathIndex.build(self.project_root)
+        self.analyzer = analyzer or FileAnalyzer()
+        self.logger = logging.getLogger(__name__)
+        self._stylesheet_refs: Dict[str, Set[str]] = {}
+
+    def measure(self, pages: Optional[List[str]] = None) -> List[PageWeight]:
+        """
+        Compute the weight of each page.
+
+        Args:
+            pages: Relative page paths, defaults to all root HTML pages
+
+        Returns:
+            PageWeight for every page, in page order
+        """
+        pages = pages if pages is not None else sorted(p for p in self.index.with_suffix('.html') if '/' not in p)
+        return [self._measure_page(page) for page in pages]
+
+    def over_budget(self, weights: List[PageWeight]) -> List[str]:
+        """Get a failure message for every page exceeding the budget"""
+        failures = []
+        for weight in weights:
+            limit = self.budget.limit_for(weight.page)
+            if weight.total_bytes > limit:
+                failures.append(f"{weight.page}: {weight.total_bytes} bytes exceeds budget of {limit}")
+            max_third = self.budget.max_third_party
+            if max_third is not None and len(weight.third_party) > max_third:
+                failures.append(
+                    f"{weight.page}: {len(weight.third_party)} third-party requests exceeds budget of {max_third}"
+                )
+        return failures
+
+    def enforce(self, pages: Optional[List[str]] = None) -> List[PageWeight]:
+        """
+        Measure pages and fail when any is over budget.
+
+        Raises:
+            BudgetExceededError: If one or more pages exceed the budget
+        """
+        weights = self.measure(pages)
+        failures = self.over_budget(weights)
+        if failures:
+            raise BudgetExceededError('\n'.join(failures))
+        return weights
+
+    @staticmethod
+    def format(weights: List[PageWeight]) -> List[str]:
+        """Render weights as Markdown lines"""
+        lines = ["## Page Weight\n"]
+        for weight in sorted(weights, key=lambda w: w.total_bytes, reverse=True):
+            types = ', '.join(f"{kind} {size}" for kind, size in sorted(weight.by_type.items()))
+            lines.append(
+                f"- {weight.page}: {weight.total_bytes} bytes "
+                f"({len(weight.first_party) + 1} first-party, {len(weight.third_party)} third-party; {types})"
+            )
+        return lines
+
+    def _measure_page(self, page: str) -> PageWeight:
+        """Collect every resource a page loads and sum their indexed sizes"""
+        content = (self.project_root / page).read_text(encoding='utf-8', errors='replace')
+        soup = BeautifulSoup(content, 'html.parser')
+        weight = PageWeight(page=page, html_bytes=self.index.size_of(page))
+        weight.third_party = sorted(set(
+            self.analyzer.get_safe_scripts(soup) + self.analyzer.get_safe_stylesheets(soup)
+        ))
+
+        targets: Set[str] = set()
+        for reference in self._page_references(soup):
+            target = PathIndex.resolve(page, reference)
+            if target is None:
+                if FileAnalyzer.is_safe_url(reference) and reference not in weight.third_party:
+                    weight.third_party.append(reference)
+            elif target:
+                targets.add(target)
+        for target in list(targets):
+            if target.endswith('.css'):
+                targets |= self._stylesheet_references(target)
+
+        for target in sorted(targets):
+            if target not in self.index:
+                weight.missing.append(target)
+                continue
+            size = self.index.size_of(target)
+            weight.first_party[target] = size
+            kind = self.TYPE_BY_EXTENSION.get(Path(target).suffix.lower(), 'images')
+            weight.by_type[kind] = weight.by_type.get(kind, 0) + size
+        return weight
+
+    @staticmethod
+    def _page_references(soup: BeautifulSoup) -> List[str]:
+        """Get the raw URLs of resources the browser fetches for a page"""
+        references = []
+        for tag in soup.find_all(list(RESOURCE_ATTRIBUTES) + ['link']):
+            if tag.name == 'link':
+                if LINK_RELS & {rel.lower() for rel in tag.get('rel', ())} and tag.get('href'):
+                    references.append(tag['href'])
+                continue
+            for attr in RESOURCE_ATTRIBUTES[tag.name]:
+                if tag.get(attr):
+                    references.append(tag[attr])
+            if tag.get('srcset'):
+                references.extend(part.split()[0] for part in tag['srcset'].split(',') if part.strip())
+        for tag in soup.find_all(style=True):
+            references.extend(m.group(2) for m in CSS_URL_PATTERN.finditer(tag['style']) if m.group(2))
+        return references
+
+    def _stylesheet_references(self, stylesheet: str) -> Set[str]:
+        """Get local url()/@import targets of a stylesheet, cached across pages"""
+        if stylesheet not in self._stylesheet_refs:
+            refs = set()
+            if stylesheet in self.index:
+                text = (self.project_root / stylesheet).read_text(encoding='utf-8', errors='replace')
+                for match in CSS_URL_PATTERN.finditer(text):
+                    target = PathIndex.resolve(stylesheet, match.group(2) or match.group(4))
+                    if target:
+                        refs.add(target)
+            self._stylesheet_refs[stylesheet] = refs
+        return self._stylesheet_refs[stylesheet]
+
+class BudgetExceededError(Exception):
+    """Raised when one or more pages exceed the configured weight budget"""
+    pass
+
+if __name__ == '__main__':
+    import argparse
+    import yaml
+    from config.cache_manager import configure, get_cache_manager
+    from config.config_manager import ConfigManager, ConfigurationError
+
+    parser = argparse.ArgumentParser(description='Report page weight and check it against a budget')
+    parser.add_argument('--budget', type=Path,
+                        help='YAML file with max_bytes, max_third_party and per-page overrides')
+    parser.add_argument('--max-bytes', type=int, help='Default per-page limit, overriding the budget file')
+    parser.add_argument('--max-third-party', type=int, help='Third-party request limit, overriding the budget file')
+    args = parser.parse_args()
+    budget_settings = {}
+    if args.budget:
+        with args.budget.open('r', encoding='utf-8') as f:
+            budget_settings = yaml.safe_load(f) or {}
+    for name in ('max_bytes', 'max_third_party'):
+        if getattr(args, name) is not None:
+            budget_settings[name] = getattr(args, name)
+
+    project_root = Path(__file__).resolve().parents[2]
+    try:
+        cache_manager = configure(ConfigManager(project_root / 'config').config, project_root)
+    except (ConfigurationError, ValueError):
+        # No project configuration: analysis results are cached with the defaults
+        cache_manager = get_cache_manager()
+    report = PageWeightReport(
+        project_root,
+        budget=PageBudget.from_dict(budget_settings),
+        analyzer=FileAnalyzer(cache=cache_manager.cache('file_analyzer'))
+    )
+    weights = report.measure()
+    print('\n'.join(report.format(weights)))
+    failures = report.over_budget(weights)
+    if failures:
+        print('\n'.join(failures), file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,179 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+import gzip
+import json
+import logging
+import os
+from ..generators.hashing import HashingService
+from ..generators.site_index import PathIndex
+
+COMPRESSIBLE_EXTENSIONS = ('.html', '.css', '.js', '.json', '.svg', '.txt', '.xml', '.map', '.ico')
+
+def compress_file(source: str, level: int = 9) -> int:
+    """
+    Write source.gz next to source and return its size.
+
+    The gzip header carries no file name or timestamp, so unchanged input
+    always yields byte-identical output. The .gz file gets the source's
+    mtime, which servers compare when choosing the precompressed variant.
+    """
+    target = source + '.gz'
+    temp_file = f"{target}.{os.getpid()}.tmp"
+    with open(source, 'rb') as f:
+        data = f.read()
+    with open(temp_file, 'wb') as raw:
+        with gzip.GzipFile(filename='', mode='wb', compresslevel=level, fileobj=raw, mtime=0) as compressed:
+            compressed.write(data)
+    stat_result = os.stat(source)
+    os.utime(temp_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+    os.replace(temp_file, target)
+    return os.path.getsize(target)
+
+@dataclass
+class PrecompressResult:
+    compressed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    # Files whose .gz would not be smaller, so none is kept
+    incompressible: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    manifest: Dict[str, Dict] = field(default_factory=dict)
+
+    @property
+    def original_bytes(self) -> int:
+        return sum(entry['size'] for entry in self.manifest.values())
+
+    @property
+    def compressed_bytes(self) -> int:
+        return sum(entry['gzip_size'] or entry['size'] for entry in self.manifest.values())
+
+class Precompressor:
+    """
+    Writes maximum-level .gz siblings of static text assets for a web
+    server's static gzip mode (e.g. nginx gzip_static).
+
+    Content hashes from the previous run are kept in a manifest, together
+    with original and compressed sizes; files whose hash is unchanged and
+    whose .gz still exists are skipped. Compression runs in a process pool.
+    """
+
+    MANIFEST_NAME = 'precompress-manifest.json'
+    # Below this size the gzip header and trailer outweigh any saving
+    MIN_SIZE = 256
+    EXCLUDE_DIRS = ('documentation/', 'database/', 'config/', 'auth/', 'dist/', 'templates/')
+
+    def __init__(self, project_root: Path, index: Optional[PathIndex] = None, level: int = 9,
+                 workers: Optional[int] = None, manifest_file: Optional[Path] = None):
+        self.project_root = Path(project_root).resolve()
+        self.index = index or PathIndex.build(self.project_root)
+        self.level = level
+        self.workers = workers or os.cpu_count() or 1
+        self.manifest_file = Path(manifest_file) if manifest_file else self.project_root / self.MANIFEST_NAME
+        self.logger = logging.getLogger(__name__)
+
+    def discover(self) -> List[str]:
+        """Relative paths of compressible assets served from the site root"""
+        return sorted(
+            path for path in self.index.with_suffix(*COMPRESSIBLE_EXTENSIONS)
+            if not path.startswith(self.EXCLUDE_DIRS) and path != self.MANIFEST_NAME
+            and not any(part.startswith('.') for part in path.split('/'))
+            and self.index.size_of(path) >= self.MIN_SIZE
+        )
+
+    def run(self, paths: Optional[List[str]] = None) -> PrecompressResult:
+        """
+        Compress changed assets, drop stale .gz files and write the manifest.
+
+        Args:
+            paths: Relative paths to consider, defaults to discover()
+
+        Returns:
+            What was compressed, skipped and removed, plus the new manifest
+        """
+        paths = self.discover() if paths is None else sorted(paths)
+        previous = self._load_manifest()
+        digests = HashingService().hash_many(self.project_root / path for path in paths)
+        result = PrecompressResult()
+
+        pending: List[Tuple[str, str]] = []
+        for path in paths:
+            source = self.project_root / path
+            digest = digests[source]
+            entry = previous.get(path)
+            gz_exists = Path(f"{source}.gz").exists()
+            if entry and entry['hash'] == digest and entry['level'] == self.level and \
+                    (gz_exists or entry['gzip_size'] is None):
+                result.manifest[path] = entry
+                result.unchanged.append(path)
+            else:
+                pending.append((path, digest))
+
+        if pending:
+            sources = [str(self.project_root / path) for path, _ in pending]
+            levels = [self.level] * len(sources)
+            if self.workers <= 1 or len(sources) == 1:
+                sizes = list(map(compress_file, sources, levels))
+            else:
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(sources))) as executor:
+                    sizes = list(executor.map(compress_file, sources, levels))
+            for (path, digest), gzip_size in zip(pending, sizes):
+                size = self.index.size_of(path) or (self.project_root / path).stat().st_size
+                if gzip_size >= size:
+                    # Serving the original is cheaper; don't leave a larger variant behind
+                    Path(f"{self.project_root / path}.gz").unlink()
+                    result.incompressible.append(path)
+                    gzip_size = None
+                else:
+                    result.compressed.append(path)
+                result.manifest[path] = {'hash': digest, 'level': self.level, 'size': size, 'gzip_size': gzip_size}
+
+        for path in sorted(set(previous) - set(result.manifest)):
+            stale = Path(f"{self.project_root / path}.gz")
+            if stale.exists():
+                stale.unlink()
+            result.removed.append(path)
+
+        self._write_manifest(result.manifest)
+        self.logger.info(
+            f"Precompressed {len(result.compressed)} files, {len(result.unchanged)} unchanged, "
+            f"{len(result.removed)} removed: {result.original_bytes} -> {result.compressed_bytes} bytes"
+        )
+        return result
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        if not self.manifest_file.exists():
+            return {}
+        try:
+            with self.manifest_file.open('r', encoding='utf-8') as f:
+                return json.load(f).get('files', {})
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable manifest {self.manifest_file}: {str(e)}")
+            return {}
+
+    def _write_manifest(self, manifest: Dict[str, Dict]) -> None:
+        temp_file = self.manifest_file.with_suffix('.json.tmp')
+        with temp_file.open('w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'files': manifest}, f, indent=2, sort_keys=True)
+        os.replace(temp_file, self.manifest_file)
+
+    @staticmethod
+    def format(result: PrecompressResult) -> List[str]:
+        """Render a precompression run as Markdown lines"""
+        lines = [
+            "## Precompressed Assets\n",
+            f"- Compressed: {len(result.compressed)}, unchanged: {len(result.unchanged)}, "
+            f"removed: {len(result.removed)}",
+            f"- Total: {result.original_bytes} -> {result.compressed_bytes} bytes\n",
+        ]
+        for path, entry in sorted(result.manifest.items()):
+            if entry['gzip_size'] is None:
+                lines.append(f"- {path}: {entry['size']} bytes (not compressed)")
+            else:
+                lines.append(f"- {path}: {entry['size']} -> {entry['gzip_size']} bytes "
+                             f"({entry['gzip_size'] / entry['size']:.0%})")
+        return lines
+
+if __name__ == '__main__':
+    project_root = Path(__file__).resolve().parents[2]
+    print('\n'.join(Precompressor.format(Precompressor(project_root).run())))
@@ -0,0 +1,296 @@
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import unquote, urlsplit
+import asyncio
+import logging
+import mimetypes
+import posixpath
+import sys
+from ..generators.hashing import HashingService
+
+REASONS = {
+    200: 'OK', 206: 'Partial Content', 304: 'Not Modified', 400: 'Bad Request', 403: 'Forbidden',
+    404: 'Not Found', 405: 'Method Not Allowed', 416: 'Range Not Satisfiable', 500: 'Internal Server Error'
+}
+
+mimetypes.add_type('audio/mpeg', '.mp3')
+mimetypes.add_type('application/javascript', '.js')
+
+class PreviewServer:
+    """
+    asyncio static file server for previewing and profiling the site.
+
+    Responses carry strong ETags derived from content hashes (cached by
+    file stat, so unchanged files are never re-read), honour
+    If-None-Match / If-Modified-Since with 304, serve single byte ranges
+    for seeking in audio, prefer precompressed .gz siblings when the client
+    accepts gzip, and send bodies with loop.sendfile(), which uses
+    os.sendfile() for zero-copy transfer.
+    """
+
+    KEEPALIVE_TIMEOUT = 15.0
+    MAX_HEADER_BYTES = 16 * 1024
+    HIDDEN_PREFIXES = ('.', '__pycache__')
+    # Tooling trees that are not part of the site, as excluded by search_index and precompress
+    PRIVATE_DIRS = frozenset({'auth', 'config', 'database', 'documentation', 'node_modules', 'templates', 'tests'})
+
+    def __init__(self, project_root: Path, host: str = '127.0.0.1', port: int = 8000,
+                 hashing: Optional[HashingService] = None, cache_control: str = 'no-cache'):
+        self.project_root = Path(project_root).resolve()
+        self.host = host
+        self.port = port
+        self.hashing = hashing or HashingService()
+        self.cache_control = cache_control
+        self.logger = logging.getLogger(__name__)
+        self.requests = 0
+        self.bytes_sent = 0
+        self.status_counts: Dict[int, int] = {}
+
+    async def serve(self) -> None:
+        server = await asyncio.start_server(self.handle, self.host, self.port, limit=self.MAX_HEADER_BYTES)
+        self.logger.info(f"Serving {self.project_root} on http://{self.host}:{self.port}/")
+        async with server:
+            await server.serve_forever()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until it closes or idles out"""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.KEEPALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send_error(writer, 400, keep_alive=False)
+                    break
+                request = self._parse_request(head)
+                if request is None:
+                    await self._send_error(writer, 400, keep_alive=False)
+                    break
+                method, target, version, headers = request
+                keep_alive = self._keep_alive(version, headers)
+                await self.respond(writer, method, target, headers, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Error handling request: {str(e)}")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    def _parse_request(head: bytes) -> Optional[Tuple[str, str, str, Dict[str, str]]]:
+        try:
+            lines = head.decode('latin-1').split('\r\n')
+            method, target, version = lines[0].split(' ')
+        except ValueError:
+            return None
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+        return method, target, version, headers
+
+    @staticmethod
+    def _keep_alive(version: str, headers: Dict[str, str]) -> bool:
+        connection = headers.get('connection', '').lower()
+        return connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+
+    async def respond(self, writer: asyncio.StreamWriter, method: str, target: str,
+                      headers: Dict[str, str], keep_alive: bool) -> None:
+        if method not in ('GET', 'HEAD'):
+            await self._send_error(writer, 405, keep_alive, extra={'Allow': 'GET, HEAD'})
+            return
+        try:
+            path = self.resolve(target)
+        except ValueError:
+            await self._send_error(writer, 400, keep_alive)
+            return
+        if path is None:
+            await self._send_error(writer, 403, keep_alive)
+            return
+        try:
+            stat_result = path.stat()
+        except OSError:
+            await self._send_error(writer, 404, keep_alive)
+            return
+
+        loop = asyncio.get_running_loop()
+        digest = await loop.run_in_executor(None, self.hashing.hash_file, path)
+        body_path, size, encoding = path, stat_result.st_size, None
+        gz_path = Path(f"{path}.gz")
+        if self._accepts_gzip(headers.get('accept-encoding', '')) and 'range' not in headers:
+            try:
+                gz_stat = gz_path.stat()
+                if gz_stat.st_mtime_ns >= stat_result.st_mtime_ns:
+                    body_path, size, encoding = gz_path, gz_stat.st_size, 'gzip'
+            except OSError:
+                pass
+
+        etag = f'"{digest}-gz"' if encoding else f'"{digest}"'
+        response_headers = {
+            'Content-Type': mimetypes.guess_type(path.name)[0] or 'application/octet-stream',
+            'ETag': etag,
+            'Last-Modified': formatdate(stat_result.st_mtime, usegmt=True),
+            'Cache-Control': self.cache_control,
+            'Accept-Ranges': 'bytes',
+            'Vary': 'Accept-Encoding',
+        }
+        if encoding:
+            response_headers['Content-Encoding'] = encoding
+
+        if self._not_modified(headers, etag, stat_result.st_mtime):
+            await self._send_head(writer, 304, response_headers, keep_alive)
+            return
+
+        status, offset, length = 200, 0, size
+        byte_range = self._parse_range(headers, etag, stat_result.st_mtime, size)
+        if byte_range == 'unsatisfiable':
+            await self._send_error(writer, 416, keep_alive, extra={'Content-Range': f"bytes */{size}"})
+            return
+        if byte_range:
+            offset, end = byte_range
+            status, length = 206, end - offset + 1
+            response_headers['Content-Range'] = f"bytes {offset}-{end}/{size}"
+
+        response_headers['Content-Length'] = str(length)
+        await self._send_head(writer, status, response_headers, keep_alive)
+        if method == 'GET' and length:
+            with open(body_path, 'rb') as f:
+                await loop.sendfile(writer.transport, f, offset, length)
+            self.bytes_sent += length
+
+    def resolve(self, target: str) -> Optional[Path]:
+        """
+        Map a request target to a file under project_root.
+
+        Returns:
+            The file, or None if the target escapes the root, is hidden or
+            lies in a tooling directory
+
+        Raises:
+            ValueError: If the decoded path contains a NUL byte
+        """
+        path = posixpath.normpath('/' + unquote(urlsplit(target).path))
+        if '\0' in path:
+            raise ValueError(f"NUL byte in request path: {target!r}")
+        parts = [part for part in path.split('/') if part]
+        if any(part.startswith(self.HIDDEN_PREFIXES) for part in parts):
+            return None
+        if parts and parts[0] in self.PRIVATE_DIRS:
+            return None
+        resolved = self.project_root.joinpath(*parts).resolve()
+        if not resolved.is_relative_to(self.project_root):
+            return None
+        if resolved.is_dir():
+            resolved = resolved / 'index.html'
+        return resolved
+
+    @staticmethod
+    def _accepts_gzip(accept_encoding: str) -> bool:
+        """Whether Accept-Encoding allows gzip, honouring q-values such as gzip;q=0"""
+        qualities = {}
+        for item in accept_encoding.split(','):
+            coding, *params = [part.strip() for part in item.split(';')]
+            quality = 1.0
+            for param in params:
+                name, _, value = param.partition('=')
+                if name.strip().lower() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if coding:
+                qualities[coding.lower()] = quality
+        for coding in ('gzip', 'x-gzip', '*'):
+            if coding in qualities:
+                return qualities[coding] > 0
+        return False
+
+    @staticmethod
+    def _not_modified(headers: Dict[str, str], etag: str, mtime: float) -> bool:
+        if_none_match = headers.get('if-none-match')
+        if if_none_match is not None:
+            # If-None-Match uses weak comparison and takes precedence over dates
+            tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+            return '*' in tags or etag in tags
+        if_modified_since = headers.get('if-modified-since')
+        if if_modified_since:
+            try:
+                return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    @staticmethod
+    def _parse_range(headers: Dict[str, str], etag: str, mtime: float, size: int):
+        """
+        Parse a single-range Range header.
+
+        Returns:
+            (start, end) inclusive, None to send the full body, or
+            'unsatisfiable'
+        """
+        value = headers.get('range', '')
+        if not value.startswith('bytes=') or ',' in value:
+            return None
+        if_range = headers.get('if-range')
+        if if_range:
+            if if_range.startswith(('"', 'W/')):
+                if if_range != etag:
+                    return None
+            else:
+                try:
+                    if int(mtime) > parsedate_to_datetime(if_range).timestamp():
+                        return None
+                except (TypeError, ValueError):
+                    return None
+        start_text, _, end_text = value[6:].strip().partition('-')
+        try:
+            if start_text:
+                start = int(start_text)
+                end = min(int(end_text), size - 1) if end_text else size - 1
+            else:
+                suffix = int(end_text)
+                if suffix == 0:
+                    return 'unsatisfiable'
+                start, end = max(0, size - suffix), size - 1
+        except ValueError:
+            return None
+        if start >= size or start > end:
+            return 'unsatisfiable'
+        return start, end
+
+    async def _send_head(self, writer: asyncio.StreamWriter, status: int, headers: Dict[str, str],
+                         keep_alive: bool) -> None:
+        self.requests += 1
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}", f"Date: {formatdate(usegmt=True)}", "Server: preview"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        await writer.drain()
+
+    async def _send_error(self, writer: asyncio.StreamWriter, status: int, keep_alive: bool,
+                          extra: Optional[Dict[str, str]] = None) -> None:
+        body = f"{status} {REASONS[status]}\n".encode('ascii')
+        headers = {'Content-Type': 'text/plain; charset=utf-8', 'Content-Length': str(len(body)), **(extra or {})}
+        await self._send_head(writer, status, headers, keep_alive)
+        writer.write(body)
+        await writer.drain()
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    project_root = Path(__file__).resolve().parents[2]
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    try:
+        asyncio.run(PreviewServer(project_root, port=port).serve())
+    except KeyboardInterrupt:
+        pass
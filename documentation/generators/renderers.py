@@ -0,0 +1,293 @@
+from pathlib import Path
+from typing import Dict, List, Sequence
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+import html
+import logging
+import os
+import textwrap
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
+from reportlab.lib.units import inch
+from reportlab.lib.enums import TA_CENTER
+from reportlab.platypus import (
+    SimpleDocTemplate, Paragraph, Spacer, PageTemplate, Frame, PageBreak, Image, Preformatted
+)
+
+from .document_model import (
+    Document, Block, Heading, Text, BulletList, CodeBlock, ImageBlock, Tree, Spacer as SpacerBlock
+)
+
+def create_styles() -> StyleSheet1:
+    """Sample stylesheet plus the documentation's custom paragraph styles"""
+    styles = getSampleStyleSheet()
+    style_configs = [
+        ('CoverTitle', styles['Heading1'], {
+            'fontSize': 32,
+            'spaceAfter': 30,
+            'alignment': TA_CENTER,
+            'textColor': colors.HexColor('#2F89FC')
+        }),
+        ('CoverInfo', styles['Normal'], {
+            'fontSize': 12,
+            'spaceAfter': 20,
+            'alignment': TA_CENTER
+        }),
+        ('FileContent', styles['Normal'], {
+            'fontSize': 10,
+            'leftIndent': 20
+        }),
+        ('FileTree', styles['Code'], {
+            'fontSize': 8,
+            'leading': 10,
+            'leftIndent': 20
+        }),
+        ('CodeBlock', styles['Normal'], {
+            'fontSize': 9,
+            'fontName': 'Courier',
+            'leftIndent': 20,
+            'rightIndent': 20,
+            'spaceAfter': 15,
+            'spaceBefore': 15,
+            'backColor': colors.lightgrey
+        }),
+        ('CustomHeading1', styles['Heading1'], {
+            'fontSize': 24,
+            'spaceAfter': 20,
+            'textColor': colors.HexColor('#2F89FC')
+        }),
+        ('CustomHeading2', styles['Heading2'], {
+            'fontSize': 18,
+            'spaceAfter': 15,
+            'textColor': colors.HexColor('#2F89FC')
+        }),
+        ('CustomHeading3', styles['Heading3'], {
+            'fontSize': 14,
+            'spaceAfter': 10,
+            'textColor': colors.HexColor('#2F89FC')
+        })
+    ]
+    for name, parent, properties in style_configs:
+        styles.add(ParagraphStyle(name=name, parent=parent, **properties))
+    return styles
+
+class Renderer(ABC):
+    """Turns a Document into one output file"""
+
+    extension = ''
+
+    @abstractmethod
+    def render(self, document: Document, output_path: Path) -> Path:
+        """Write document to output_path and return the file written"""
+
+class MarkdownRenderer(Renderer):
+    extension = '.md'
+
+    def render(self, document: Document, output_path: Path) -> Path:
+        lines = [f"# {document.title}\n", f"Version {document.version} · Generated {document.generated}\n"]
+        lines.extend(self._blocks(document.cover, output_path))
+        lines.append("## Table of Contents\n")
+        lines.extend(f"- {title}" for title in document.numbered_titles)
+        lines.append('')
+        for title, section in zip(document.numbered_titles, document.sections):
+            lines.append(f"## {title}\n")
+            lines.extend(self._blocks(section.blocks, output_path))
+        output_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        return output_path
+
+    def _blocks(self, blocks: Sequence[Block], output_path: Path) -> List[str]:
+        lines = []
+        for block in blocks:
+            if isinstance(block, Heading):
+                # Document headings start below the section level
+                lines.append(f"{'#' * min(6, block.level + 1)} {block.text}\n")
+            elif isinstance(block, Text):
+                lines.append('  \n'.join(block.lines) + '\n')
+            elif isinstance(block, BulletList):
+                if block.intro:
+                    lines.append(f"{block.intro}\n")
+                lines.extend(f"- {item}" for item in block.items)
+                lines.append('')
+            elif isinstance(block, CodeBlock):
+                lines.extend([f"```{block.language}", textwrap.dedent(block.code).strip('\n'), "```\n"])
+            elif isinstance(block, Tree):
+                lines.extend(["```", *block.lines, "```\n"])
+            elif isinstance(block, ImageBlock):
+                lines.append(f"![{block.caption or Path(block.path).stem}]({_relative(block.path, output_path)})\n")
+        return lines
+
+class HtmlRenderer(Renderer):
+    extension = '.html'
+
+    STYLE = (
+        "body{font-family:Helvetica,Arial,sans-serif;max-width:960px;margin:2rem auto;padding:0 1rem;"
+        "line-height:1.5}h1,h2,h3,h4{color:#2F89FC}pre{background:#eee;padding:1rem;overflow-x:auto}"
+        ".cover{text-align:center}"
+    )
+
+    def render(self, document: Document, output_path: Path) -> Path:
+        title = html.escape(document.title)
+        parts = [
+            "<!DOCTYPE html>",
+            '<html lang="en">',
+            f'<head><meta charset="utf-8"><title>{title}</title><style>{self.STYLE}</style></head>',
+            "<body>",
+            f'<header class="cover"><h1>{title}</h1>',
+            *self._blocks(document.cover, output_path),
+            "</header>",
+            "<nav><h2>Table of Contents</h2><ol>",
+            *(f'<li><a href="#section-{number}">{html.escape(section.title)}</a></li>'
+              for number, section in enumerate(document.sections, 1)),
+            "</ol></nav>",
+        ]
+        for number, (title, section) in enumerate(zip(document.numbered_titles, document.sections), 1):
+            parts.append(f'<section id="section-{number}"><h2>{html.escape(title)}</h2>')
+            parts.extend(self._blocks(section.blocks, output_path))
+            parts.append("</section>")
+        parts.extend([
+            f"<footer><p>Version {html.escape(document.version)} · Generated {html.escape(document.generated)}</p>"
+            "</footer>",
+            "</body>",
+            "</html>"
+        ])
+        output_path.write_text('\n'.join(parts) + '\n', encoding='utf-8')
+        return output_path
+
+    def _blocks(self, blocks: Sequence[Block], output_path: Path) -> List[str]:
+        parts = []
+        for block in blocks:
+            if isinstance(block, Heading):
+                level = min(6, block.level + 1)
+                parts.append(f"<h{level}>{html.escape(block.text)}</h{level}>")
+            elif isinstance(block, Text):
+                parts.append(f'<p class="{block.role}">{"<br>".join(map(html.escape, block.lines))}</p>')
+            elif isinstance(block, BulletList):
+                if block.intro:
+                    parts.append(f"<p>{html.escape(block.intro)}</p>")
+                parts.append("<ul>" + ''.join(f"<li>{html.escape(item)}</li>" for item in block.items) + "</ul>")
+            elif isinstance(block, CodeBlock):
+                parts.append(f"<pre><code>{html.escape(textwrap.dedent(block.code).strip())}</code></pre>")
+            elif isinstance(block, Tree):
+                parts.append(f"<pre>{html.escape(chr(10).join(block.lines))}</pre>")
+            elif isinstance(block, ImageBlock):
+                alt = html.escape(block.caption or Path(block.path).stem)
+                parts.append(
+                    f'<img src="{html.escape(_relative(block.path, output_path))}" alt="{alt}" '
+                    f'width="{block.width}" height="{block.height}">'
+                )
+        return parts
+
+class PdfRenderer(Renderer):
+    extension = '.pdf'
+
+    HEADING_STYLES = {1: 'CustomHeading1', 2: 'CustomHeading2', 3: 'CustomHeading3'}
+    # Lines per Preformatted flowable. Roughly one page, so a split never
+    # re-slices a long block, and large trees need few flowables.
+    TREE_CHUNK_LINES = 60
+
+    def render(self, document: Document, output_path: Path) -> Path:
+        styles = create_styles()
+        doc = SimpleDocTemplate(
+            str(output_path),
+            pagesize=A4,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=72
+        )
+        frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal')
+
+        def header_footer(canvas, page_doc):
+            canvas.saveState()
+            canvas.setFont('Helvetica', 9)
+            canvas.drawString(72, 800, f"{document.title} - Technical Documentation")
+            canvas.drawRightString(540, 800, f"Version {document.version}")
+            canvas.line(72, 797, 540, 797)
+            canvas.drawString(72, 30, f"Generated: {document.generated}")
+            canvas.drawRightString(540, 30, f"Page {page_doc.page}")
+            canvas.line(72, 45, 540, 45)
+            canvas.restoreState()
+
+        doc.addPageTemplates([PageTemplate(id='standard', frames=frame, onPage=header_footer)])
+
+        story = self._flowables(document.cover, styles)
+        story.append(PageBreak())
+        story.append(Paragraph('Table of Contents', styles['CustomHeading1']))
+        story.extend(Paragraph(escape(title), styles['Normal']) for title in document.numbered_titles)
+        story.append(Spacer(1, 0.5*inch))
+        for title, section in zip(document.numbered_titles, document.sections):
+            story.append(Paragraph(escape(title), styles['CustomHeading1']))
+            story.extend(self._flowables(section.blocks, styles))
+            story.append(PageBreak())
+        doc.build(story)
+        return output_path
+
+    def _flowables(self, blocks: Sequence[Block], styles: StyleSheet1) -> list:
+        flowables = []
+        for block in blocks:
+            if isinstance(block, Heading):
+                style = 'CoverTitle' if block.level == 0 else self.HEADING_STYLES.get(block.level, 'Heading4')
+                flowables.append(Paragraph(escape(block.text), styles[style]))
+            elif isinstance(block, Text):
+                style = 'CoverInfo' if block.role == 'cover' else 'Normal'
+                flowables.append(Paragraph('<br/>'.join(map(escape, block.lines)), styles[style]))
+            elif isinstance(block, BulletList):
+                lines = ([escape(block.intro)] if block.intro else []) + [f"• {escape(i)}" for i in block.items]
+                flowables.append(Paragraph('<br/>'.join(lines), styles['Normal']))
+            elif isinstance(block, CodeBlock):
+                flowables.append(Preformatted(textwrap.dedent(block.code).strip('\n'), styles['CodeBlock']))
+            elif isinstance(block, Tree):
+                flowables.extend(
+                    Preformatted('\n'.join(block.lines[start:start + self.TREE_CHUNK_LINES]), styles['FileTree'])
+                    for start in range(0, len(block.lines), self.TREE_CHUNK_LINES)
+                )
+            elif isinstance(block, ImageBlock):
+                flowables.append(Image(str(block.path), width=block.width, height=block.height))
+            elif isinstance(block, SpacerBlock):
+                flowables.append(Spacer(1, block.height))
+        return flowables
+
+RENDERERS: Dict[str, type] = {'pdf': PdfRenderer, 'html': HtmlRenderer, 'md': MarkdownRenderer}
+
+def _relative(path: Path, output_path: Path) -> str:
+    return Path(os.path.relpath(path, output_path.parent)).as_posix()
+
+def _render(renderer: Renderer, document: Document, output_path: Path) -> Path:
+    return renderer.render(document, output_path)
+
+def render_all(document: Document, output_dir: Path, basename: str,
+               formats: Sequence[str] = ('pdf', 'html', 'md'), workers: int = 0) -> Dict[str, Path]:
+    """
+    Render one document into several formats concurrently.
+
+    Each renderer runs in its own process, so CPU-bound PDF layout does not
+    hold up the text formats.
+
+    Args:
+        document: Content to render
+        output_dir: Directory for the output files
+        basename: File name without extension
+        formats: Keys of RENDERERS
+        workers: Process count, defaults to one per format; 1 renders inline
+
+    Returns:
+        Mapping of format to written file
+    """
+    unknown = set(formats) - set(RENDERERS)
+    if unknown:
+        raise ValueError(f"Unknown output formats: {sorted(unknown)}")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = {fmt: (RENDERERS[fmt](), output_dir / f"{basename}{RENDERERS[fmt].extension}") for fmt in formats}
+    workers = workers or len(jobs)
+    if workers <= 1 or len(jobs) <= 1:
+        results = {fmt: _render(renderer, document, path) for fmt, (renderer, path) in jobs.items()}
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            futures = {fmt: executor.submit(_render, renderer, document, path) for fmt, (renderer, path) in jobs.items()}
+            results = {fmt: future.result() for fmt, future in futures.items()}
+    logging.getLogger(__name__).info(f"Rendered {', '.join(str(path) for path in results.values())}")
+    return results
@@ -0,0 +1,366 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+import logging
+import re
+
+IDENTIFIER = r'(?:"[^"]+"|[\w$]+)'
+QUALIFIED_NAME = rf'{IDENTIFIER}(?:\.{IDENTIFIER})?'
+
+CREATE_TABLE_PATTERN = re.compile(
+    rf'^CREATE\s+(?:(?:GLOBAL|LOCAL)\s+)?(?:(?:TEMP|TEMPORARY|UNLOGGED)\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?'
+    rf'({QUALIFIED_NAME})\s*\((.*)\)', re.IGNORECASE | re.DOTALL
+)
+CREATE_INDEX_PATTERN = re.compile(
+    rf'^CREATE\s+(UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?({IDENTIFIER})?\s*'
+    rf'ON\s+(?:ONLY\s+)?({QUALIFIED_NAME})\s*(?:USING\s+\w+\s*)?\((.*?)\)\s*(?:WHERE\s+(.*))?$',
+    re.IGNORECASE | re.DOTALL
+)
+ALTER_ADD_PATTERN = re.compile(
+    rf'^ALTER\s+TABLE\s+(?:ONLY\s+)?(?:IF\s+EXISTS\s+)?({QUALIFIED_NAME})\s+ADD\s+(.*)$', re.IGNORECASE | re.DOTALL
+)
+REFERENCES_PATTERN = re.compile(rf'REFERENCES\s+({QUALIFIED_NAME})\s*(?:\(([^)]*)\))?', re.IGNORECASE)
+KEY_COLUMNS_PATTERN = re.compile(r'\(([^)]*)\)')
+
+def normalize_name(name: str) -> str:
+    """Lower-case an identifier unless quoted, and strip the quotes"""
+    return '.'.join(part[1:-1] if part.startswith('"') else part.lower() for part in name.split('.'))
+
+def split_columns(columns: str) -> Tuple[str, ...]:
+    """Split a key column list, dropping sort order and null ordering"""
+    result = []
+    for column in split_top_level(columns):
+        column = re.sub(r'\s+(ASC|DESC)\b|\s+NULLS\s+(FIRST|LAST)\b', '', column, flags=re.IGNORECASE).strip()
+        result.append(normalize_name(column) if re.fullmatch(IDENTIFIER, column) else column.lower())
+    return tuple(result)
+
+def split_top_level(text: str) -> List[str]:
+    """Split on commas that are not nested in parentheses or quotes"""
+    parts, depth, current, quote = [], 0, [], None
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '\'"':
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    if ''.join(current).strip():
+        parts.append(''.join(current).strip())
+    return parts
+
+def split_statements(sql: str) -> List[str]:
+    """Split a script into statements, skipping comments and quoted/dollar-quoted bodies"""
+    statements, current, i = [], [], 0
+    while i < len(sql):
+        if sql.startswith('--', i):
+            newline = sql.find('\n', i)
+            i = len(sql) if newline == -1 else newline
+            continue
+        if sql.startswith('/*', i):
+            close = sql.find('*/', i + 2)
+            i = len(sql) if close == -1 else close + 2
+            continue
+        char = sql[i]
+        dollar = re.match(r'\$[\w]*\$', sql[i:]) if char == '$' else None
+        if dollar:
+            close = sql.find(dollar.group(0), i + len(dollar.group(0)))
+            end = len(sql) if close == -1 else close + len(dollar.group(0))
+            current.append(sql[i:end])
+            i = end
+            continue
+        if char in '\'"':
+            close = i + 1
+            while close < len(sql) and sql[close] != char:
+                close += 2 if sql[close] == '\\' else 1
+            current.append(sql[i:close + 1])
+            i = close + 1
+            continue
+        if char == ';':
+            statement = ' '.join(''.join(current).split())
+            if statement:
+                statements.append(statement)
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    statement = ' '.join(''.join(current).split())
+    if statement:
+        statements.append(statement)
+    return statements
+
+@dataclass
+class ForeignKey:
+    columns: Tuple[str, ...]
+    references: str
+    referenced_columns: Tuple[str, ...] = ()
+
+@dataclass
+class Index:
+    name: str
+    columns: Tuple[str, ...]
+    unique: bool = False
+    predicate: Optional[str] = None
+    constraint: bool = False
+
+@dataclass
+class Table:
+    name: str
+    columns: List[str] = field(default_factory=list)
+    primary_key: Tuple[str, ...] = ()
+    foreign_keys: List[ForeignKey] = field(default_factory=list)
+    indexes: List[Index] = field(default_factory=list)
+
+    @property
+    def key_indexes(self) -> List[Index]:
+        """Indexes created implicitly by PRIMARY KEY and UNIQUE constraints"""
+        return [index for index in self.indexes if index.constraint]
+
+@dataclass
+class AccessPattern:
+    """A known query shape: equality filters followed by an optional range/sort column"""
+    table: str
+    equality: Tuple[str, ...]
+    range_column: Optional[str] = None
+    purpose: str = ''
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return self.equality + ((self.range_column,) if self.range_column else ())
+
+@dataclass
+class SchemaFinding:
+    rule: str
+    table: str
+    message: str
+    suggestion: str = ''
+
+class SchemaCatalog:
+    """Tables, constraints, foreign keys and indexes parsed from DDL"""
+
+    def __init__(self):
+        self.tables: Dict[str, Table] = {}
+
+    @classmethod
+    def from_sql(cls, sql: str) -> 'SchemaCatalog':
+        catalog = cls()
+        for statement in split_statements(sql):
+            catalog._apply(statement)
+        return catalog
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'SchemaCatalog':
+        return cls.from_sql(Path(path).read_text(encoding='utf-8'))
+
+    def _apply(self, statement: str) -> None:
+        match = CREATE_TABLE_PATTERN.match(statement)
+        if match:
+            table = self.tables.setdefault(normalize_name(match.group(1)), Table(normalize_name(match.group(1))))
+            for item in split_top_level(match.group(2)):
+                self._apply_table_item(table, item)
+            return
+        match = CREATE_INDEX_PATTERN.match(statement)
+        if match:
+            table = self.tables.setdefault(normalize_name(match.group(3)), Table(normalize_name(match.group(3))))
+            table.indexes.append(Index(
+                name=normalize_name(match.group(2) or f"{table.name.split('.')[-1]}_idx{len(table.indexes)}"),
+                columns=split_columns(match.group(4)),
+                unique=bool(match.group(1)),
+                predicate=match.group(5)
+            ))
+            return
+        match = ALTER_ADD_PATTERN.match(statement)
+        if match:
+            table = self.tables.setdefault(normalize_name(match.group(1)), Table(normalize_name(match.group(1))))
+            self._apply_table_item(table, match.group(2))
+
+    def _apply_table_item(self, table: Table, item: str) -> None:
+        """Apply one column definition or table constraint"""
+        name = None
+        constraint = re.match(rf'CONSTRAINT\s+({IDENTIFIER})\s+(.*)$', item, re.IGNORECASE | re.DOTALL)
+        if constraint:
+            name, item = normalize_name(constraint.group(1)), constraint.group(2)
+        keyword = item.split(None, 1)[0].upper() if item.split() else ''
+        short_name = table.name.split('.')[-1]
+
+        if keyword == 'PRIMARY' or keyword == 'UNIQUE':
+            columns = KEY_COLUMNS_PATTERN.search(item)
+            if not columns:
+                return
+            key = split_columns(columns.group(1))
+            if keyword == 'PRIMARY':
+                table.primary_key = key
+            table.indexes.append(Index(
+                name or f"{short_name}_{'pkey' if keyword == 'PRIMARY' else '_'.join(key) + '_key'}",
+                key, unique=True, constraint=True
+            ))
+        elif keyword == 'FOREIGN':
+            columns = KEY_COLUMNS_PATTERN.search(item)
+            reference = REFERENCES_PATTERN.search(item)
+            if columns and reference:
+                table.foreign_keys.append(ForeignKey(
+                    split_columns(columns.group(1)),
+                    normalize_name(reference.group(1)),
+                    split_columns(reference.group(2) or '')
+                ))
+        elif keyword in ('CHECK', 'EXCLUDE', 'LIKE'):
+            return
+        elif not constraint:
+            self._apply_column(table, item)
+
+    def _apply_column(self, table: Table, definition: str) -> None:
+        """Record a column and any inline PRIMARY KEY, UNIQUE or REFERENCES clause"""
+        parts = definition.split(None, 1)
+        column = normalize_name(parts[0])
+        rest = parts[1] if len(parts) > 1 else ''
+        table.columns.append(column)
+        short_name = table.name.split('.')[-1]
+        if re.search(r'\bPRIMARY\s+KEY\b', rest, re.IGNORECASE):
+            table.primary_key = (column,)
+            table.indexes.append(Index(f"{short_name}_pkey", (column,), unique=True, constraint=True))
+        if re.search(r'\bUNIQUE\b', rest, re.IGNORECASE):
+            table.indexes.append(Index(f"{short_name}_{column}_key", (column,), unique=True, constraint=True))
+        reference = REFERENCES_PATTERN.search(rest)
+        if reference:
+            table.foreign_keys.append(ForeignKey(
+                (column,), normalize_name(reference.group(1)), split_columns(reference.group(2) or '')
+            ))
+
+class IndexAdvisor:
+    """Rules that flag redundant and missing indexes in a SchemaCatalog"""
+
+    # Query shapes the application and maintenance jobs rely on
+    KNOWN_ACCESS_PATTERNS = (
+        AccessPattern('game_data.audit_log', ('user_id',), 'created_at', 'per-user audit history, newest first'),
+        AccessPattern('game_data.login_attempts', ('ip_address',), 'attempt_time', 'rate limiting by client IP'),
+    )
+
+    def __init__(self, catalog: SchemaCatalog, access_patterns: Optional[Tuple[AccessPattern, ...]] = None):
+        self.catalog = catalog
+        self.access_patterns = self.KNOWN_ACCESS_PATTERNS if access_patterns is None else access_patterns
+        self.logger = logging.getLogger(__name__)
+
+    def analyze(self) -> List[SchemaFinding]:
+        """Run every rule over every table"""
+        findings: List[SchemaFinding] = []
+        for table in self.catalog.tables.values():
+            findings.extend(self._redundant_indexes(table))
+            findings.extend(self._unindexed_foreign_keys(table))
+        findings.extend(self._uncovered_access_patterns())
+        self.logger.info(f"Schema analysis produced {len(findings)} findings")
+        return findings
+
+    @staticmethod
+    def _covers(index: Index, columns: Tuple[str, ...]) -> bool:
+        """Whether an index's leading columns can serve a lookup on the given columns"""
+        return index.predicate is None and len(index.columns) >= len(columns) and \
+            set(index.columns[:len(columns)]) == set(columns)
+
+    def _redundant_indexes(self, table: Table) -> List[SchemaFinding]:
+        findings = []
+        for index in table.indexes:
+            if index.constraint or index.predicate:
+                continue
+            for other in table.indexes:
+                if other is index or other.predicate:
+                    continue
+                drop = f"DROP INDEX {self._schema_prefix(table)}{index.name};"
+                if other.columns == index.columns and (other.constraint or other.unique or
+                                                       table.indexes.index(other) < table.indexes.index(index)):
+                    kind = 'constraint' if other.constraint else 'index'
+                    findings.append(SchemaFinding(
+                        'redundant-index', table.name,
+                        f"Index {index.name} ({', '.join(index.columns)}) duplicates {kind} {other.name}",
+                        drop
+                    ))
+                    break
+                if len(other.columns) > len(index.columns) and other.columns[:len(index.columns)] == index.columns \
+                        and not index.unique:
+                    findings.append(SchemaFinding(
+                        'prefix-overlap', table.name,
+                        f"Index {index.name} ({', '.join(index.columns)}) is a prefix of "
+                        f"{other.name} ({', '.join(other.columns)})",
+                        drop
+                    ))
+                    break
+        return findings
+
+    def _unindexed_foreign_keys(self, table: Table) -> List[SchemaFinding]:
+        findings = []
+        for foreign_key in table.foreign_keys:
+            if any(self._covers(index, foreign_key.columns) for index in table.indexes):
+                continue
+            message = (f"Foreign key ({', '.join(foreign_key.columns)}) -> {foreign_key.references} has no covering "
+                       f"index; deletes/updates on {foreign_key.references} scan {table.name}")
+            # A composite index suggested for a known access pattern can serve the foreign key as well
+            wider = next((pattern for pattern in self.access_patterns if pattern.table == table.name and
+                          set(pattern.columns[:len(foreign_key.columns)]) == set(foreign_key.columns)), None)
+            if wider:
+                message += f"; the suggested ({', '.join(wider.columns)}) index covers it"
+            findings.append(SchemaFinding(
+                'unindexed-foreign-key', table.name, message,
+                '' if wider else self._create_index(table, foreign_key.columns)
+            ))
+        return findings
+
+    def _uncovered_access_patterns(self) -> List[SchemaFinding]:
+        findings = []
+        for pattern in self.access_patterns:
+            table = self.catalog.tables.get(pattern.table)
+            if table is None:
+                continue
+            if any(self._covers(index, pattern.equality) and
+                   (pattern.range_column is None or
+                    index.columns[len(pattern.equality):len(pattern.equality) + 1] == (pattern.range_column,))
+                   for index in table.indexes):
+                continue
+            findings.append(SchemaFinding(
+                'missing-index', table.name,
+                f"No index supports {pattern.purpose or 'lookup'} on ({', '.join(pattern.columns)})",
+                self._create_index(table, pattern.columns)
+            ))
+        return findings
+
+    @staticmethod
+    def _schema_prefix(table: Table) -> str:
+        return table.name.rsplit('.', 1)[0] + '.' if '.' in table.name else ''
+
+    @staticmethod
+    def _create_index(table: Table, columns: Tuple[str, ...]) -> str:
+        short_name = table.name.split('.')[-1]
+        return f"CREATE INDEX idx_{short_name}_{'_'.join(columns)} ON {table.name}({', '.join(columns)});"
+
+    @staticmethod
+    def format(catalog: SchemaCatalog, findings: List[SchemaFinding]) -> List[str]:
+        """Render the catalog and findings as Markdown lines"""
+        lines = ["## Database Schema\n"]
+        for table in catalog.tables.values():
+            lines.append(f"### {table.name}\n")
+            lines.append(f"- Columns: {', '.join(table.columns)}")
+            lines.append(f"- Primary key: {', '.join(table.primary_key) or 'none'}")
+            for foreign_key in table.foreign_keys:
+                lines.append(f"- Foreign key: ({', '.join(foreign_key.columns)}) -> {foreign_key.references}")
+            for index in table.indexes:
+                kind = 'constraint' if index.constraint else ('unique index' if index.unique else 'index')
+                lines.append(f"- {kind.capitalize()} {index.name}: ({', '.join(index.columns)})")
+            lines.append('')
+        lines.append("### Index Advisor\n")
+        if not findings:
+            lines.append("- No findings")
+        for finding in findings:
+            lines.append(f"- [{finding.rule}] {finding.table}: {finding.message}")
+            if finding.suggestion:
+                lines.append(f"  - `{finding.suggestion}`")
+        return lines
+
+if __name__ == '__main__':
+    project_root = Path(__file__).resolve().parents[2]
+    catalog = SchemaCatalog.from_file(project_root / 'database' / 'warcraft3_db.sql')
+    print('\n'.join(IndexAdvisor.format(catalog, IndexAdvisor(catalog).analyze())))
@@ -0,0 +1,221 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass
+from collections import Counter
+from bs4 import BeautifulSoup
+import hashlib
+import json
+import logging
+import os
+import re
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Suffix rules for a deliberately light stemmer. The rules ship inside the
+# index, so the browser stems queries exactly as the build stemmed pages.
+STEM_RULES = (
+    ('ational', 'ate'), ('ization', 'ize'), ('fulness', 'ful'), ('iveness', 'ive'), ('ousness', 'ous'),
+    ('ies', 'y'), ('sses', 'ss'), ('ments', 'ment'), ('ness', ''), ('ingly', ''), ('ing', ''),
+    ('edly', ''), ('ed', ''), ('ly', ''), ("'s", ''), ('s', '')
+)
+MIN_STEM_LENGTH = 3
+# Words ending in these are left alone by the plain 's' rule
+KEEP_S_ENDINGS = ('ss', 'us', 'is')
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have he her his in into is it its of on or that the their "
+    "them they this to was were will with you your".split()
+)
+
+HIDDEN_TAGS = ['script', 'style', 'noscript', 'template', 'svg']
+HEADING_TAGS = ['h1', 'h2', 'h3']
+
+def stem(word: str) -> str:
+    """Strip the first matching suffix, keeping at least MIN_STEM_LENGTH characters"""
+    for suffix, replacement in STEM_RULES:
+        if word.endswith(suffix) and len(word) - len(suffix) + len(replacement) >= MIN_STEM_LENGTH:
+            if suffix == 's' and word.endswith(KEEP_S_ENDINGS):
+                return word
+            return word[:-len(suffix)] + replacement
+    return word
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case, split, drop stopwords and one-letter tokens, and stem"""
+    return [
+        stem(token) for token in TOKEN_PATTERN.findall(text.lower().replace('’', "'"))
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+@dataclass
+class SearchDocument:
+    """One searchable unit: a page or an anchored section of it"""
+    url: str
+    title: str
+    terms: Dict[str, int]
+
+def extract_documents(page: str, content: str, heading_weight: int = 5) -> List[SearchDocument]:
+    """
+    Split a page into searchable documents and weight their terms.
+
+    Every <section id> becomes its own document linked by anchor, innermost
+    first; text left outside those sections belongs to the page itself.
+    Words in headings and titles count heading_weight times.
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+    for tag in soup.find_all(HIDDEN_TAGS):
+        tag.decompose()
+    for tag in soup.find_all('nav'):
+        # Navigation repeats on every page and would match every query
+        tag.decompose()
+
+    page_title = soup.title.get_text(' ', strip=True) if soup.title else page
+    documents = []
+    for section in reversed(soup.find_all('section', id=True)):
+        heading = section.find(HEADING_TAGS)
+        title = heading.get_text(' ', strip=True) if heading else section['id']
+        documents.append(SearchDocument(
+            f"{page}#{section['id']}", f"{page_title} – {title}", _weigh(section, heading_weight)
+        ))
+        section.decompose()
+
+    body = soup.body or soup
+    terms = _weigh(body, heading_weight)
+    for word in tokenize(page_title):
+        terms[word] = terms.get(word, 0) + heading_weight
+    if terms:
+        documents.append(SearchDocument(page, page_title, terms))
+    documents.reverse()
+    return documents
+
+def _weigh(element, heading_weight: int) -> Dict[str, int]:
+    terms = Counter(tokenize(element.get_text(' ')))
+    for heading in element.find_all(HEADING_TAGS):
+        for word in tokenize(heading.get_text(' ')):
+            # Heading words were already counted once as body text
+            terms[word] += heading_weight - 1
+    return dict(terms)
+
+class SearchIndexBuilder:
+    """
+    Builds a compact inverted index of the site's HTML pages.
+
+    Output format (JSON, version 1):
+
+        {"v": 1,
+         "stem": [[suffix, replacement], ...], "min": 3, "keep": [...], "stop": [...],
+         "docs": [[url, title], ...],
+         "terms": {term: [doc_gap, weight, doc_gap, weight, ...]}}
+
+    Posting lists are sorted by document number and store the gap from the
+    previous document, which keeps the numbers, and the JSON, short.
+    Per-page extraction results are cached by file stat and content hash,
+    so a rebuild only re-parses pages that changed.
+    """
+
+    IGNORE_DIRS = {'.git', '__pycache__', 'node_modules', 'documentation', 'dist', 'auth', 'config', 'database', 'templates'}
+    CACHE_VERSION = 1
+
+    def __init__(self, project_root: Path, output_file: Optional[Path] = None,
+                 cache_file: Optional[Path] = None, heading_weight: int = 5):
+        self.project_root = Path(project_root).resolve()
+        self.output_file = Path(output_file) if output_file else self.project_root / 'search-index.json'
+        self.cache_file = Path(cache_file) if cache_file else self.project_root / '.search-cache.json'
+        self.heading_weight = heading_weight
+        self.logger = logging.getLogger(__name__)
+        self.reindexed: List[str] = []
+
+    def discover_pages(self) -> List[str]:
+        """Relative paths of all HTML pages, excluding tooling directories"""
+        pages = []
+        for root, dirs, files in os.walk(self.project_root):
+            dirs[:] = sorted(d for d in dirs if d not in self.IGNORE_DIRS and not d.startswith('.'))
+            relative = Path(root).relative_to(self.project_root)
+            pages.extend((relative / f).as_posix() for f in sorted(files) if f.endswith('.html'))
+        return pages
+
+    def build(self, pages: Optional[Iterable[str]] = None) -> Dict:
+        """
+        Index pages, re-parsing only those that changed, and write the index.
+
+        Returns:
+            The index as written
+        """
+        pages = list(pages) if pages is not None else self.discover_pages()
+        cache = self._load_cache()
+        entries = {}
+        self.reindexed = []
+        for page in pages:
+            path = self.project_root / page
+            stat_result = path.stat()
+            cached = cache.get(page)
+            if cached and cached['stat'] == [stat_result.st_size, stat_result.st_mtime_ns]:
+                entries[page] = cached
+                continue
+            data = path.read_bytes()
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            if cached and cached['digest'] == digest:
+                cached['stat'] = [stat_result.st_size, stat_result.st_mtime_ns]
+                entries[page] = cached
+                continue
+            documents = extract_documents(page, data.decode('utf-8', errors='replace'), self.heading_weight)
+            entries[page] = {
+                'stat': [stat_result.st_size, stat_result.st_mtime_ns],
+                'digest': digest,
+                'documents': [[d.url, d.title, d.terms] for d in documents]
+            }
+            self.reindexed.append(page)
+
+        index = self._assemble(entries[page]['documents'] for page in pages)
+        self._write_json(self.output_file, index)
+        self._write_json(self.cache_file, {'version': self.CACHE_VERSION, 'pages': entries})
+        self.logger.info(
+            f"Search index: {len(index['docs'])} documents, {len(index['terms'])} terms, "
+            f"{self.output_file.stat().st_size} bytes; re-indexed {len(self.reindexed)} of {len(pages)} pages"
+        )
+        return index
+
+    def _assemble(self, page_documents: Iterable[List[list]]) -> Dict:
+        """Merge per-page documents into delta-encoded posting lists"""
+        docs: List[Tuple[str, str]] = []
+        postings: Dict[str, List[int]] = {}
+        last_doc: Dict[str, int] = {}
+        for documents in page_documents:
+            for url, title, terms in documents:
+                number = len(docs)
+                docs.append((url, title))
+                for term, weight in terms.items():
+                    postings.setdefault(term, []).extend((number - last_doc.get(term, 0), weight))
+                    last_doc[term] = number
+        return {
+            'v': 1,
+            'stem': [list(rule) for rule in STEM_RULES],
+            'min': MIN_STEM_LENGTH,
+            'keep': list(KEEP_S_ENDINGS),
+            'stop': sorted(STOPWORDS),
+            'docs': [list(doc) for doc in docs],
+            'terms': dict(sorted(postings.items()))
+        }
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with self.cache_file.open('r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.CACHE_VERSION:
+                return data.get('pages', {})
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable search cache {self.cache_file}: {str(e)}")
+        return {}
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict) -> None:
+        temp_file = path.with_suffix(path.suffix + '.tmp')
+        with temp_file.open('w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_file, path)
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    project_root = Path(__file__).resolve().parents[2]
+    SearchIndexBuilder(project_root).build()
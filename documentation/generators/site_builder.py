@@ -0,0 +1,229 @@
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import logging
+import os
+import re
+
+# A whole line holding only an include or set directive
+INCLUDE_LINE = re.compile(r'^([ \t]*)\{% include "([^"]+)" %\}[ \t]*\n?', re.MULTILINE)
+SET_LINE = re.compile(r'^[ \t]*\{% set (\w+) = "([^"]*)" %\}[ \t]*\n?', re.MULTILINE)
+IF_BLOCK = re.compile(r'\{% if (\w+) == "([^"]*)" %\}(.*?)\{% endif %\}', re.DOTALL)
+VARIABLE = re.compile(r'\{\{ (\w+) \}\}')
+
+def render_template(templates_dir: Path, name: str, variables: Optional[Dict[str, str]] = None,
+                    _stack: Tuple[str, ...] = ()) -> Tuple[str, Set[str]]:
+    """
+    Render one template and everything it includes.
+
+    Supported syntax, deliberately small:
+
+        {% set name = "value" %}         own line; visible to the whole template and its includes
+        {% include "partials/x.html" %}  own line; indented like the directive
+        {% if name == "value" %}...{% endif %}
+        {{ name }}
+
+    Args:
+        templates_dir: Root that include paths are relative to
+        name: Template path relative to templates_dir
+        variables: Values inherited from the including template
+
+    Returns:
+        Rendered text and the set of templates it was built from
+
+    Raises:
+        TemplateError: On include cycles, missing templates or undefined variables
+    """
+    if name in _stack:
+        raise TemplateError(f"Include cycle: {' -> '.join(_stack + (name,))}")
+    path = templates_dir / name
+    try:
+        source = path.read_text(encoding='utf-8')
+    except OSError as e:
+        raise TemplateError(f"Cannot read template {name}: {str(e)}")
+
+    variables = dict(variables or {})
+    dependencies = {name}
+    for key, value in SET_LINE.findall(source):
+        variables[key] = value
+    source = SET_LINE.sub('', source)
+
+    def include(match: re.Match) -> str:
+        indent, child = match.groups()
+        text, child_dependencies = render_template(templates_dir, child, variables, _stack + (name,))
+        dependencies.update(child_dependencies)
+        lines = text.splitlines(keepends=True)
+        return ''.join(indent + line if line.strip() else line for line in lines)
+
+    def substitute(match: re.Match) -> str:
+        if match.group(1) not in variables:
+            raise TemplateError(f"Undefined variable {match.group(1)!r} in {name}")
+        return variables[match.group(1)]
+
+    source = INCLUDE_LINE.sub(include, source)
+    source = IF_BLOCK.sub(lambda m: m.group(3) if variables.get(m.group(1)) == m.group(2) else '', source)
+    return VARIABLE.sub(substitute, source), dependencies
+
+def _render_page(templates_dir: str, page: str) -> Tuple[str, str, List[str]]:
+    text, dependencies = render_template(Path(templates_dir), page)
+    return page, text, sorted(dependencies)
+
+@dataclass
+class BuildResult:
+    rebuilt: List[str] = field(default_factory=list)
+    # Rebuilt but byte-identical to the existing output, which is left untouched
+    identical: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed_sources: List[str] = field(default_factory=list)
+
+class SiteBuilder:
+    """
+    Assembles the root HTML pages from templates/pages and shared partials.
+
+    The manifest records every source file's stat and content hash and the
+    templates each page was built from. A build stats the sources, hashes
+    only those whose stat changed, and re-renders just the pages that
+    depend on a changed source, so one edit costs one page (or the pages
+    sharing the edited partial), not the whole site. Several affected
+    pages are rendered in a process pool.
+    """
+
+    TEMPLATES_DIR = 'templates'
+    PAGES_DIR = 'pages'
+    MANIFEST_NAME = '.site-build.json'
+    MANIFEST_VERSION = 1
+
+    def __init__(self, project_root: Path, templates_dir: Optional[Path] = None,
+                 output_dir: Optional[Path] = None, workers: Optional[int] = None):
+        self.project_root = Path(project_root).resolve()
+        self.templates_dir = Path(templates_dir) if templates_dir else self.project_root / self.TEMPLATES_DIR
+        self.output_dir = Path(output_dir) if output_dir else self.project_root
+        self.manifest_file = self.output_dir / self.MANIFEST_NAME
+        self.workers = workers or os.cpu_count() or 1
+        self.logger = logging.getLogger(__name__)
+
+    def sources(self) -> List[str]:
+        """Every template file, relative to templates_dir"""
+        return sorted(
+            path.relative_to(self.templates_dir).as_posix()
+            for path in self.templates_dir.rglob('*.html') if path.is_file()
+        )
+
+    def pages(self, sources: List[str]) -> List[str]:
+        return [source for source in sources if source.startswith(f"{self.PAGES_DIR}/")]
+
+    def output_path(self, page: str) -> Path:
+        return self.output_dir / page[len(self.PAGES_DIR) + 1:]
+
+    def build(self, force: bool = False) -> BuildResult:
+        """
+        Rebuild the pages affected by source changes since the last build.
+
+        Args:
+            force: Rebuild every page regardless of the manifest
+
+        Returns:
+            Which pages were rebuilt, left alone or removed
+        """
+        manifest = {} if force else self._load_manifest()
+        previous_sources = manifest.get('sources', {})
+        previous_pages = manifest.get('pages', {})
+        result = BuildResult()
+
+        sources = self.sources()
+        current: Dict[str, List] = {}
+        for source in sources:
+            stat_result = (self.templates_dir / source).stat()
+            entry = previous_sources.get(source)
+            if entry and entry[:2] == [stat_result.st_size, stat_result.st_mtime_ns]:
+                current[source] = entry
+                continue
+            digest = hashlib.blake2b((self.templates_dir / source).read_bytes(), digest_size=16).hexdigest()
+            current[source] = [stat_result.st_size, stat_result.st_mtime_ns, digest]
+            if not entry or entry[2] != digest:
+                result.changed_sources.append(source)
+        # Deleted partials invalidate their dependents too
+        changed = set(result.changed_sources) | (set(previous_sources) - set(current))
+
+        pages = self.pages(sources)
+        affected = []
+        for page in pages:
+            record = previous_pages.get(page)
+            if record is None or changed.intersection(record['dependencies']) or \
+                    not self.output_path(page).exists():
+                affected.append(page)
+            else:
+                result.skipped.append(page)
+
+        page_records = {page: previous_pages[page] for page in result.skipped}
+        for page, text, dependencies in self._render(affected):
+            output = self.output_path(page)
+            data = text.encode('utf-8')
+            if output.exists() and output.read_bytes() == data:
+                result.identical.append(page)
+            else:
+                self._write(output, data)
+                result.rebuilt.append(page)
+            page_records[page] = {'dependencies': dependencies}
+
+        for page in sorted(set(previous_pages) - set(pages)):
+            output = self.output_path(page)
+            if output.exists():
+                output.unlink()
+            result.removed.append(page)
+
+        self._write_manifest({'version': self.MANIFEST_VERSION, 'sources': current, 'pages': page_records})
+        self.logger.info(
+            f"Site build: {len(result.rebuilt)} pages written, {len(result.identical)} unchanged after render, "
+            f"{len(result.skipped)} skipped, {len(result.removed)} removed"
+        )
+        return result
+
+    def _render(self, pages: List[str]) -> List[Tuple[str, str, List[str]]]:
+        if not pages:
+            return []
+        templates_dir = [str(self.templates_dir)] * len(pages)
+        if self.workers <= 1 or len(pages) == 1:
+            return list(map(_render_page, templates_dir, pages))
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(pages))) as executor:
+            return list(executor.map(_render_page, templates_dir, pages))
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_suffix(path.suffix + '.tmp')
+        temp_file.write_bytes(data)
+        os.replace(temp_file, path)
+
+    def _load_manifest(self) -> Dict:
+        if not self.manifest_file.exists():
+            return {}
+        try:
+            with self.manifest_file.open('r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.MANIFEST_VERSION:
+                return data
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable build manifest {self.manifest_file}: {str(e)}")
+        return {}
+
+    def _write_manifest(self, manifest: Dict) -> None:
+        temp_file = self.manifest_file.with_suffix('.json.tmp')
+        with temp_file.open('w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(temp_file, self.manifest_file)
+
+class TemplateError(Exception):
+    """Raised when a template cannot be rendered"""
+    pass
+
+if __name__ == '__main__':
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    project_root = Path(__file__).resolve().parents[2]
+    SiteBuilder(project_root).build(force='--force' in sys.argv[1:])
@@ -0,0 +1,93 @@
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set
+from urllib.parse import urlsplit, unquote
+import logging
+import os
+import posixpath
+
+class PathIndex:
+    """Precomputed index of every file in the project, keyed by relative POSIX path"""
+
+    IGNORE_DIRS = {'.git', '__pycache__', '.vscode', 'node_modules', '.pytest_cache', '.mypy_cache', 'dist'}
+
+    def __init__(self, project_root: Path, sizes: Dict[str, int]):
+        self.project_root = Path(project_root)
+        self.sizes = sizes
+
+    @classmethod
+    def build(cls, project_root: Path) -> 'PathIndex':
+        """
+        Walk the project tree once and record the size of every file.
+
+        Args:
+            project_root: Root directory of the site
+
+        Returns:
+            PathIndex covering every non-ignored file under project_root
+        """
+        root = Path(project_root).resolve()
+        sizes: Dict[str, int] = {}
+        stack = [('', str(root))]
+        while stack:
+            prefix, directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        rel = f"{prefix}{entry.name}"
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in cls.IGNORE_DIRS:
+                                stack.append((rel + '/', entry.path))
+                        elif entry.is_file():
+                            sizes[rel] = entry.stat().st_size
+            except OSError as e:
+                logging.getLogger(__name__).error(f"Error accessing directory {directory}: {str(e)}")
+        return cls(root, sizes)
+
+    def __contains__(self, rel_path: str) -> bool:
+        return rel_path in self.sizes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sizes)
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def size_of(self, rel_path: str) -> int:
+        """Get the recorded size of a file, or 0 if it is not indexed"""
+        return self.sizes.get(rel_path, 0)
+
+    def with_suffix(self, *suffixes: str) -> Set[str]:
+        """Get all indexed paths ending with one of the given suffixes"""
+        lowered = tuple(s.lower() for s in suffixes)
+        return {p for p in self.sizes if p.lower().endswith(lowered)}
+
+    @staticmethod
+    def resolve(source: str, reference: str) -> Optional[str]:
+        """
+        Resolve a reference found in a page against the page's location.
+
+        Args:
+            source: Relative POSIX path of the referencing file
+            reference: Raw href/src/url() value
+
+        Returns:
+            Normalized relative path of the target, '' if the reference
+            escapes the project root, or None for external references
+            (any scheme or host, e.g. https:, mailto:, data:)
+        """
+        parts = urlsplit(reference.strip())
+        if parts.scheme or parts.netloc:
+            return None
+        path = unquote(parts.path)
+        if not path:
+            # Pure fragment or query string points back at the source page
+            return source
+        if path.startswith('/'):
+            target = posixpath.normpath(path.lstrip('/'))
+        else:
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(source), path))
+        if path.endswith('/'):
+            target = posixpath.normpath(posixpath.join(target, 'index.html'))
+        if target in ('.', '..') or target.startswith('../'):
+            return ''
+        return target
@@ -0,0 +1,297 @@
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime
+import gzip
+import heapq
+import io
+import logging
+import os
+import posixpath
+import re
+import subprocess
+from .file_table import FileTable
+from .hashing import HashingService
+
+# (relative path, size, content hash)
+SnapshotEntry = Tuple[str, int, str]
+
+SNAPSHOT_HEADER = '# tree-snapshot 1'
+VERSION_PATTERN = re.compile(r'^[0-9A-Za-z.+-]+$')
+
+def write_snapshot(path: Path, entries: Iterable[SnapshotEntry], version: str = '') -> int:
+    """
+    Write entries, which must be sorted by path, as a snapshot file.
+
+    Each line holds the length of the prefix shared with the previous path,
+    the rest of the path, the size and the hash, tab-separated, and the
+    whole file is gzip-compressed. Front coding removes most of the
+    repeated directory names before gzip sees them.
+
+    Returns:
+        Number of entries written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = path.with_suffix(path.suffix + '.tmp')
+    count = 0
+    previous = ''
+    with open(temp_file, 'wb') as raw:
+        with gzip.GzipFile(filename='', mode='wb', fileobj=raw, mtime=0) as compressed:
+            with io.TextIOWrapper(compressed, encoding='utf-8', newline='\n') as f:
+                f.write(f"{SNAPSHOT_HEADER}\t{version}\t{datetime.now().isoformat(timespec='seconds')}\n")
+                for relative, size, digest in entries:
+                    if relative <= previous and count:
+                        raise ValueError(f"Snapshot entries out of order at {relative!r}")
+                    shared = len(os.path.commonprefix((previous, relative)))
+                    f.write(f"{shared}\t{relative[shared:]}\t{size}\t{digest}\n")
+                    previous = relative
+                    count += 1
+    os.replace(temp_file, path)
+    return count
+
+def read_snapshot(path: Path) -> Iterator[SnapshotEntry]:
+    """Stream a snapshot's entries in path order"""
+    with gzip.open(path, 'rt', encoding='utf-8', newline='\n') as f:
+        header = f.readline()
+        if not header.startswith(SNAPSHOT_HEADER):
+            raise ValueError(f"Not a tree snapshot: {path}")
+        previous = ''
+        for line in f:
+            shared, suffix, size, digest = line.rstrip('\n').split('\t')
+            previous = previous[:int(shared)] + suffix
+            yield previous, int(size), digest
+
+@dataclass
+class TreeDiff:
+    old_version: str
+    new_version: str
+    added: List[Tuple[str, int]] = field(default_factory=list)
+    removed: List[Tuple[str, int]] = field(default_factory=list)
+    # (path, old size, new size)
+    changed: List[Tuple[str, int, int]] = field(default_factory=list)
+    # (old path, new path, size)
+    moved: List[Tuple[str, str, int]] = field(default_factory=list)
+    unchanged: int = 0
+    # Net size change per directory, including everything below it
+    directory_deltas: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_delta(self) -> int:
+        return self.directory_deltas.get('', 0)
+
+def diff_snapshots(old: Iterable[SnapshotEntry], new: Iterable[SnapshotEntry],
+                   old_version: str = '', new_version: str = '') -> TreeDiff:
+    """
+    Merge-join two path-sorted snapshot streams in one linear pass.
+
+    Only differences are held in memory, so two large snapshots of mostly
+    identical trees compare in constant memory plus the size of the change.
+    A removed and an added file with the same content hash are reported as
+    a move.
+    """
+    diff = TreeDiff(old_version, new_version)
+    deltas: Dict[str, int] = {}
+    removed: List[SnapshotEntry] = []
+    added: List[SnapshotEntry] = []
+
+    def record(relative: str, delta: int) -> None:
+        if delta:
+            directory = posixpath.dirname(relative)
+            deltas[directory] = deltas.get(directory, 0) + delta
+
+    old_iter, new_iter = iter(old), iter(new)
+    old_entry, new_entry = next(old_iter, None), next(new_iter, None)
+    while old_entry is not None or new_entry is not None:
+        if new_entry is None or (old_entry is not None and old_entry[0] < new_entry[0]):
+            removed.append(old_entry)
+            record(old_entry[0], -old_entry[1])
+            old_entry = next(old_iter, None)
+        elif old_entry is None or new_entry[0] < old_entry[0]:
+            added.append(new_entry)
+            record(new_entry[0], new_entry[1])
+            new_entry = next(new_iter, None)
+        else:
+            if old_entry[2] != new_entry[2]:
+                diff.changed.append((old_entry[0], old_entry[1], new_entry[1]))
+                record(old_entry[0], new_entry[1] - old_entry[1])
+            else:
+                diff.unchanged += 1
+            old_entry, new_entry = next(old_iter, None), next(new_iter, None)
+
+    removed_by_hash: Dict[str, List[SnapshotEntry]] = {}
+    for entry in removed:
+        removed_by_hash.setdefault(entry[2], []).append(entry)
+    for entry in added:
+        # Empty files all share one hash, so they never count as moves
+        candidates = removed_by_hash.get(entry[2]) if entry[1] else None
+        if candidates:
+            source = candidates.pop(0)
+            diff.moved.append((source[0], entry[0], entry[1]))
+        else:
+            diff.added.append((entry[0], entry[1]))
+    diff.removed = sorted((entry[0], entry[1]) for group in removed_by_hash.values() for entry in group)
+
+    rolled: Dict[str, int] = {}
+    for directory, delta in deltas.items():
+        while True:
+            rolled[directory] = rolled.get(directory, 0) + delta
+            if not directory:
+                break
+            directory = posixpath.dirname(directory)
+    diff.directory_deltas = {directory: delta for directory, delta in sorted(rolled.items()) if delta}
+    return diff
+
+class SnapshotStore:
+    """
+    Per-version tree snapshots under documentation/snapshots.
+
+    A snapshot is named after the release version it was taken for, so
+    comparing two releases is diff('0.9.0', '1.0.0'). When a VersionManager
+    is given, versions are checked against its history first. Files git
+    ignores (build output, caches, compressed copies) are left out, so
+    snapshots describe the source tree only.
+    """
+
+    DIRECTORY_NAME = 'snapshots'
+    EXTENSION = '.snap'
+    # Hash at most this many files at a time, so hashing a very large tree
+    # does not hold every digest in memory at once
+    HASH_BATCH = 10_000
+
+    def __init__(self, project_root: Path, directory: Optional[Path] = None,
+                 hashing: Optional[HashingService] = None, versions=None):
+        self.project_root = Path(project_root).resolve()
+        self.directory = Path(directory) if directory else self.project_root / 'documentation' / self.DIRECTORY_NAME
+        self.hashing = hashing or HashingService()
+        self.versions = versions
+        self.logger = logging.getLogger(__name__)
+
+    def path_for(self, version: str) -> Path:
+        if not VERSION_PATTERN.match(version):
+            raise ValueError(f"Invalid version name: {version!r}")
+        return self.directory / f"{version}{self.EXTENSION}"
+
+    def available(self) -> List[str]:
+        return sorted(path.name[:-len(self.EXTENSION)] for path in self.directory.glob(f"*{self.EXTENSION}"))
+
+    def scan(self, table: Optional[FileTable] = None) -> Iterator[SnapshotEntry]:
+        """
+        Entries for the current tree in path order.
+
+        Args:
+            table: A scan to reuse, defaults to a fresh FileTable.scan that
+                skips the snapshot directory itself
+        """
+        if table is None:
+            table = FileTable.scan(self.project_root, FileTable.IGNORE_DIRS | {self.DIRECTORY_NAME})
+        ignored = self.ignored_paths()
+        rows = sorted(
+            (row.relative_path, row.size) for row in table
+            if not (ignored and self._is_ignored(row.relative_path, ignored))
+        )
+        for start in range(0, len(rows), self.HASH_BATCH):
+            batch = rows[start:start + self.HASH_BATCH]
+            digests = self.hashing.hash_many(table.root / relative for relative, _ in batch)
+            for relative, size in batch:
+                yield relative, size, digests[table.root / relative]
+
+    def ignored_paths(self) -> Set[str]:
+        """
+        Untracked paths git ignores; ignored directories end with '/'.
+
+        Returns an empty set, so nothing is filtered, when the tree is not a
+        git work tree or git is unavailable.
+        """
+        try:
+            completed = subprocess.run(
+                ['git', '-C', str(self.project_root), 'ls-files', '-z', '--others', '--ignored',
+                 '--exclude-standard', '--directory'],
+                capture_output=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.logger.warning(f"Not filtering git-ignored files from the snapshot: {str(e)}")
+            return set()
+        return {path for path in completed.stdout.decode('utf-8', 'surrogateescape').split('\0') if path}
+
+    @staticmethod
+    def _is_ignored(relative: str, ignored: Set[str]) -> bool:
+        if relative in ignored:
+            return True
+        directory = posixpath.dirname(relative)
+        while directory:
+            if f"{directory}/" in ignored:
+                return True
+            directory = posixpath.dirname(directory)
+        return False
+
+    def record(self, version: str, table: Optional[FileTable] = None) -> Path:
+        """Snapshot the current tree as version, replacing any earlier snapshot of it"""
+        path = self.path_for(version)
+        count = write_snapshot(path, self.scan(table), version)
+        self.hashing.save()
+        self.logger.info(f"Recorded snapshot of {count} files for version {version} ({path.stat().st_size} bytes)")
+        return path
+
+    def diff(self, old_version: str, new_version: str) -> TreeDiff:
+        """
+        Compare the snapshots of two versions.
+
+        Raises:
+            ValueError: If a version is unknown to the VersionManager or has
+                no snapshot
+        """
+        paths = []
+        for version in (old_version, new_version):
+            if self.versions is not None:
+                self.versions.get_version(version)
+            path = self.path_for(version)
+            if not path.exists():
+                raise ValueError(f"No snapshot recorded for version {version}")
+            paths.append(path)
+        return diff_snapshots(read_snapshot(paths[0]), read_snapshot(paths[1]), old_version, new_version)
+
+    @staticmethod
+    def format(diff: TreeDiff, limit: int = 50) -> List[str]:
+        """Render a diff as Markdown lines, listing at most limit entries per kind"""
+        lines = [
+            f"## Changes from {diff.old_version} to {diff.new_version}\n",
+            f"- Added: {len(diff.added)}, removed: {len(diff.removed)}, changed: {len(diff.changed)}, "
+            f"moved: {len(diff.moved)}, unchanged: {diff.unchanged}",
+            f"- Net size change: {diff.total_delta:+,} bytes\n",
+        ]
+        sections = [
+            ('Added', [f"{path} ({size:,} bytes)" for path, size in diff.added]),
+            ('Removed', [f"{path} ({size:,} bytes)" for path, size in diff.removed]),
+            ('Changed', [f"{path} ({old:,} -> {new:,} bytes)" for path, old, new in diff.changed]),
+            ('Moved', [f"{old} -> {new}" for old, new, _ in diff.moved]),
+        ]
+        largest = heapq.nlargest(limit, diff.directory_deltas.items(), key=lambda item: abs(item[1]))
+        sections.append(('Directory Size Changes', [f"{directory or '.'}/: {delta:+,} bytes" for directory, delta in largest]))
+        for title, items in sections:
+            if items:
+                lines.append(f"### {title}\n")
+                lines.extend(f"- {item}" for item in items[:limit])
+                if len(items) > limit:
+                    lines.append(f"- … {len(items) - limit} more")
+                lines.append('')
+        return lines
+
+if __name__ == '__main__':
+    import sys
+    from ..version_manager import VersionManager
+
+    logging.basicConfig(level=logging.INFO)
+    project_root = Path(__file__).resolve().parents[2]
+    version_file = project_root / 'documentation' / 'versions.yaml'
+    versions = VersionManager(version_file) if version_file.exists() else None
+    store = SnapshotStore(project_root, versions=versions)
+    if len(sys.argv) == 4 and sys.argv[1] == 'diff':
+        print('\n'.join(store.format(store.diff(sys.argv[2], sys.argv[3]))))
+    elif len(sys.argv) == 3 and sys.argv[1] == 'record':
+        store.record(sys.argv[2])
+    elif len(sys.argv) == 2 and sys.argv[1] == 'record' and versions is not None:
+        store.record(versions.current_version.version)
+    else:
+        print("Usage: python -m documentation.generators.snapshots record [VERSION] | diff OLD NEW")
+        sys.exit(2)
@@ -0,0 +1,206 @@
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from collections import Counter
+from html.parser import HTMLParser
+from ..generators.accessibility import AccessibilitySession
+
+# Elements that never have content or an end tag
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+}
+
+# Elements that end an open <p>, as in the HTML parsing algorithm
+P_CLOSING_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'center', 'details', 'dialog', 'dir', 'div', 'dd', 'dl',
+    'dt', 'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hgroup', 'hr', 'li', 'listing', 'main', 'menu', 'nav', 'ol', 'p', 'pre', 'section',
+    'summary', 'table', 'ul'
+})
+# Elements a search for an implicitly closed <p>, <li>, <dt> or <dd> never looks past
+SCOPE_BOUNDARIES = frozenset({'applet', 'button', 'caption', 'html', 'marquee', 'object', 'table', 'td', 'th', 'template'})
+TABLE_SECTIONS = frozenset({'thead', 'tbody', 'tfoot'})
+# Start tag -> (open elements it implicitly closes, elements the search stops at)
+IMPLIED_END_TAGS: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {
+    'li': (frozenset({'li'}), SCOPE_BOUNDARIES | {'ul', 'ol'}),
+    'dt': (frozenset({'dt', 'dd'}), SCOPE_BOUNDARIES | {'dl'}),
+    'dd': (frozenset({'dt', 'dd'}), SCOPE_BOUNDARIES | {'dl'}),
+    # A new row also ends the cells of the previous one
+    'tr': (frozenset({'tr'}), TABLE_SECTIONS | {'table', 'template'}),
+    'td': (frozenset({'td', 'th'}), frozenset({'tr', 'table', 'template'})),
+    'th': (frozenset({'td', 'th'}), frozenset({'tr', 'table', 'template'})),
+    'thead': (TABLE_SECTIONS, frozenset({'table', 'template'})),
+    'tbody': (TABLE_SECTIONS, frozenset({'table', 'template'})),
+    'tfoot': (TABLE_SECTIONS, frozenset({'table', 'template'})),
+    'option': (frozenset({'option'}), frozenset({'select', 'datalist', 'optgroup'})),
+    'optgroup': (frozenset({'option', 'optgroup'}), frozenset({'select', 'datalist'})),
+}
+
+class StreamElement:
+    """
+    Minimal stand-in for a bs4 Tag, built by the streaming parser.
+
+    Exposes just the Tag API the accessibility rules use. Text and nested
+    images are only collected for elements that need them, and text is capped
+    so one huge element cannot grow memory without bound. Ancestor lookups
+    go to the parser's shared count of open elements, so they are only
+    meaningful while the element is being visited.
+    """
+
+    TEXT_LIMIT = 4096
+
+    __slots__ = ('name', 'attrs', 'open_elements', 'text', 'images', 'collect')
+
+    def __init__(self, name: str, attrs: Dict[str, str], open_elements: Counter, collect: bool):
+        self.name = name
+        self.attrs = attrs
+        self.open_elements = open_elements
+        self.text: List[str] = []
+        self.images: List['StreamElement'] = []
+        self.collect = collect
+
+    def get(self, key: str, default=None):
+        return self.attrs.get(key, default)
+
+    def __getitem__(self, key: str) -> str:
+        return self.attrs[key]
+
+    def add_text(self, data: str) -> None:
+        if sum(map(len, self.text)) < self.TEXT_LIMIT:
+            self.text.append(data)
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        parts = [t.strip() for t in self.text] if strip else self.text
+        return separator.join(p for p in parts if p or not strip)
+
+    def find_all(self, name: str) -> List['StreamElement']:
+        return self.images if name == 'img' else []
+
+    def find_parent(self, name: str) -> Optional[str]:
+        return name if self.open_elements[name] else None
+
+class StreamingHtmlParser(HTMLParser):
+    """
+    Incremental HTML parser that extracts analysis results without a DOM.
+
+    Feed it chunks of text; only the open-element stack and the extracted
+    results are kept, so memory stays bounded by chunk size plus results.
+    Optional end tags (p, li, dt/dd, table rows and cells, options) are
+    implied the way browsers imply them, so unclosed markup does not grow
+    the stack.
+    """
+
+    TEXT_ELEMENTS = {'a', 'title'}
+    LANDMARK_TAGS = {'header', 'nav', 'main', 'section', 'footer'}
+
+    def __init__(self, accessibility: AccessibilitySession):
+        super().__init__(convert_charrefs=True)
+        self.accessibility = accessibility
+        self.stack: List[StreamElement] = []
+        # Number of open elements per tag name, shared with every StreamElement
+        self.open_elements: Counter = Counter()
+        self.title: Optional[str] = None
+        self.meta_description: Optional[str] = None
+        self.scripts: List[str] = []
+        self.stylesheets: List[str] = []
+        self.sections: List[str] = []
+        self.navigation: List[Dict[str, str]] = []
+        self._collectors: List[StreamElement] = []
+        self._pending_text: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self._flush_text()
+        self._close_implied(tag)
+        attributes = {name: value or '' for name, value in attrs}
+        element = StreamElement(tag, attributes, self.open_elements, collect=tag in self.TEXT_ELEMENTS)
+        self._extract(element)
+        if tag == 'img':
+            for collector in self._collectors:
+                collector.images.append(element)
+        if tag in VOID_ELEMENTS:
+            self.accessibility.visit(element)
+            return
+        self.stack.append(element)
+        self.open_elements[tag] += 1
+        if element.collect:
+            self._collectors.append(element)
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+        if not self.open_elements[tag]:
+            # Stray end tag; browsers ignore it too
+            return
+        # Close the nearest matching element, implicitly closing any left open inside it
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index].name == tag:
+                self._pop_to(index)
+                return
+
+    def _close_implied(self, tag: str) -> None:
+        """Close elements whose end tag the start of tag implies"""
+        if tag in P_CLOSING_TAGS and self.open_elements['p']:
+            self._close_nearest(frozenset({'p'}), SCOPE_BOUNDARIES)
+        implied = IMPLIED_END_TAGS.get(tag)
+        if implied and any(self.open_elements[name] for name in implied[0]):
+            self._close_nearest(*implied)
+
+    def _close_nearest(self, names: FrozenSet[str], boundaries: FrozenSet[str]) -> None:
+        for index in range(len(self.stack) - 1, -1, -1):
+            name = self.stack[index].name
+            if name in names:
+                self._pop_to(index)
+                return
+            if name in boundaries:
+                return
+
+    def _pop_to(self, index: int) -> None:
+        while len(self.stack) > index:
+            element = self.stack.pop()
+            self.open_elements[element.name] -= 1
+            self._close(element)
+
+    def handle_data(self, data: str) -> None:
+        # A text node split across chunks arrives in pieces; join them before handing out
+        if self._collectors and sum(map(len, self._pending_text)) < StreamElement.TEXT_LIMIT:
+            self._pending_text.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text()
+        self._pop_to(0)
+
+    def _flush_text(self) -> None:
+        if self._pending_text:
+            text = ''.join(self._pending_text)
+            self._pending_text = []
+            for collector in self._collectors:
+                collector.add_text(text)
+
+    def _close(self, element: StreamElement) -> None:
+        if element.collect:
+            # Collectors close innermost first, so this is almost always the last one
+            if self._collectors[-1] is element:
+                self._collectors.pop()
+            else:
+                self._collectors.remove(element)
+            if element.name == 'title' and self.title is None:
+                self.title = element.get_text()
+            elif element.name == 'a' and self.open_elements['nav'] and element.get('href'):
+                self.navigation.append({'text': element.get_text(' ', strip=True), 'href': element['href']})
+        self.accessibility.visit(element)
+
+    def _extract(self, element: StreamElement) -> None:
+        """Record scripts, stylesheets, sections and meta description as tags open"""
+        name = element.name
+        if name == 'script' and element.get('src'):
+            self.scripts.append(element['src'])
+        elif name == 'link' and 'stylesheet' in element.get('rel', '').lower().split() and element.get('href'):
+            self.stylesheets.append(element['href'])
+        elif name == 'meta' and element.get('name', '').lower() == 'description' and self.meta_description is None:
+            self.meta_description = element.get('content')
+        elif name in self.LANDMARK_TAGS:
+            self.sections.append(name)
@@ -2,14 +2,14 @@ from pathlib import Path
 from typing import List, Dict, Set
 import logging
 from ..generators.models import FileMetadata  # Import from models instead of defining here
+from ..generators.file_table import FileTable
 
-class ProjectStructureGenerator(BaseGenerator):
+class ProjectStructureGenerator:
     """Generates comprehensive project structure documentation"""
     
-    IGNORE_PATTERNS = {
-        '.git', '__pycache__', '.vscode', 'node_modules',
-        '.DS_Store', 'Thumbs.db', '*.pyc', '*.pyo'
-    }
+    IGNORE_DIRS = {'.git', '__pycache__', '.vscode', 'node_modules'}
+    IGNORE_FILES = {'.DS_Store', 'Thumbs.db', '*.pyc', '*.pyo'}
+    IGNORE_PATTERNS = IGNORE_DIRS | IGNORE_FILES
     
     BINARY_EXTENSIONS = {'.jpg', '.png', '.gif', '.ico', '.pdf', '.ttf', '.woff'}
     
@@ -46,24 +46,14 @@ class ProjectStructureGenerator(BaseGenerator):
         ]
     
     def _collect_statistics(self) -> Dict:
-        """Collect project statistics"""
-        stats = {
-            'total_files': 0,
-            'total_dirs': 0,
-            'total_size': 0,
-            'extensions': {}
+        """Collect project statistics from a columnar scan of the tree"""
+        table = FileTable.scan(self.project_root, ignore=self.IGNORE_DIRS, ignore_files=self.IGNORE_FILES)
+        return {
+            'total_files': len(table),
+            'total_dirs': table.total_dirs,
+            'total_size': table.total_size,
+            'extensions': table.extension_histogram()
         }
-        
-        for item in self._iterate_project_files():
-            if item.is_file():
-                stats['total_files'] += 1
-                stats['total_size'] += item.stat().st_size
-                ext = item.suffix.lower()
-                stats['extensions'][ext] = stats['extensions'].get(ext, 0) + 1
-            else:
-                stats['total_dirs'] += 1
-                
-        return stats
     
     def _generate_detailed_structure(self) -> List[str]:
         """Generate detailed project structure"""
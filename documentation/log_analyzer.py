@@ -0,0 +1,344 @@
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+import argparse
+import gzip
+import heapq
+import json
+import logging
+import mmap
+import re
+
+TIMESTAMP_PREFIX = b'{"timestamp": "'
+ERROR_LEVELS = frozenset({'ERROR', 'CRITICAL'})
+
+# Variable parts of exception messages, replaced so that the same failure
+# with different paths, ids or addresses maps to one signature
+_QUOTED = re.compile(r"'[^']*'|\"[^\"]*\"")
+_NUMBER = re.compile(r'0x[0-9a-fA-F]+|\d+')
+_FRAME = re.compile(r'File "([^"]+)", line \d+, in (\S+)')
+# Skips json.loads' per-call encoding detection on bytes input
+_decode = json.JSONDecoder().decode
+
+class SpaceSaving:
+    """
+    Heavy-hitter sketch (Metwally et al.) keeping at most capacity counters.
+
+    Counts of reported items are upper bounds; error holds how much of the
+    count may belong to evicted items. Any item occurring more than
+    total / capacity times is guaranteed to be present.
+    """
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        # Lazy min-heap of (count, item); stale entries are skipped on eviction
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, item: str, count: int = 1) -> None:
+        self.total += count
+        if item in self._counts:
+            self._counts[item] += count
+        elif len(self._counts) < self.capacity:
+            self._counts[item] = count
+            self._errors[item] = 0
+            return
+        else:
+            floor, victim = self._pop_min()
+            del self._counts[victim], self._errors[victim]
+            self._counts[item] = floor + count
+            self._errors[item] = floor
+        if self._heap:
+            # The heap only exists once something has been evicted
+            heapq.heappush(self._heap, (self._counts[item], item))
+            if len(self._heap) > 4 * self.capacity:
+                self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(count, item) for item, count in self._counts.items()]
+        heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[int, str]:
+        if not self._heap:
+            self._rebuild_heap()
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self._counts.get(item) == count:
+                return count, item
+
+    def top(self, n: int = 10) -> List[Tuple[str, int, int]]:
+        """Most frequent items as (item, count, error)"""
+        items = sorted(self._counts.items(), key=lambda entry: (-entry[1], entry[0]))[:n]
+        return [(item, count, self._errors[item]) for item, count in items]
+
+@dataclass
+class ErrorBurst:
+    start: datetime
+    end: datetime
+    errors: int
+
+class BurstDetector:
+    """
+    Flags periods where at least threshold errors fall within window seconds.
+
+    Errors are kept as per-second buckets, so memory is bounded by the
+    window length rather than by the burst size.
+    """
+
+    def __init__(self, window: int = 60, threshold: int = 50):
+        self.window = window
+        self.threshold = threshold
+        self.bursts: List[ErrorBurst] = []
+        self._buckets: Deque[List] = deque()
+        self._in_window = 0
+        self._current: Optional[ErrorBurst] = None
+
+    def add(self, timestamp: datetime) -> None:
+        second = int(timestamp.timestamp())
+        if self._buckets and self._buckets[-1][0] == second:
+            self._buckets[-1][1] += 1
+        else:
+            self._buckets.append([second, 1])
+        self._in_window += 1
+        while self._buckets[0][0] <= second - self.window:
+            self._in_window -= self._buckets.popleft()[1]
+
+        if self._current and self._in_window < self.threshold:
+            self._close()
+        elif self._current:
+            self._current.end = timestamp
+            self._current.errors += 1
+        elif self._in_window >= self.threshold:
+            start = datetime.fromtimestamp(self._buckets[0][0])
+            self._current = ErrorBurst(start, timestamp, self._in_window)
+
+    def _close(self) -> None:
+        self.bursts.append(self._current)
+        self._current = None
+
+    def finish(self) -> List[ErrorBurst]:
+        if self._current:
+            self._close()
+        return self.bursts
+
+@dataclass
+class LogSummary:
+    files: List[Path] = field(default_factory=list)
+    records: int = 0
+    skipped: int = 0
+    malformed: int = 0
+    first: Optional[datetime] = None
+    last: Optional[datetime] = None
+    levels: Counter = field(default_factory=Counter)
+    loggers: SpaceSaving = field(default_factory=SpaceSaving)
+    modules: SpaceSaving = field(default_factory=SpaceSaving)
+    functions: SpaceSaving = field(default_factory=SpaceSaving)
+    exceptions: SpaceSaving = field(default_factory=SpaceSaving)
+    bursts: List[ErrorBurst] = field(default_factory=list)
+
+    @property
+    def span_minutes(self) -> float:
+        if self.first is None or self.last is None:
+            return 0.0
+        return max((self.last - self.first).total_seconds() / 60, 1 / 60)
+
+    def rate(self, count: int) -> float:
+        """Events per minute over the analysed span"""
+        return count / self.span_minutes if self.span_minutes else 0.0
+
+def exception_signature(traceback_text: str) -> str:
+    """
+    Reduce a formatted traceback to 'Type: normalised message @ function (file)'.
+
+    The innermost frame locates the failure; line numbers are dropped so a
+    signature survives unrelated edits to the same file.
+    """
+    lines = [line for line in traceback_text.strip().splitlines() if line.strip()]
+    if not lines:
+        return 'unknown'
+    message = _NUMBER.sub('N', _QUOTED.sub('S', lines[-1].strip()))
+    frames = _FRAME.findall(traceback_text)
+    if frames:
+        filename, function = frames[-1]
+        return f"{message} @ {function} ({Path(filename).name})"
+    return message
+
+class StructuredLogAnalyzer:
+    """
+    Streams the JSON log written by LogConfig and its rotated backups.
+
+    Plain files are scanned through mmap and gzip backups are decompressed
+    incrementally, so memory use does not depend on log size. Records
+    outside the time window are rejected from the timestamp prefix without
+    JSON parsing, and whole files last written before the window are not
+    opened at all. Per-key tallies use SpaceSaving sketches, so unbounded
+    key cardinality cannot exhaust memory either.
+    """
+
+    def __init__(self, log_dir: Path, app_name: str, capacity: int = 100,
+                 burst_window: int = 60, burst_threshold: int = 50):
+        self.log_dir = Path(log_dir)
+        self.app_name = app_name
+        self.capacity = capacity
+        self.burst_window = burst_window
+        self.burst_threshold = burst_threshold
+        self.logger = logging.getLogger(__name__)
+
+    def log_files(self) -> List[Path]:
+        """The structured log and its backups (.N or .N.gz), oldest first"""
+        base = f"{self.app_name}_structured.json"
+        numbered = []
+        for path in self.log_dir.glob(f"{base}.*"):
+            suffix = path.name[len(base) + 1:].removesuffix('.gz')
+            if suffix.isdigit():
+                numbered.append((int(suffix), path))
+        files = [path for _, path in sorted(numbered, reverse=True)]
+        if (self.log_dir / base).exists():
+            files.append(self.log_dir / base)
+        return files
+
+    @staticmethod
+    def _local_naive(moment: Optional[datetime]) -> Optional[datetime]:
+        if moment is None or moment.tzinfo is None:
+            return moment
+        return moment.astimezone().replace(tzinfo=None)
+
+    def analyze(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> LogSummary:
+        """
+        Aggregate all records with since <= timestamp < until.
+
+        JsonFormatter writes naive local timestamps, so timezone-aware bounds
+        are converted to naive local time before comparing.
+
+        Args:
+            since: Inclusive lower bound, defaults to the first record
+            until: Exclusive upper bound, defaults to the last record
+
+        Returns:
+            Counts, rates, bursts and top exception signatures
+        """
+        since, until = self._local_naive(since), self._local_naive(until)
+        summary = LogSummary(
+            loggers=SpaceSaving(self.capacity), modules=SpaceSaving(self.capacity),
+            functions=SpaceSaving(self.capacity), exceptions=SpaceSaving(self.capacity)
+        )
+        bursts = BurstDetector(self.burst_window, self.burst_threshold)
+        # ISO timestamps from JsonFormatter compare correctly as bytes
+        low = since.isoformat().encode('ascii') if since else None
+        high = until.isoformat().encode('ascii') if until else None
+
+        for path in self.log_files():
+            if since and datetime.fromtimestamp(path.stat().st_mtime) < since:
+                continue
+            summary.files.append(path)
+            for line in self._lines(path):
+                if low or high:
+                    stamp = self._timestamp_prefix(line)
+                    if stamp is not None and ((low and stamp < low) or (high and stamp >= high)):
+                        summary.skipped += 1
+                        continue
+                try:
+                    record = _decode(line.decode('utf-8'))
+                    timestamp = datetime.fromisoformat(record['timestamp'])
+                except (ValueError, KeyError, TypeError):
+                    summary.malformed += 1
+                    continue
+                if (since and timestamp < since) or (until and timestamp >= until):
+                    summary.skipped += 1
+                    continue
+                self._add(summary, bursts, record, timestamp)
+
+        summary.bursts = bursts.finish()
+        self.logger.info(
+            f"Analysed {summary.records} records from {len(summary.files)} files "
+            f"({summary.skipped} outside window, {summary.malformed} malformed)"
+        )
+        return summary
+
+    @staticmethod
+    def _add(summary: LogSummary, bursts: BurstDetector, record: Dict, timestamp: datetime) -> None:
+        summary.records += 1
+        if summary.first is None or timestamp < summary.first:
+            summary.first = timestamp
+        if summary.last is None or timestamp > summary.last:
+            summary.last = timestamp
+        level = record.get('level', 'UNKNOWN')
+        module = record.get('module', '?')
+        summary.levels[level] += 1
+        summary.loggers.add(record.get('logger', '?'))
+        summary.modules.add(module)
+        summary.functions.add(f"{module}.{record.get('function', '?')}")
+        if 'exception' in record:
+            summary.exceptions.add(exception_signature(record['exception']))
+        if level in ERROR_LEVELS:
+            bursts.add(timestamp)
+
+    @staticmethod
+    def _timestamp_prefix(line: bytes) -> Optional[bytes]:
+        if not line.startswith(TIMESTAMP_PREFIX):
+            return None
+        end = line.find(b'"', len(TIMESTAMP_PREFIX))
+        return line[len(TIMESTAMP_PREFIX):end] if end > 0 else None
+
+    def _lines(self, path: Path) -> Iterator[bytes]:
+        try:
+            if path.suffix == '.gz':
+                with gzip.open(path, 'rb') as f:
+                    yield from (line for line in f if line.strip())
+                return
+            with path.open('rb') as f:
+                if path.stat().st_size == 0:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield from (line for line in iter(mapped.readline, b'') if line.strip())
+        except (OSError, EOFError) as e:
+            # Truncated gzip backups still yield the lines before the damage
+            self.logger.warning(f"Stopped reading {path}: {str(e)}")
+
+    @staticmethod
+    def format(summary: LogSummary, top: int = 10) -> List[str]:
+        """Render a summary as Markdown lines"""
+        window = f"{summary.first:%Y-%m-%d %H:%M:%S} – {summary.last:%Y-%m-%d %H:%M:%S}" if summary.first else 'empty'
+        lines = [
+            "## Structured Log Summary\n",
+            f"- Files: {', '.join(path.name for path in summary.files) or 'none'}",
+            f"- Records: {summary.records} ({summary.rate(summary.records):.1f}/min), window {window}",
+            f"- Outside time window: {summary.skipped}, malformed: {summary.malformed}\n",
+            "### Levels\n",
+        ]
+        lines.extend(
+            f"- {level}: {count} ({summary.rate(count):.2f}/min)" for level, count in summary.levels.most_common()
+        )
+        for title, sketch in (('Loggers', summary.loggers), ('Modules', summary.modules),
+                              ('Functions', summary.functions), ('Exception Signatures', summary.exceptions)):
+            lines.append(f"\n### {title}\n")
+            for item, count, error in sketch.top(top):
+                bound = f" (±{error})" if error else ''
+                lines.append(f"- {item}: {count}{bound}, {summary.rate(count):.2f}/min")
+        lines.append("\n### Error Bursts\n")
+        if not summary.bursts:
+            lines.append("- None")
+        lines.extend(
+            f"- {burst.start:%Y-%m-%d %H:%M:%S} – {burst.end:%H:%M:%S}: {burst.errors} errors"
+            for burst in summary.bursts
+        )
+        return lines
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Summarise structured JSON logs written by LogConfig')
+    parser.add_argument('log_dir', type=Path)
+    parser.add_argument('app_name')
+    parser.add_argument('--since', type=datetime.fromisoformat)
+    parser.add_argument('--until', type=datetime.fromisoformat)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--burst-window', type=int, default=60)
+    parser.add_argument('--burst-threshold', type=int, default=50)
+    args = parser.parse_args()
+    analyzer = StructuredLogAnalyzer(
+        args.log_dir, args.app_name, burst_window=args.burst_window, burst_threshold=args.burst_threshold
+    )
+    print('\n'.join(analyzer.format(analyzer.analyze(args.since, args.until), args.top)))
@@ -1,8 +1,13 @@
 import logging
 import logging.handlers
 from pathlib import Path
+from collections import deque
+import atexit
 import json
+import threading
+import time
 from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 class LogConfig:
     """Centralized logging configuration"""
@@ -14,8 +19,14 @@ class LogConfig:
         self.app_name = app_name
         self.log_dir.mkdir(parents=True, exist_ok=True)
     
-    def configure(self, level: int = logging.INFO) -> None:
-        """Configure logging with rotation and proper formatting"""
+    def configure(self, level: int = logging.INFO, log_filter: Optional[logging.Filter] = None) -> None:
+        """
+        Configure logging with rotation and proper formatting.
+
+        Args:
+            level: Root logger level
+            log_filter: Optional filter, e.g. a RateLimitFilter, shared by all handlers
+        """
         try:
             # Main log file with rotation
             main_handler = self._create_rotating_handler(
@@ -46,9 +57,10 @@ class LogConfig:
                 root_logger.removeHandler(handler)
             
             # Add handlers
-            root_logger.addHandler(main_handler)
-            root_logger.addHandler(error_handler)
-            root_logger.addHandler(json_handler)
+            for handler in (main_handler, error_handler, json_handler):
+                if log_filter is not None:
+                    handler.addFilter(log_filter)
+                root_logger.addHandler(handler)
             
         except Exception as e:
             raise RuntimeError(f"Failed to configure logging: {e}")
@@ -94,5 +106,178 @@ class JsonFormatter(logging.Formatter):
         
         if record.exc_info:
             data['exception'] = self.formatException(record.exc_info)
+
+        for key in ('repeats', 'dropped'):
+            if getattr(record, key, 0):
+                data[key] = getattr(record, key)
             
-        return json.dumps(data)
\ No newline at end of file
+        return json.dumps(data)
+
+class RateLimitFilter(logging.Filter):
+    """
+    Collapses repeated log records and rate-limits each logger.
+
+    A record whose key was already emitted within the last window seconds
+    is suppressed and counted. With the default key='site' the key is the
+    call site (logger, level, file and line), since messages are usually
+    pre-formatted f-strings; this also collapses *different* messages logged
+    from one line, e.g. a per-file error inside a loop. key='message' keys
+    on the formatted message instead. When a key's window expires with
+    records suppressed, a summary record carrying the count (as a suffix and
+    a ``repeats`` attribute) is logged through the same logger, repeating
+    the last suppressed message.
+
+    Records that pass deduplication then draw from a per-logger token bucket
+    refilled at rate tokens per second up to burst; when the bucket is empty
+    they are dropped. The next record emitted by that logger reports how
+    many, or a summary record does once window seconds pass without one.
+
+    Expired windows are flushed when the next record arrives on any key, and
+    everything still pending by flush(), which close() and interpreter exit
+    call. Records at or above exempt_level always pass. The decision is
+    stored on the record, so one instance can be shared by several handlers
+    and suppressed records cost a lock, a dict lookup and a clock read.
+    """
+
+    def __init__(self, window: float = 10.0, rate: float = 20.0, burst: int = 100,
+                 key: str = 'site', exempt_level: int = logging.CRITICAL,
+                 max_keys: int = 10_000, clock: Callable[[], float] = time.monotonic):
+        super().__init__()
+        if key not in ('site', 'message'):
+            raise ValueError(f"Unknown deduplication key: {key}")
+        self.window = window
+        self.rate = rate
+        self.burst = burst
+        self.key = key
+        self.exempt_level = exempt_level
+        self.max_keys = max_keys
+        self.clock = clock
+        # key -> [time first emitted, suppressed since, last suppressed record]
+        self._seen: Dict[Tuple, List] = {}
+        # logger name -> [tokens, last refill, dropped since last emitted record, time of first drop]
+        self._buckets: Dict[str, List] = {}
+        # (expiry, key or logger name, start) in expiry order, since the window is fixed
+        self._repeat_expiries: Deque[Tuple[float, Tuple, float]] = deque()
+        self._drop_expiries: Deque[Tuple[float, str, float]] = deque()
+        self._lock = threading.Lock()
+        self.suppressed = 0
+        self.dropped = 0
+        atexit.register(self.flush)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        decision = record.__dict__.get('_rate_limit_decision')
+        if decision is not None:
+            return decision
+        with self._lock:
+            decision, summaries = self._decide(record)
+        record._rate_limit_decision = decision
+        self._emit(summaries)
+        return decision
+
+    def flush(self) -> None:
+        """Log summaries for every pending repeat and drop count"""
+        with self._lock:
+            summaries = self._expire(float('inf'))
+        self._emit(summaries)
+
+    def close(self) -> None:
+        """Flush pending counts; the filter no longer needs flushing at exit"""
+        atexit.unregister(self.flush)
+        self.flush()
+
+    def _decide(self, record: logging.LogRecord) -> Tuple[bool, List[logging.LogRecord]]:
+        now = self.clock()
+        summaries = self._expire(now)
+        if record.levelno >= self.exempt_level:
+            return True, summaries
+        if self.key == 'site':
+            key = (record.name, record.levelno, record.pathname, record.lineno)
+        else:
+            key = (record.name, record.levelno, record.getMessage())
+        entry = self._seen.get(key)
+        if entry is not None:
+            # Expired entries were removed above, so this one is still within its window
+            entry[1] += 1
+            entry[2] = record
+            self.suppressed += 1
+            return False, summaries
+
+        bucket = self._buckets.get(record.name)
+        if bucket is None:
+            bucket = self._buckets[record.name] = [float(self.burst), now, 0, now]
+        else:
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] < 1:
+            if not bucket[2]:
+                bucket[3] = now
+                self._drop_expiries.append((now + self.window, record.name, now))
+            bucket[2] += 1
+            self.dropped += 1
+            return False, summaries
+        bucket[0] -= 1
+
+        if len(self._seen) >= self.max_keys:
+            summaries.extend(self._prune())
+        self._seen[key] = [now, 0, None]
+        self._repeat_expiries.append((now + self.window, key, now))
+        if bucket[2]:
+            record.msg = f"{record.getMessage()} [{bucket[2]} records from {record.name} dropped by rate limit]"
+            record.args = None
+            record.dropped = bucket[2]
+            bucket[2] = 0
+        return True, summaries
+
+    def _expire(self, now: float) -> List[logging.LogRecord]:
+        """End every window that has passed, returning summaries of what it held back"""
+        summaries = []
+        while self._repeat_expiries and self._repeat_expiries[0][0] <= now:
+            _, key, start = self._repeat_expiries.popleft()
+            entry = self._seen.get(key)
+            if entry is not None and entry[0] == start:
+                del self._seen[key]
+                if entry[1]:
+                    summaries.append(self._repeat_summary(entry))
+        while self._drop_expiries and self._drop_expiries[0][0] <= now:
+            _, name, start = self._drop_expiries.popleft()
+            bucket = self._buckets.get(name)
+            if bucket is not None and bucket[2] and bucket[3] == start:
+                summaries.append(self._drop_summary(name, bucket[2]))
+                bucket[2] = 0
+        return summaries
+
+    def _prune(self) -> List[logging.LogRecord]:
+        """Forget the oldest half of the keys, summarising their counts rather than losing them"""
+        oldest = sorted(self._seen, key=lambda key: self._seen[key][0])[:len(self._seen) // 2]
+        summaries = []
+        for key in oldest:
+            entry = self._seen.pop(key)
+            if entry[1]:
+                summaries.append(self._repeat_summary(entry))
+        return summaries
+
+    def _repeat_summary(self, entry: List) -> logging.LogRecord:
+        last = entry[2]
+        note = f"repeated {entry[1]} times" if self.key == 'message' else \
+            f"{entry[1]} more records from this call site suppressed"
+        summary = logging.LogRecord(
+            last.name, last.levelno, last.pathname, last.lineno,
+            f"{last.getMessage()} [{note}]", None, None, last.funcName
+        )
+        summary.repeats = entry[1]
+        return summary
+
+    @staticmethod
+    def _drop_summary(name: str, dropped: int) -> logging.LogRecord:
+        summary = logging.LogRecord(
+            name, logging.WARNING, '', 0, f"{dropped} records from {name} dropped by rate limit", None, None
+        )
+        summary.dropped = dropped
+        return summary
+
+    @staticmethod
+    def _emit(summaries: List[logging.LogRecord]) -> None:
+        for summary in summaries:
+            # Summaries have already been decided on, so they pass every handler sharing this filter
+            summary._rate_limit_decision = True
+            logging.getLogger(summary.name).handle(summary)
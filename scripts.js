@@ -505,10 +505,138 @@ function navigateNextChapter() {
     }
 }
 
+// Site search over search-index.json, fetched the first time a search box is used
+const siteSearch = {
+    INDEX_URL: 'search-index.json',
+    MAX_RESULTS: 8,
+    MAX_PREFIX_TERMS: 20,
+    DEBOUNCE_MS: 100,
+    index: null,
+    loading: null,
+
+    load() {
+        if (!this.loading) {
+            this.loading = fetch(this.INDEX_URL)
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`Search index request failed: ${response.status}`);
+                    }
+                    return response.json();
+                })
+                .then(data => {
+                    this.index = { ...data, stop: new Set(data.stop), termList: Object.keys(data.terms) };
+                    return this.index;
+                })
+                .catch(error => {
+                    this.loading = null;
+                    throw error;
+                });
+        }
+        return this.loading;
+    },
+
+    // Mirrors stem() in documentation/generators/search_index.py, using the rules shipped in the index
+    stem(word) {
+        const { stem: rules, min, keep } = this.index;
+        for (const [suffix, replacement] of rules) {
+            if (word.endsWith(suffix) && word.length - suffix.length + replacement.length >= min) {
+                if (suffix === 's' && keep.some(ending => word.endsWith(ending))) {
+                    return word;
+                }
+                return word.slice(0, word.length - suffix.length) + replacement;
+            }
+        }
+        return word;
+    },
+
+    tokenize(text) {
+        const tokens = text.toLowerCase().replace(/’/g, "'").match(/[a-z0-9]+(?:'[a-z]+)?/g) || [];
+        return tokens.filter(token => token.length > 1 && !this.index.stop.has(token));
+    },
+
+    // Posting lists alternate document-number gaps and weights
+    addPostings(term, scores, matches, boost = 1) {
+        const postings = this.index.terms[term];
+        if (!postings) {
+            return false;
+        }
+        let doc = 0;
+        for (let i = 0; i < postings.length; i += 2) {
+            doc += postings[i];
+            scores.set(doc, (scores.get(doc) || 0) + postings[i + 1] * boost);
+            matches.set(doc, (matches.get(doc) || 0) + 1);
+        }
+        return true;
+    },
+
+    search(query) {
+        const tokens = this.tokenize(query);
+        const scores = new Map();
+        const matches = new Map();
+        tokens.forEach((token, position) => {
+            const term = this.stem(token);
+            const found = this.addPostings(term, scores, matches);
+            // Treat the word being typed as a prefix
+            if (position === tokens.length - 1) {
+                this.index.termList
+                    .filter(candidate => candidate !== term && candidate.startsWith(token))
+                    .slice(0, this.MAX_PREFIX_TERMS)
+                    .forEach(candidate => this.addPostings(candidate, scores, found ? new Map() : matches, 0.5));
+            }
+        });
+        return [...scores.entries()]
+            // Documents reached only through prefix candidates have no match count
+            .sort((a, b) => ((matches.get(b[0]) || 0) - (matches.get(a[0]) || 0)) || (b[1] - a[1]))
+            .slice(0, this.MAX_RESULTS)
+            .map(([doc, score]) => ({ url: this.index.docs[doc][0], title: this.index.docs[doc][1], score }));
+    },
+
+    renderResults(container, results, query) {
+        container.replaceChildren();
+        if (!query.trim()) {
+            return;
+        }
+        if (results.length === 0) {
+            container.appendChild(createElement('p', { class: 'text-muted mb-0' }, 'No results found'));
+            return;
+        }
+        const list = createElement('ul', { class: 'list-group' });
+        results.forEach(result => {
+            const item = createElement('li', { class: 'list-group-item' });
+            item.appendChild(createElement('a', { href: result.url }, result.title));
+            list.appendChild(item);
+        });
+        container.appendChild(list);
+    },
+
+    attach(input) {
+        const container = document.getElementById(input.dataset.siteSearch);
+        if (!container) {
+            console.error('Search results container not found');
+            return;
+        }
+        let timer = null;
+        input.addEventListener('focus', () => this.load().catch(error => console.error(error)), { once: true });
+        input.addEventListener('input', () => {
+            clearTimeout(timer);
+            timer = setTimeout(() => {
+                this.load()
+                    .then(() => this.renderResults(container, this.search(input.value), input.value))
+                    .catch(error => {
+                        console.error('Error loading search index:', error);
+                        utils.showAlert('warning', 'Search is unavailable right now.');
+                    });
+            }, this.DEBOUNCE_MS);
+        });
+    }
+};
+
 // Initialize everything on DOM Content Loaded
 document.addEventListener('DOMContentLoaded', function () {
     console.log("DOM Content Loaded");
 
+    document.querySelectorAll('[data-site-search]').forEach(input => siteSearch.attach(input));
+
     try {
         initializeStoryNavigation();
     } catch (e) {
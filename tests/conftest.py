@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The tooling is run from the repository root as documentation.* namespace packages
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
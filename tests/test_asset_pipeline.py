@@ -0,0 +1,13 @@
+from documentation.generators.asset_pipeline import minify_js
+
+def test_division_after_postfix_increment_is_not_a_regex():
+    source = 'var x = i++ / 2, s = "a/", t = "http://example.com";\n// trailing comment\n'
+    assert minify_js(source) == 'var x = i++ / 2, s = "a/", t = "http://example.com";\n'
+
+def test_regex_literals_are_still_detected():
+    source = ('var y = n-- /2; // halve\n'
+              'var r = a + /x\\/y/.source; /* note */\n'
+              'if (ok) return /^\\/\\//.test(url);\n')
+    assert minify_js(source) == ('var y = n-- /2;\n'
+                                 'var r = a + /x\\/y/.source;\n'
+                                 'if (ok) return /^\\/\\//.test(url);\n')
@@ -0,0 +1,84 @@
+import sqlite3
+
+import pytest
+
+from database.connection_pool import ConnectionPool, PoolTimeoutError
+
+@pytest.fixture
+def database(tmp_path):
+    path = str(tmp_path / 'pool.db')
+    with sqlite3.connect(path) as connection:
+        connection.execute('CREATE TABLE items (name TEXT)')
+    return path
+
+def make_pool(database, **settings):
+    settings.setdefault('reap_interval', None)
+    return ConnectionPool(lambda: sqlite3.connect(database, check_same_thread=False), **settings)
+
+def count_items(database):
+    connection = sqlite3.connect(database)
+    try:
+        return connection.execute('SELECT COUNT(*) FROM items').fetchone()[0]
+    finally:
+        connection.close()
+
+def test_with_block_commits_on_clean_exit_and_rolls_back_on_error(database):
+    with make_pool(database, max_size=1) as pool:
+        with pool.connect() as connection:
+            connection.execute("INSERT INTO items VALUES ('kept')")
+        assert count_items(database) == 1
+
+        with pytest.raises(RuntimeError):
+            with pool.connect() as connection:
+                connection.execute("INSERT INTO items VALUES ('dropped')")
+                raise RuntimeError('boom')
+        assert count_items(database) == 1
+
+        connection = pool.connect()
+        connection.execute("INSERT INTO items VALUES ('uncommitted')")
+        connection.close()
+        assert count_items(database) == 1
+        assert pool.stats.in_use == 0 and pool.stats.idle == 1
+
+def test_acquire_times_out_when_pool_is_exhausted(database):
+    with make_pool(database, max_size=1) as pool:
+        held = pool.acquire()
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire(timeout=0.05)
+        assert pool.stats.timeouts == 1
+        pool.release(held)
+        pool.release(pool.acquire(timeout=0.05))
+
+def test_connection_failing_health_check_is_replaced(database):
+    with make_pool(database, min_size=1, max_size=1) as pool:
+        broken = pool._idle[-1][0]
+        broken.close()
+        connection = pool.acquire(timeout=0.5)
+        assert connection is not broken
+        connection.execute('SELECT 1')
+        pool.release(connection)
+        assert pool.stats.failed_checks == 1
+        assert (pool.stats.created, pool.stats.closed, pool.stats.size) == (2, 1, 1)
+
+def test_reap_closes_idle_connections_down_to_min_size(database):
+    with make_pool(database, min_size=1, max_size=4, max_idle=0) as pool:
+        connections = [pool.acquire() for _ in range(3)]
+        for connection in connections:
+            pool.release(connection)
+        assert pool.stats.idle == 3
+        assert pool.reap() == 2
+        assert (pool.stats.size, pool.stats.idle) == (1, 1)
+        assert pool.reap() == 0
+
+def test_stats_track_usage(database):
+    with make_pool(database, min_size=0, max_size=3) as pool:
+        first, second = pool.acquire(), pool.acquire()
+        assert (pool.stats.in_use, pool.stats.peak_in_use, pool.stats.created) == (2, 2, 2)
+        pool.release(first)
+        third = pool.acquire()
+        assert third is first
+        pool.release(second)
+        pool.release(third)
+        assert (pool.stats.in_use, pool.stats.peak_in_use, pool.stats.acquisitions) == (0, 2, 3)
+        assert (pool.stats.created, pool.stats.idle) == (2, 2)
+    assert (pool.stats.closed, pool.stats.size, pool.stats.idle) == (2, 0, 0)
@@ -0,0 +1,81 @@
+import logging
+
+import pytest
+
+from documentation.logging_config import RateLimitFilter
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+@pytest.fixture
+def setup(request):
+    clock = Clock()
+    log_filter = RateLimitFilter(window=10.0, rate=1.0, burst=3, clock=clock, **getattr(request, 'param', {}))
+    handler = ListHandler()
+    handler.addFilter(log_filter)
+    logger = logging.getLogger(f"tests.rate_limit.{request.node.name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    yield clock, log_filter, handler, logger
+    logger.removeHandler(handler)
+    log_filter.close()
+
+def messages(handler):
+    return [record.getMessage() for record in handler.records]
+
+def test_repeats_flushed_when_window_expires_on_another_key(setup):
+    clock, log_filter, handler, logger = setup
+    for i in range(5):
+        logger.info("hot %d", i)
+    clock.now = 11.0
+    logger.warning("elsewhere")
+    assert messages(handler) == ["hot 0", "hot 4 [4 more records from this call site suppressed]", "elsewhere"]
+    assert handler.records[1].repeats == 4
+    assert log_filter.suppressed == 4
+
+def test_repeats_flushed_on_close(setup):
+    clock, log_filter, handler, logger = setup
+    for _ in range(3):
+        logger.info("quiet after this")
+    log_filter.close()
+    assert messages(handler)[-1] == "quiet after this [2 more records from this call site suppressed]"
+    log_filter.close()
+    assert len(handler.records) == 2
+
+@pytest.mark.parametrize('setup', [{'key': 'message'}], indirect=True)
+def test_message_key_keeps_distinct_messages(setup):
+    clock, log_filter, handler, logger = setup
+    for name in ('a', 'b', 'a', 'a'):
+        logger.info(f"file {name}")
+    clock.now = 10.0
+    log_filter.flush()
+    assert messages(handler) == ["file a", "file b", "file a [repeated 2 times]"]
+
+@pytest.mark.parametrize('setup', [{'key': 'message'}], indirect=True)
+def test_drops_reported_inline_or_by_summary(setup):
+    clock, log_filter, handler, logger = setup
+    for i in range(6):
+        logger.info(f"distinct {i}")
+    assert messages(handler) == ["distinct 0", "distinct 1", "distinct 2"]
+    clock.now = 2.0
+    logger.info("after refill")
+    assert handler.records[-1].getMessage() == "after refill [3 records from %s dropped by rate limit]" % logger.name
+    logger.info("one more")
+    logger.info("and another")
+    clock.now = 20.0
+    logger.critical("exempt")
+    assert messages(handler)[-2:] == [f"1 records from {logger.name} dropped by rate limit", "exempt"]
+    assert handler.records[-2].dropped == 1
@@ -0,0 +1,66 @@
+import datetime
+import gzip
+import json
+import random
+import sqlite3
+
+import pytest
+
+from database.retention import RetentionJob, RetentionPolicy
+
+NOW = datetime.datetime(2026, 6, 1, 12, 0, 0)
+CUTOFF = NOW - datetime.timedelta(days=365)
+TOTAL, EXPIRED = 2500, 2174
+
+@pytest.fixture
+def database(tmp_path):
+    # Expired and current rows interleaved by key, plus one row exactly at the cutoff
+    ages = [CUTOFF - datetime.timedelta(minutes=n + 1) for n in range(EXPIRED)] + [CUTOFF] + \
+        [CUTOFF + datetime.timedelta(minutes=n + 1) for n in range(TOTAL - EXPIRED - 1)]
+    random.Random(7).shuffle(ages)
+    path = str(tmp_path / 'retention.db')
+    with sqlite3.connect(path) as connection:
+        connection.execute('CREATE TABLE audit_log (id INTEGER PRIMARY KEY, created_at TEXT, action TEXT)')
+        connection.executemany(
+            'INSERT INTO audit_log VALUES (?, ?, ?)',
+            [(key, created_at.isoformat(sep=' '), f'action-{key}') for key, created_at in enumerate(ages, 1)]
+        )
+    return path
+
+def make_job(database, **kwargs):
+    return RetentionJob(
+        lambda: sqlite3.connect(database), 'qmark', schema='', batch_size=300, pause=0,
+        policies=[RetentionPolicy('audit_log', 'created_at', max_age_days=365)], **kwargs
+    )
+
+def remaining(database):
+    connection = sqlite3.connect(database)
+    try:
+        return connection.execute('SELECT created_at FROM audit_log ORDER BY id').fetchall()
+    finally:
+        connection.close()
+
+def test_expired_rows_are_archived_and_deleted_in_batches(database, tmp_path):
+    [result] = make_job(database, archive_dir=tmp_path / 'archive').run(NOW)
+
+    assert (result.rows_matched, result.rows_archived, result.rows_deleted) == (EXPIRED, EXPIRED, EXPIRED)
+    assert result.batches == 8
+    rows = remaining(database)
+    assert len(rows) == TOTAL - EXPIRED
+    assert (CUTOFF.isoformat(sep=' '),) in rows
+    assert all(created_at >= CUTOFF.isoformat(sep=' ') for (created_at,) in rows)
+
+    # One gzip member per batch, read back as a single stream
+    with gzip.open(result.archive_file, 'rt', encoding='utf-8') as f:
+        archived = [json.loads(line) for line in f]
+    assert len(archived) == EXPIRED
+    assert [row['id'] for row in archived] == sorted(row['id'] for row in archived)
+    assert all(row['created_at'] < CUTOFF.isoformat(sep=' ') for row in archived)
+
+def test_dry_run_deletes_and_archives_nothing(database, tmp_path):
+    [result] = make_job(database, archive_dir=tmp_path / 'archive', dry_run=True).run(NOW)
+
+    assert result.rows_matched == EXPIRED
+    assert (result.rows_deleted, result.rows_archived, result.archive_file) == (0, 0, None)
+    assert len(remaining(database)) == TOTAL
+    assert not (tmp_path / 'archive').exists()
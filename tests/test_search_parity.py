@@ -0,0 +1,55 @@
+import json
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from documentation.generators.search_index import SearchIndexBuilder, stem, tokenize
+
+ROOT = Path(__file__).resolve().parents[1]
+WORDS = [
+    'relational', 'organization', 'hopefulness', 'decisiveness', 'famousness', 'armies', 'classes',
+    'agreements', 'darkness', 'knowingly', 'running', 'markedly', 'raided', 'quickly', "arthas's",
+    'orcs', 'boss', 'status', 'axis', 'is', 'as', 'gus', 'ties', 'ing', 'sing', 'bed', 'fly', 'us',
+]
+TEXT = "The Night Elves’ sentinels were guarding Ashenvale; Thrall's Horde marched 2 leagues, A to Z."
+
+node = shutil.which('node')
+pytestmark = pytest.mark.skipif(node is None, reason='node is not installed')
+
+def run_site_search(index: dict, expression: str):
+    """Evaluate an expression against the siteSearch object from scripts.js"""
+    source = (ROOT / 'scripts.js').read_text(encoding='utf-8')
+    match = re.search(r'^const siteSearch = \{.*?^\};$', source, re.MULTILINE | re.DOTALL)
+    assert match, 'siteSearch not found in scripts.js'
+    program = (
+        f"{match.group(0)}\n"
+        f"const data = {json.dumps(index)};\n"
+        "siteSearch.index = { ...data, stop: new Set(data.stop), termList: Object.keys(data.terms) };\n"
+        f"process.stdout.write(JSON.stringify({expression}));\n"
+    )
+    output = subprocess.run([node, '-e', program], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+def build_index(docs, terms):
+    """An index with the shipped stemmer settings and the given documents and postings"""
+    index = SearchIndexBuilder(ROOT)._assemble([])
+    index.update(docs=docs, terms=terms)
+    return index
+
+def test_stem_and_tokenize_match_python():
+    index = build_index([], {})
+    words = json.dumps(WORDS)
+    stems, tokens = run_site_search(
+        index, f"[{words}.map(w => siteSearch.stem(w)), siteSearch.tokenize({json.dumps(TEXT)}).map(t => siteSearch.stem(t))]"
+    )
+    assert stems == [stem(word) for word in WORDS]
+    assert tokens == tokenize(TEXT)
+
+def test_prefix_only_documents_rank_below_exact_matches():
+    # 'dragon' matches document 0 exactly; document 1 is reached only via the prefix 'dragonfly'
+    index = build_index([['a.html', 'Dragons'], ['b.html', 'Dragonflies']], {'dragon': [0, 5], 'dragonfly': [1, 100]})
+    results = run_site_search(index, "siteSearch.search('dragon')")
+    assert [result['url'] for result in results] == ['a.html', 'b.html']
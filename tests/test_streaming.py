@@ -0,0 +1,50 @@
+import time
+
+from documentation.generators.accessibility import AccessibilityEngine
+from documentation.generators.streaming import StreamingHtmlParser
+
+def parse(html: str, chunk_size: int = 4096) -> StreamingHtmlParser:
+    parser = StreamingHtmlParser(AccessibilityEngine.default().session())
+    for start in range(0, len(html), chunk_size):
+        parser.feed(html[start:start + chunk_size])
+    parser.close()
+    return parser
+
+class DepthTrackingParser(StreamingHtmlParser):
+    max_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        super().handle_starttag(tag, attrs)
+        self.max_depth = max(self.max_depth, len(self.stack))
+
+def test_unclosed_paragraphs_and_list_items_do_not_nest():
+    count = 20_000
+    html = '<html><body><nav><ul>' + '<li><a href="/x">Item' * count + '</ul></nav><main>' + \
+        '<p>Paragraph <a href="/y">link</a>' * count + '</main></body></html>'
+    parser = DepthTrackingParser(AccessibilityEngine.default().session())
+    started = time.perf_counter()
+    parser.feed(html)
+    parser.close()
+    assert time.perf_counter() - started < 5
+    assert parser.max_depth <= 6
+    assert len(parser.navigation) == count
+    assert not parser.stack and not sum(parser.open_elements.values())
+
+def test_implied_end_tags_respect_scope():
+    parser = DepthTrackingParser(AccessibilityEngine.default().session())
+    parser.feed('<p>Intro<ul><li>One<li>Two<ul><li>Nested</ul></ul>'
+                '<table><tr><td>A<td>B<tr><td>C</table>'
+                '<dl><dt>Term<dd>Definition<dt>Next</dl>'
+                '<select><option>One<option>Two</select>')
+    assert parser.max_depth <= 4
+    parser.close()
+    assert not parser.stack
+
+def test_ancestor_lookup_during_visit():
+    html = ('<html lang="en"><body><nav><a href="/home">Home</a></nav><a href="/other">Other</a>'
+            '<label>Name <input type="text"></label><input type="text" id="orphan"></body></html>')
+    parser = parse(html, chunk_size=7)
+    assert parser.navigation == [{'text': 'Home', 'href': '/home'}]
+    report = parser.accessibility.report()
+    assert report.checks['form-label'] == 2
+    assert len(report.findings['form-label']) == 1